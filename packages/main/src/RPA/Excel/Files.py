@@ -1,11 +1,25 @@
 # pylint: disable=too-many-lines
+import glob
 import logging
+import os
 import pathlib
 import re
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
 from io import BytesIO
-from typing import Any, List, Optional, Union
+from itertools import islice, repeat
+from typing import (
+    Any,
+    Container,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import openpyxl
 import xlrd
@@ -20,11 +34,16 @@ from openpyxl.utils.exceptions import InvalidFileException
 from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.styles.colors import Color as xlsColor
 from openpyxl.formula.translate import Translator
-from RPA.Tables import Table, Tables, return_table_as_raw_list
+from RPA.Excel.formulas import FormulaEvaluator
+from RPA.Tables import PoolType, Table, Tables, return_table_as_raw_list
 
 
 PathType = Union[str, pathlib.Path]
 
+# File signatures of Office Open XML (ZIP) and Excel Binary (OLE2) formats
+ZIP_SIGNATURE = b"PK\x03\x04"
+OLE2_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
 
 def get_column_index(column: str) -> int:
     """Get column index from name, e.g. A -> 1, D -> 4, AC -> 29.
@@ -40,6 +59,72 @@ def get_column_index(column: str) -> int:
     return col
 
 
+def sniff_format(path: PathType) -> Optional[str]:
+    """Detect the format of a workbook from the first bytes of the file.
+
+    Returns ``xlsx`` for Office Open XML files, ``xls`` for Excel Binary files,
+    ``text`` for text files such as CSV, or None if the format is not known.
+    """
+    with open(path, "rb") as fd:
+        head = fd.read(2048)
+
+    if head.startswith(ZIP_SIGNATURE):
+        return "xlsx"
+    if head.startswith(OLE2_SIGNATURE):
+        return "xls"
+
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as err:
+        # Allow a multi-byte character to be cut at the end
+        if err.start < len(head) - 4:
+            return None
+    if head and b"\x00" not in head:
+        return "text"
+
+    return None
+
+
+def _read_worksheet_rows(
+    path: str, name: Optional[str], header: bool, start: Optional[int], trim: bool
+) -> List[dict]:
+    """Read all rows of a worksheet from a file, in a worker of a pool."""
+    # pylint: disable=protected-access
+    library = Files()
+    try:
+        rows = library._iter_worksheet_rows(None, path, name, header, start, None, trim)
+        return list(rows)
+    except Exception as exc:  # pylint: disable=broad-except
+        # Exception is re-raised in the parent process without a traceback
+        raise ValueError(f"Failed to read worksheet from {path}: {exc}") from exc
+
+
+def normalize_header(value: Any) -> Any:
+    """Strip whitespace around a header value, and replace all
+    whitespace inside it with single spaces.
+    """
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return value
+
+
+def _header_key(value: Any) -> Any:
+    """Key for combining headers which differ only by whitespace or case."""
+    value = normalize_header(value)
+    return value.casefold() if isinstance(value, str) else value
+
+
+def _unique_header(name: Any, keys: Container[Any]) -> Any:
+    """Header name with a suffix, if needed for its key to not be in `keys`,
+    e.g. name -> name_2
+    """
+    result, count = name, 1
+    while _header_key(result) in keys:
+        count += 1
+        result = f"{name}_{count}"
+    return result
+
+
 def ensure_unique(values: Any) -> List[Any]:
     """Ensures that each string value in the list is unique.
     Adds a suffix to each value that has duplicates,
@@ -77,6 +162,33 @@ class Files:
     **Note:** To run macros or load password protected worksheets,
     please use the Excel application library.
 
+    **Multiple workbooks**
+
+    Workbooks opened or created with an ``alias`` stay open, and the
+    active workbook can be changed with ``Switch Workbook`` without parsing
+    the file again. Opening a workbook without an alias closes the active
+    workbook, unless it also has an alias.
+
+    At most ``max_workbooks`` workbooks with an alias are kept in memory.
+    When the limit is exceeded, the least recently used workbooks
+    opened with ``read_only=True`` are closed, and they are opened again
+    automatically when switched to. Other workbooks are never closed
+    automatically, as that would lose unsaved changes.
+
+    .. code-block:: robotframework
+
+        *** Settings ***
+        Library    RPA.Excel.Files    max_workbooks=4
+
+        *** Tasks ***
+        Compare prices
+            Open Workbook    prices.xlsx    alias=prices    read_only=True
+            Open Workbook    orders.xlsx    alias=orders
+            ${orders}=    Read Worksheet As Table    header=True
+            Switch Workbook    prices
+            ${prices}=    Read Worksheet As Table    header=True
+            [Teardown]    Close All Workbooks
+
     **Examples**
 
     **Robot Framework**
@@ -177,9 +289,16 @@ class Files:
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
     ROBOT_LIBRARY_DOC_FORMAT = "REST"
 
-    def __init__(self):
+    def __init__(self, max_workbooks: int = 8):
         self.logger = logging.getLogger(__name__)
         self.workbook = None
+        self.max_workbooks = int(max_workbooks)
+
+        # Workbooks with an alias, from least to most recently used
+        self._workbooks: Dict[str, Union["XlsWorkbook", "XlsxWorkbook"]] = OrderedDict()
+        # Options for opening each alias again, after it has been evicted
+        self._workbook_options: Dict[str, Optional[dict]] = {}
+        self._alias: Optional[str] = None
 
     def _require_open_xlsx_workbook(self, keyword_name: str):
         assert self.workbook, "No active workbook"
@@ -189,39 +308,101 @@ class Files:
             )
 
     def _load_workbook(
-        self, path: str, data_only: bool, read_only: bool
+        self,
+        path: str,
+        data_only: bool,
+        read_only: bool,
+        buffered: bool = False,
+        evaluate: bool = False,
     ) -> Union["XlsWorkbook", "XlsxWorkbook"]:
         # pylint: disable=broad-except
         path = pathlib.Path(path).resolve(strict=True)
 
-        try:
-            book = XlsxWorkbook(path)
-            book.open(data_only=data_only, read_only=read_only)
-            return book
-        except InvalidFileException as exc:
-            self.logger.debug(exc)  # Unsupported extension, silently try xlrd
-        except Exception as exc:
-            self.logger.info(
-                "Failed to open as Office Open XML (.xlsx) format: %s", exc
+        # Choose the library by the file contents, and try both only
+        # if the format is not recognized
+        fmt = sniff_format(path)
+        if fmt == "text":
+            raise ValueError(
+                f"Failed to open Excel file ({path}), it seems to be a text file, "
+                "e.g. CSV, which can be read with the RPA.Tables library"
             )
 
-        try:
-            book = XlsWorkbook(path)
-            book.open()
-            return book
-        except Exception as exc:
-            self.logger.info("Failed to open as Excel Binary Format (.xls): %s", exc)
+        if fmt in ("xlsx", None):
+            try:
+                book = XlsxWorkbook(path)
+                book.open(data_only=data_only, read_only=read_only, evaluate=evaluate)
+                return book
+            except InvalidFileException as exc:
+                self.logger.debug(exc)  # Unsupported extension, silently try xlrd
+            except Exception as exc:
+                self.logger.info(
+                    "Failed to open as Office Open XML (.xlsx) format: %s", exc
+                )
+
+        if fmt in ("xls", None):
+            try:
+                book = XlsWorkbook(path, buffered=buffered)
+                book.open(read_only=read_only)
+                return book
+            except Exception as exc:
+                self.logger.info(
+                    "Failed to open as Excel Binary Format (.xls): %s", exc
+                )
 
         raise ValueError(
             f"Failed to open Excel file ({path}), "
             "verify that the path and extension are correct"
         )
 
+    def _release_workbook(self) -> None:
+        """Deactivate the active workbook, and close it unless it has an alias."""
+        if self._alias is None:
+            self.close_workbook()
+        else:
+            self.workbook = None
+            self._alias = None
+
+    def _activate_workbook(
+        self,
+        workbook: Union["XlsWorkbook", "XlsxWorkbook"],
+        alias: Optional[str],
+        options: Optional[dict] = None,
+    ) -> None:
+        self.workbook = workbook
+        self._alias = alias
+
+        if alias is not None:
+            self._workbooks[alias] = workbook
+            self._workbooks.move_to_end(alias)
+            self._workbook_options[alias] = options
+            self._evict_workbooks()
+
+    def _evict_workbooks(self) -> None:
+        """Close least recently used read-only workbooks over the limit."""
+        evictable = [
+            alias
+            for alias in self._workbooks
+            if alias != self._alias and self._workbooks[alias].read_only
+        ]
+
+        excess = len(self._workbooks) - max(self.max_workbooks, 1)
+        for alias in evictable[:excess]:
+            self.logger.info("Closing least recently used workbook: %s", alias)
+            self._workbooks.pop(alias).close()
+
+    def _forget_workbook(self, alias: str) -> None:
+        workbook = self._workbooks.pop(alias, None)
+        self._workbook_options.pop(alias, None)
+        if workbook is not None and workbook is not self.workbook:
+            workbook.close()
+
     def create_workbook(
         self,
         path: Optional[str] = None,
         fmt: str = "xlsx",
         sheet_name: Optional[str] = None,
+        buffered: bool = False,
+        alias: Optional[str] = None,
     ) -> Union["XlsWorkbook", "XlsxWorkbook"]:
         """Create and open a new Excel workbook.
 
@@ -238,6 +419,11 @@ class Files:
         :param fmt: Format of workbook, i.e. xlsx or xls; Defaults to xlsx if not
             provided.
         :param sheet_name: Custom name for the initial sheet.
+        :param buffered: Collect cell changes in memory and write them into
+            the workbook only when needed, e.g. when saving it. Affects only
+            ``.xls`` files, see ``Open Workbook`` for details.
+        :param alias: Name for the workbook, which keeps it open when other
+            workbooks are opened, see ``Switch Workbook``.
         :return: Workbook object.
 
         Examples:
@@ -290,18 +476,20 @@ class Files:
             lib.create_workbook(path="./output/orders.xls", fmt="xls")
             lib.save_workbook()
         """
-        if self.workbook:
-            self.close_workbook()
+        self._release_workbook()
+        if alias is not None:
+            self._forget_workbook(alias)
 
         fmt = str(fmt).lower().strip()
         if fmt == "xlsx":
-            self.workbook = XlsxWorkbook(path)
+            workbook = XlsxWorkbook(path)
         elif fmt == "xls":
-            self.workbook = XlsWorkbook(path)
+            workbook = XlsWorkbook(path, buffered=buffered)
         else:
             raise ValueError(f"Unknown format: {fmt}")
 
-        self.workbook.create()
+        workbook.create()
+        self._activate_workbook(workbook, alias)
         if sheet_name is not None:
             self.rename_worksheet(self.get_active_worksheet(), sheet_name)
 
@@ -312,19 +500,48 @@ class Files:
         path: str,
         data_only: Optional[bool] = False,
         read_only: Optional[bool] = False,
+        buffered: Optional[bool] = False,
+        fast: Optional[bool] = False,
+        alias: Optional[str] = None,
+        evaluate: Optional[bool] = False,
     ) -> Union["XlsWorkbook", "XlsxWorkbook"]:
         """Open an existing Excel workbook.
 
         Opens the workbook in memory and sets it as the active workbook.
-        **This library can only have one workbook open at a time, and
-        any previously opened workbooks are closed first.**
+        **Any previously active workbook is closed first, unless it was
+        opened with an alias.** See ``Switch Workbook`` for working with
+        multiple workbooks.
 
-        The file can be in either ``.xlsx`` or ``.xls`` format.
+        The file can be in either ``.xlsx`` or ``.xls`` format. The format
+        is detected from the contents of the file, so a wrong extension
+        does not slow down opening it.
 
         :param path: path to Excel file
         :param data_only: controls whether cells with formulas have either
          the formula (default, False) or the value stored the last time Excel
          read the sheet (True). Affects only ``.xlsx`` files.
+        :param read_only: open the workbook only for reading, which is faster
+         and uses less memory, but the workbook can't be modified or saved.
+         With ``.xls`` files the cell formatting is not read.
+        :param fast: open the workbook for reading values as fast as possible,
+         same as setting both ``read_only`` and ``data_only``
+        :param buffered: collect changes to cell values and formats in memory,
+         and write them into the workbook only when it's saved or read in other
+         ways than ``Get Cell Value``. Affects only ``.xls`` files, which are
+         otherwise re-created after every change. Useful when setting
+         many cells, e.g. in a loop.
+        :param alias: name for the workbook, which keeps it open when other
+         workbooks are opened. An existing workbook with the same alias
+         is closed first.
+        :param evaluate: with ``data_only``, calculate the values of formula
+         cells which have no value stored in the file, e.g. workbooks saved by
+         this library instead of Excel. Supports arithmetic, comparison and text
+         operators, references to other worksheets, and the functions
+         ``SUM``, ``AVERAGE``, ``MIN``, ``MAX``, ``COUNT``, ``COUNTA``, ``IF``,
+         ``IFERROR``, ``AND``, ``OR``, ``NOT``, ``ABS``, ``ROUND``,
+         ``CONCATENATE``, ``VLOOKUP``, ``INDEX`` and ``MATCH``. Cells with other
+         formulas have no value. Affects only ``.xlsx`` files,
+         and not in ``read_only`` mode.
         :return: Workbook object
 
         Examples:
@@ -339,6 +556,19 @@ class Files:
             # Note: Can only be used with XLSX workbooks
             Open Workbook    path/to/file.xlsx    data_only=True
 
+            # Open legacy workbook for setting many cell values
+            Open Workbook    path/to/file.xls    buffered=True
+
+            # Open large workbook only for reading values
+            Open Workbook    path/to/file.xlsx    fast=True
+
+            # Read values of formulas which were not calculated by Excel
+            Open Workbook    path/to/file.xlsx    data_only=True    evaluate=True
+
+            # Open two workbooks which both stay open
+            Open Workbook    path/to/orders.xlsx    alias=orders
+            Open Workbook    path/to/prices.xlsx    alias=prices
+
         .. code-block:: python
 
             # Open workbook with only path provided
@@ -348,16 +578,103 @@ class Files:
             # as the value stored
             # Note: Can only be used with XLSX workbooks
             lib.open_workbook(path="path/to/file.xlsx", data_only=True)
+
+            # Open legacy workbook for setting many cell values
+            lib.open_workbook(path="path/to/file.xls", buffered=True)
+
+            # Open large workbook only for reading values
+            lib.open_workbook(path="path/to/file.xlsx", fast=True)
+
+            # Read values of formulas which were not calculated by Excel
+            lib.open_workbook(path="path/to/file.xlsx", data_only=True, evaluate=True)
+
+            # Open two workbooks which both stay open
+            lib.open_workbook(path="path/to/orders.xlsx", alias="orders")
+            lib.open_workbook(path="path/to/prices.xlsx", alias="prices")
         """
-        if self.workbook:
-            self.close_workbook()
+        self._release_workbook()
+        if alias is not None:
+            self._forget_workbook(alias)
+
+        if fast:
+            data_only = read_only = True
+
+        options = {
+            "path": path,
+            "data_only": data_only,
+            "read_only": read_only,
+            "buffered": buffered,
+            "evaluate": evaluate,
+        }
+        workbook = self._load_workbook(**options)
+        self._activate_workbook(workbook, alias, options)
 
-        self.workbook = self._load_workbook(path, data_only, read_only)
         self.logger.info("Opened workbook: %s", self.workbook)
         return self.workbook
 
-    def close_workbook(self) -> None:
-        """Close the active workbook.
+    def switch_workbook(self, alias: str) -> Union["XlsWorkbook", "XlsxWorkbook"]:
+        """Set the workbook with the given alias as the active workbook.
+
+        The previously active workbook stays open if it has an alias,
+        otherwise it's closed. A read-only workbook which has been closed
+        automatically, because of the ``max_workbooks`` limit,
+        is opened again.
+
+        :param alias: alias given in ``Open Workbook`` or ``Create Workbook``
+        :return: Workbook object
+
+        Examples:
+
+        .. code-block:: robotframework
+
+            Open Workbook    path/to/orders.xlsx    alias=orders
+            Open Workbook    path/to/prices.xlsx    alias=prices
+            Switch Workbook    orders
+
+        .. code-block:: python
+
+            lib.open_workbook("path/to/orders.xlsx", alias="orders")
+            lib.open_workbook("path/to/prices.xlsx", alias="prices")
+            lib.switch_workbook("orders")
+        """
+        if alias not in self._workbook_options:
+            options = ", ".join(self._workbook_options)
+            raise ValueError(f"Unknown workbook alias: {alias}, aliases: {options}")
+
+        if alias == self._alias:
+            return self.workbook
+
+        self._release_workbook()
+
+        workbook = self._workbooks.get(alias)
+        if workbook is None:
+            options = self._workbook_options[alias]
+            workbook = self._load_workbook(**options)
+            self.logger.info("Opened workbook again: %s", workbook)
+
+        self._activate_workbook(workbook, alias, self._workbook_options[alias])
+        return self.workbook
+
+    def list_workbooks(self) -> List[str]:
+        """List aliases of all workbooks which have an alias,
+        from least to most recently used.
+
+        Examples:
+
+        .. code-block:: robotframework
+
+            ${aliases}=    List Workbooks
+
+        .. code-block:: python
+
+            aliases = lib.list_workbooks()
+        """
+        return list(self._workbook_options)
+
+    def close_workbook(self, alias: Optional[str] = None) -> None:
+        """Close the active workbook, or the workbook with the given alias.
+
+        :param alias: alias of the workbook to close, defaults to the active one
 
         Examples:
 
@@ -366,17 +683,50 @@ class Files:
             # Close active workbook
             Close Workbook
 
+            # Close workbook opened with an alias
+            Close Workbook    alias=prices
+
         .. code-block:: python
 
             # Close active workbook
             lib.close_workbook()
+
+            # Close workbook opened with an alias
+            lib.close_workbook(alias="prices")
         """
+        if alias is not None and alias != self._alias:
+            if alias not in self._workbook_options:
+                raise ValueError(f"Unknown workbook alias: {alias}")
+            self.logger.info("Closing workbook: %s", alias)
+            self._forget_workbook(alias)
+            return
+
+        if self._alias is not None:
+            self._forget_workbook(self._alias)
+            self._alias = None
 
         if self.workbook:
             self.logger.info("Closing workbook: %s", self.workbook)
             self.workbook.close()
             self.workbook = None
 
+    def close_all_workbooks(self) -> None:
+        """Close the active workbook and all workbooks with an alias.
+
+        Examples:
+
+        .. code-block:: robotframework
+
+            Close All Workbooks
+
+        .. code-block:: python
+
+            lib.close_all_workbooks()
+        """
+        self.close_workbook()
+        for alias in list(self._workbook_options):
+            self.close_workbook(alias)
+
     def save_workbook(
         self, path: Optional[str] = None
     ) -> Union["XlsWorkbook", "XlsxWorkbook"]:
@@ -712,6 +1062,257 @@ class Files:
         sheet = self.read_worksheet(name, header, start)
         return tables.create_table(sheet, trim)
 
+    def iterate_worksheet_rows(
+        self,
+        name: Optional[str] = None,
+        header: bool = False,
+        start: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        trim: bool = True,
+        path: Optional[str] = None,
+    ) -> Generator[Union[dict, Table], None, None]:
+        """Read the rows of a worksheet one at a time, or in chunks of
+        Tables, without reading the whole worksheet into memory.
+
+        :param name:       Name of worksheet to read (optional).
+                           Defaults to the active worksheet.
+        :param header:     If `True`, use the first row of the worksheet
+                           as headers for the rest of the rows. Default is `False`.
+        :param start:      Row index to start reading data from (1-indexed).
+                           Default value is row 1.
+        :param chunk_size: Amount of rows in each Table, or if not given,
+                           the rows are returned one at a time as dictionaries.
+        :param trim:       Skip all empty rows at the end of the worksheet.
+                           Default value is True.
+        :param path:       Path to an Excel file to read instead of the active
+                           workbook (optional). The file is opened in read-only
+                           mode when the first row is read, and closed when
+                           all the rows have been read. Formulas are read
+                           as their values saved in the file.
+        :return:           Iterator of dictionaries or Table objects
+
+        Rows are read lazily, so only the rows currently processed are kept
+        in memory. The workbook itself is also not loaded into memory when
+        reading an ``.xlsx`` file from ``path``, or from a workbook opened with
+        ``read_only=True``, which makes it possible to process worksheets
+        of any size.
+
+        Examples:
+
+        .. code-block:: robotframework
+
+            ${chunks}=    Iterate worksheet rows    header=True    chunk_size=10000
+            ...    path=orders.xlsx
+            WHILE    True
+                ${orders}=    Evaluate    next($chunks, None)
+                IF    $orders is None    BREAK
+                Process orders    ${orders}
+            END
+
+        .. code-block:: python
+
+            for orders in lib.iterate_worksheet_rows(
+                header=True, chunk_size=10000, path="orders.xlsx"
+            ):
+                process_orders(orders)
+        """
+        if chunk_size is not None:
+            chunk_size = int(chunk_size)
+            if chunk_size < 1:
+                raise ValueError("Chunk size should be a positive number")
+
+        if path is None:
+            assert self.workbook, "No active workbook"
+
+        return self._iter_worksheet_rows(
+            self.workbook if path is None else None,
+            path,
+            name,
+            header,
+            start,
+            chunk_size,
+            trim,
+        )
+
+    def _iter_worksheet_rows(
+        self,
+        workbook: Optional[Union["XlsWorkbook", "XlsxWorkbook"]],
+        path: Optional[str],
+        name: Optional[str],
+        header: bool,
+        start: Optional[int],
+        chunk_size: Optional[int],
+        trim: bool,
+    ) -> Generator[Union[dict, Table], None, None]:
+        # Opened only here, so that a generator which is never started
+        # doesn't leave the file open.
+        if workbook is None:
+            workbook = self._load_workbook(path, data_only=True, read_only=True)
+
+        try:
+            rows = workbook.iter_worksheet(name, header, start)
+            if trim:
+                rows = self._trim_rows(rows)
+
+            if chunk_size is None:
+                yield from rows
+                return
+
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                yield Table(chunk)
+        finally:
+            if path is not None:
+                workbook.close()
+
+    @staticmethod
+    def _trim_rows(rows: Iterable[dict]) -> Generator[dict, None, None]:
+        """Skip empty rows at the end, while holding back only
+        consecutive empty rows.
+        """
+        empty = []
+        for row in rows:
+            if all(value is None for value in row.values()):
+                empty.append(row)
+            else:
+                yield from empty
+                empty = []
+                yield row
+
+    def read_worksheets_from_files(
+        self,
+        paths: Union[str, List[str]],
+        name: Optional[str] = None,
+        header: bool = True,
+        start: Optional[int] = None,
+        trim: bool = True,
+        source_column: Optional[str] = "source",
+        workers: Optional[int] = None,
+        pool: Union[str, PoolType] = PoolType.Process,
+    ) -> Table:
+        """Read a worksheet from each of many Excel files, and combine
+        the rows into one Table.
+
+        The files are read in parallel and in read-only mode,
+        and the active workbook is not changed.
+
+        :param paths:         Glob pattern for the files, e.g. ``reports/*.xlsx``,
+                              or a list of paths.
+        :param name:          Name of worksheet to read from every file (optional).
+                              Defaults to the active worksheet of each file.
+        :param header:        If `True`, use the first row of each worksheet
+                              as headers. Default is `True`.
+        :param start:         Row index to start reading data from (1-indexed).
+                              Default value is row 1.
+        :param trim:          Skip all empty rows at the end of each worksheet.
+                              Default value is True.
+        :param source_column: Name of the column for the path of the file
+                              each row was read from, or ``None`` to not add it.
+                              Gets a suffix if the files have such a header.
+        :param workers:       Amount of files read in parallel,
+                              defaults to the amount of processors.
+        :param pool:          Type of worker pool, ``process`` (default)
+                              or ``thread``.
+        :return:              Table of rows from all the files
+
+        Headers are normalized by removing extra whitespace, and headers
+        of different files which differ only by letter case are combined to
+        one column. Such headers within the same file are kept as separate
+        columns, and the later ones get a suffix, e.g. ``name_2``,
+        which doesn't clash with the other headers.
+        Columns missing from some files have empty values in their rows.
+
+        Examples:
+
+        .. code-block:: robotframework
+
+            ${orders}=    Read Worksheets From Files    reports/*.xlsx    name=Orders
+
+            @{paths}=    Create List    first.xlsx    second.xls
+            ${orders}=    Read Worksheets From Files    ${paths}
+
+        .. code-block:: python
+
+            orders = lib.read_worksheets_from_files("reports/*.xlsx", name="Orders")
+        """
+        if isinstance(paths, (str, pathlib.Path)):
+            pattern = os.path.expanduser(str(paths))
+            paths = sorted(glob.glob(pattern, recursive=True))
+            if not paths:
+                self.logger.warning("No files matched pattern: %s", pattern)
+        paths = [str(path) for path in paths]
+
+        workers = int(workers) if workers is not None else os.cpu_count() or 1
+        workers = min(workers, len(paths))
+        args = (repeat(name), repeat(header), repeat(start), repeat(trim))
+
+        if workers <= 1:
+            results = list(map(_read_worksheet_rows, paths, *args))
+        else:
+            pool = PoolType(pool.value if isinstance(pool, PoolType) else pool)
+            executor = (
+                ThreadPoolExecutor if pool is PoolType.Thread else ProcessPoolExecutor
+            )
+            with executor(max_workers=workers) as pool_:
+                results = list(pool_.map(_read_worksheet_rows, paths, *args))
+
+        return self._concat_worksheet_rows(paths, results, source_column)
+
+    @staticmethod
+    def _unique_headers(headers: Iterable[Any]) -> List[Tuple[Any, Any]]:
+        """Keys and names of the headers of one file, where headers which
+        would be combined to the same column get a suffix,
+        e.g. [Name, name] -> [Name, name_2]
+        """
+        result = []
+        used = set()
+        for header in headers:
+            name = _unique_header(normalize_header(header), used)
+            key = _header_key(name)
+            used.add(key)
+            result.append((key, name))
+        return result
+
+    def _concat_worksheet_rows(
+        self,
+        paths: List[str],
+        results: List[List[dict]],
+        source_column: Optional[str],
+    ) -> Table:
+        headers = [self._unique_headers(rows[0] if rows else ()) for rows in results]
+
+        # Columns by their case-insensitive key, named by their first spelling
+        columns = {}
+        for keys in headers:
+            for key, name in keys:
+                columns.setdefault(key, name)
+
+        if source_column is not None:
+            source_column = _unique_header(source_column, columns)
+            columns[_header_key(source_column)] = source_column
+
+        positions = {key: idx for idx, key in enumerate(columns)}
+        width = len(positions)
+
+        data = []
+        for path, rows, keys in zip(paths, results, headers):
+            if not rows:
+                continue
+
+            mapping = [positions[key] for key, _ in keys]
+
+            for row in rows:
+                values = [None] * width
+                for idx, value in zip(mapping, row.values()):
+                    values[idx] = value
+                if source_column is not None:
+                    values[-1] = path
+                data.append(values)
+
+        return Table(data, columns=list(columns.values()))
+
     def append_rows_to_worksheet(
         self,
         content: Any,
@@ -787,6 +1388,73 @@ class Files:
             name, content, header, start, formatting_as_empty
         )
 
+    def export_table_to_workbook(
+        self,
+        content: Any,
+        path: str,
+        name: str = "Sheet",
+        header: bool = True,
+    ) -> None:
+        """Write a table into a new Excel workbook, without opening it.
+
+        :param content: Table to write, or a dictionary of worksheet names
+                        to Tables for writing multiple worksheets
+        :param path:    Path of the new workbook, in ``.xlsx`` format
+        :param name:    Name of the worksheet, if only one table is given.
+                        Default is `Sheet`.
+        :param header:  Write the column names as the first row.
+                        Default is `True`.
+
+        The ``content`` argument can be of any tabular format, like in
+        ``Append Rows To Worksheet``. The workbook is written row by row,
+        without keeping it in memory, so this is much faster than appending
+        rows to an open workbook and saving it, especially for large tables.
+        An existing file at ``path`` is overwritten, and the active workbook
+        is not affected.
+
+        Examples:
+
+        .. code-block:: robotframework
+
+            Export table to workbook    ${orders}    orders.xlsx    name=Orders
+
+            # Write one worksheet per table
+            &{sheets}=    Create dictionary    Orders=${orders}    Returns=${returns}
+            Export table to workbook    ${sheets}    report.xlsx
+
+        .. code-block:: python
+
+            lib.export_table_to_workbook(orders, "orders.xlsx", name="Orders")
+
+            lib.export_table_to_workbook(
+                {"Orders": orders, "Returns": returns}, "report.xlsx"
+            )
+        """
+        if pathlib.Path(path).suffix.lower() == ".xls":
+            raise ValueError("Exporting is supported only for .xlsx files")
+
+        if isinstance(content, dict) and all(
+            isinstance(value, Table) for value in content.values()
+        ):
+            sheets = content
+        else:
+            sheets = {name: content}
+
+        if not sheets:
+            raise ValueError("No tables to export")
+
+        book = openpyxl.Workbook(write_only=True)
+        for sheet_name, table in sheets.items():
+            table = table if isinstance(table, Table) else Table(table)
+            sheet = book.create_sheet(title=str(sheet_name))
+            if header:
+                sheet.append(table.columns)
+            for values in table.iter_lists(with_index=False):
+                sheet.append(values)
+
+        book.save(path)
+        self.logger.info("Exported %d worksheet(s) to: %s", len(sheets), path)
+
     def remove_worksheet(self, name: str = None) -> None:
         """Remove a worksheet from the active workbook.
 
@@ -1070,8 +1738,10 @@ class Files:
         """
         self._require_open_xlsx_workbook("clear_cell_range")
         cr = CellRange(range_string=range_string)
+        sheet = self.workbook.book.active
         for row, acell in list(cr.cells):
-            self.workbook.book.active.cell(row, acell).value = None
+            sheet.cell(row, acell).value = None
+            self.workbook.invalidate(sheet.title, row, acell)
 
     def delete_rows(self, start: int, end: Optional[int] = None):
         """Delete row or rows beginning from start row number to
@@ -1099,6 +1769,7 @@ class Files:
         self._require_open_xlsx_workbook("delete_rows")
         amount = (end - start + 1) if end else 1
         self.workbook.book.active.delete_rows(start, amount)
+        self.workbook.invalidate_sheet(self.workbook.book.active.title)
 
     def delete_columns(
         self, start: Union[int, str], end: Optional[Union[int, str]] = None
@@ -1137,6 +1808,7 @@ class Files:
             )
             amount = end_column_index - start_column_index + 1
         self.workbook.book.active.delete_cols(start_column_index, amount)
+        self.workbook.invalidate_sheet(self.workbook.book.active.title)
 
     def insert_columns_before(self, column: Union[int, str], amount: int = 1):
         """Insert column or columns before a column number/name.
@@ -1166,6 +1838,7 @@ class Files:
             column_index_from_string(column) if isinstance(column, str) else column
         )
         self.workbook.book.active.insert_cols(column_index, amount)
+        self.workbook.invalidate_sheet(self.workbook.book.active.title)
 
     def insert_columns_after(self, column: Union[int, str], amount: int = 1):
         """Insert column or columns after a column number/name.
@@ -1195,6 +1868,7 @@ class Files:
             column_index_from_string(column) if isinstance(column, str) else column
         )
         self.workbook.book.active.insert_cols(column_index + amount - 1, amount)
+        self.workbook.invalidate_sheet(self.workbook.book.active.title)
 
     def insert_rows_before(self, row: int, amount: int = 1):
         """Insert row or rows before a row number.
@@ -1221,6 +1895,7 @@ class Files:
         self._require_open_xlsx_workbook("insert_rows_before")
 
         self.workbook.book.active.insert_rows(row, amount)
+        self.workbook.invalidate_sheet(self.workbook.book.active.title)
 
     def insert_rows_after(self, row: int, amount: int = 1):
         """Insert row or rows after a row number.
@@ -1247,6 +1922,7 @@ class Files:
         self._require_open_xlsx_workbook("insert_rows_after")
 
         self.workbook.book.active.insert_rows(row + amount - 1, amount)
+        self.workbook.invalidate_sheet(self.workbook.book.active.title)
 
     def copy_cell_values(self, source_range: str, target: str):
         """Copy cells from source to target.
@@ -1271,26 +1947,22 @@ class Files:
         self._require_open_xlsx_workbook("copy_cell_values")
 
         cr = CellRange(range_string=source_range)
-        cells = list(cr.cells)
         target_cell_unpacked = utils_cell.coordinate_from_string(target)
         target_column = column_index_from_string(target_cell_unpacked[0])
         target_row = target_cell_unpacked[1]
 
-        last_row = None
-        column_index = 0
-        for row, column in cells:
-            if not last_row:
-                last_row = row
-            if last_row != row:
-                target_row += 1
-                last_row = row
-                column_index = 0
-            target_cell = self.workbook.book.active.cell(
-                target_row, target_column + column_index
-            )
-            source_cell = self.workbook.book.active.cell(row, column)
-            target_cell.value = source_cell.value
-            column_index += 1
+        sheet = self.workbook.book.active
+        rows = sheet.iter_rows(
+            min_row=cr.min_row,
+            max_row=cr.max_row,
+            min_col=cr.min_col,
+            max_col=cr.max_col,
+            values_only=True,
+        )
+        for row_index, values in enumerate(list(rows), target_row):
+            for column_index, value in enumerate(values, target_column):
+                sheet.cell(row_index, column_index).value = value
+                self.workbook.invalidate(sheet.title, row_index, column_index)
 
     def set_styles(
         self,
@@ -1614,15 +2286,17 @@ class Files:
         start_col_str = f"{get_column_letter(start_col)}{start_row}"
         cells = list(cr.cells)
 
+        sheet = self.workbook.book.active
         for index, acell in enumerate(cells):
             row, column = acell
             col_str = f"{get_column_letter(column)}{row}"
             if (transpose and index == 0) or not transpose:
-                self.workbook.book.active[col_str].value = formula
+                sheet[col_str].value = formula
             elif transpose and index > 0:
-                self.workbook.book.active[col_str] = Translator(
+                sheet[col_str] = Translator(
                     formula, origin=start_col_str
                 ).translate_formula(col_str)
+            self.workbook.invalidate(sheet.title, row, column)
 
     def move_range(
         self, range_string: str, rows: int = 0, columns: int = 0, translate: bool = True
@@ -1661,6 +2335,7 @@ class Files:
         self.workbook.book.active.move_range(
             range_string, rows=rows, cols=columns, translate=translate
         )
+        self.workbook.invalidate_sheet(self.workbook.book.active.title)
 
     def set_cell_values(
         self, start_cell: str, values: Union[list, Table], table_heading: bool = False
@@ -1712,20 +2387,121 @@ class Files:
             data_values = values
         cr = CellRange(range_string=start_cell)
         start_col, start_row, _, _ = cr.bounds
+        sheet = self.workbook.book.active
         for row_index, row in enumerate(data_values):
             if isinstance(row, list):
-                for col_index, col in enumerate(row):
-                    column = start_col + col_index
-                    row = start_row + row_index
-                    self.workbook.book.active[
-                        f"{get_column_letter(column)}{row}"
-                    ].value = col
+                for col_index, value in enumerate(row):
+                    sheet.cell(
+                        start_row + row_index, start_col + col_index
+                    ).value = value
+                    self.workbook.invalidate(
+                        sheet.title, start_row + row_index, start_col + col_index
+                    )
             else:
-                column = start_col + row_index
-                row = start_row
-                self.workbook.book.active[
-                    f"{get_column_letter(column)}{row}"
-                ].value = row
+                sheet.cell(start_row, start_col + row_index).value = row
+                self.workbook.invalidate(sheet.title, start_row, start_col + row_index)
+
+    def get_range_values(
+        self,
+        range_string: str,
+        name: Optional[str] = None,
+        as_table: bool = False,
+        header: bool = False,
+    ) -> Union[List[List[Any]], Table]:
+        """Get the values of a rectangular range of cells at once.
+
+        :param range_string: single cell or range of cells, e.g. ``B2:D100``
+        :param name:         Name of worksheet (optional).
+                             Defaults to the active worksheet.
+        :param as_table:     Return the values as a Table instead of
+                             a list of rows. Default is `False`.
+        :param header:       Use the first row of the range as the column names
+                             of the Table. Otherwise the columns are named with
+                             the column letters. Default is `False`.
+        :return:             List of rows, each a list of values, or a Table
+
+        Works for both ``.xlsx`` and ``.xls`` files, and is much faster
+        than reading the cells one at a time with ``Get Cell Value``.
+        Empty cells, and cells outside of the used area of the worksheet,
+        have the value ``None``.
+
+        Examples:
+
+        .. code-block:: robotframework
+
+            ${rows}=    Get range values    A2:C10
+            ${table}=   Get range values    A1:C10    as_table=True    header=True
+
+        .. code-block:: python
+
+            rows = lib.get_range_values("A2:C10")
+            table = lib.get_range_values("A1:C10", as_table=True, header=True)
+        """
+        assert self.workbook, "No active workbook"
+
+        min_col, min_row, max_col, max_row = CellRange(range_string).bounds
+        rows = self.workbook.get_range_values(min_row, min_col, max_row, max_col, name)
+
+        if not as_table:
+            return rows
+
+        letters = [get_column_letter(col) for col in range(min_col, max_col + 1)]
+        if header and rows:
+            columns = [
+                str(value) if value not in (None, "") else letter
+                for value, letter in zip(rows.pop(0), letters)
+            ]
+            columns = ensure_unique(columns)
+        else:
+            columns = letters
+
+        return Table(rows, columns=columns)
+
+    def set_range_values(
+        self,
+        start_cell: str,
+        values: Union[List[List[Any]], Table],
+        name: Optional[str] = None,
+        header: bool = False,
+    ) -> None:
+        """Set the values of a rectangular range of cells at once.
+
+        :param start_cell: top-left cell of the range, e.g. ``B2``
+        :param values:     List of rows, each a list of values, or a Table
+        :param name:       Name of worksheet (optional).
+                           Defaults to the active worksheet.
+        :param header:     If values are given as a Table, write the column
+                           names as the first row. Default is `False`.
+
+        Works for both ``.xlsx`` and ``.xls`` files. For ``.xls`` files,
+        the whole range is written with one modification of the workbook,
+        instead of one modification per cell with ``Set Cell Value``.
+
+        Examples:
+
+        .. code-block:: robotframework
+
+            Set range values    B2    ${table}    header=True
+
+            @{rows}=    Evaluate    [[1, 2, 3], [4, 5, 6]]
+            Set range values    A1    ${rows}    name=Numbers
+
+        .. code-block:: python
+
+            lib.set_range_values("B2", table, header=True)
+            lib.set_range_values("A1", [[1, 2, 3], [4, 5, 6]], name="Numbers")
+        """
+        assert self.workbook, "No active workbook"
+
+        if isinstance(values, Table):
+            rows = list(values.iter_lists(with_index=False))
+            if header:
+                rows.insert(0, values.columns)
+        else:
+            rows = values
+
+        min_col, min_row, _, _ = CellRange(start_cell).bounds
+        self.workbook.set_range_values(min_row, min_col, rows, name)
 
 
 class BaseWorkbook:
@@ -1738,11 +2514,25 @@ class BaseWorkbook:
         self._book = None
         self._extension = None
         self._active = None
+        self._read_only = False
 
     @property
     def book(self):
         return self._book
 
+    @property
+    def read_only(self):
+        return self._read_only
+
+    def flush(self):
+        """Write any buffered changes into the workbook."""
+
+    def invalidate(self, name, row, column):
+        """Clear evaluated formula values which depend on the given cell."""
+
+    def invalidate_sheet(self, name):
+        """Clear evaluated formula values of a worksheet whose cells have moved."""
+
     def _validate_content(self, props_obj: Any):
         # Strips leading/trailing whitespace in Excel properties.
         public_props = [prop for prop in dir(props_obj) if not prop.startswith("_")]
@@ -1757,7 +2547,7 @@ class XlsxWorkbook(BaseWorkbook):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._read_only = False
+        self._evaluator = None
 
     @staticmethod
     def is_sheet_empty(sheet):
@@ -1796,10 +2586,6 @@ class XlsxWorkbook(BaseWorkbook):
     def extension(self):
         return self._extension
 
-    @property
-    def read_only(self):
-        return self._read_only
-
     def _get_sheetname(self, name=None):
         if not self.sheetnames:
             raise ValueError("No worksheets in file")
@@ -1830,7 +2616,14 @@ class XlsxWorkbook(BaseWorkbook):
         self._book = openpyxl.Workbook()
         self._extension = None
 
-    def open(self, path=None, read_only=False, write_only=False, data_only=False):
+    def open(
+        self,
+        path=None,
+        read_only=False,
+        write_only=False,
+        data_only=False,
+        evaluate=False,
+    ):
         self._read_only = read_only
         path = path or self.path
         if not path:
@@ -1857,9 +2650,15 @@ class XlsxWorkbook(BaseWorkbook):
         self._book = openpyxl.load_workbook(**options)
         self._extension = extension
 
+        if evaluate and data_only and not read_only:
+            self._evaluator = FormulaEvaluator(self._book, path)
+        elif evaluate:
+            self.logger.info("Evaluating formulas requires data_only mode")
+
     def close(self):
         self._book.close()
         self._book = None
+        self._evaluator = None
         self._extension = None
         self._active = None
 
@@ -1878,33 +2677,59 @@ class XlsxWorkbook(BaseWorkbook):
         self.active = name
 
     def read_worksheet(self, name=None, header=False, start=None) -> List[dict]:
+        name = self._get_sheetname(name)
+        data = list(self.iter_worksheet(name, header, start))
+
+        self.active = name
+        return data
+
+    def iter_worksheet(
+        self, name=None, header=False, start=None
+    ) -> Generator[dict, None, None]:
         name = self._get_sheetname(name)
         sheet = self._book[name]
         start = self._to_index(start)
 
-        if start > sheet.max_row or self.is_sheet_empty(sheet):
-            return []
-
-        if header:
-            columns = [cell.value for cell in sheet[start]]
-            start += 1
-        else:
-            columns = [get_column_letter(i + 1) for i in range(sheet.max_column)]
+        # Dimensions of read-only worksheets are not always stored in the file,
+        # in which case they are None, and calculating them requires reading
+        # the whole worksheet. That's needed only for the amount of columns,
+        # when there is no header to define them.
+        max_row, max_column = sheet.max_row, sheet.max_column
+        if max_column is None and not header:
+            max_column = max(
+                (len(values) for values in sheet.iter_rows(values_only=True)),
+                default=0,
+            )
 
-        columns = [str(value) if value is not None else value for value in columns]
-        columns = ensure_unique(columns)
+        if self.is_sheet_empty(sheet) or (max_row is not None and start > max_row):
+            return
 
-        data = []
-        for cells in sheet.iter_rows(min_row=start):
-            row = {}
-            for c, acell in enumerate(cells):
-                column = columns[c]
-                if column is not None:
-                    row[column] = acell.value
-            data.append(row)
+        rows = sheet.iter_rows(min_row=start, values_only=True)
+        if self._evaluator is not None:
+            rows = (
+                self._evaluator.resolve_row(name, index, values)
+                for index, values in enumerate(rows, start)
+            )
 
-        self.active = name
-        return data
+        if header:
+            columns = next(rows, None)
+            if columns is None:
+                return
+            columns = [str(value) if value is not None else value for value in columns]
+            columns = ensure_unique(columns)
+        else:
+            columns = [get_column_letter(i + 1) for i in range(max_column)]
+
+        # Rows of unsized read-only worksheets end at their last value
+        width = len(columns)
+        for values in rows:
+            if len(values) < width:
+                values = tuple(values) + (None,) * (width - len(values))
+            yield {
+                column: value
+                for column, value in zip(columns, values)
+                if column is not None
+            }
 
     def append_worksheet(
         self,
@@ -1936,6 +2761,10 @@ class XlsxWorkbook(BaseWorkbook):
         else:
             self._default_append_rows(content, columns, sheet)
 
+        # Appended rows can be in ranges of whole columns
+        if self._evaluator is not None:
+            self._evaluator.clear()
+
         self.active = sheet_name
 
     def _append_on_first_empty_based_on_values(self, content, columns, sheet):
@@ -1946,8 +2775,9 @@ class XlsxWorkbook(BaseWorkbook):
             else:
                 break
         first_empty_row: int = first_empty_row or sheet.max_row + 1
+        positions = self._column_positions(columns)
         for row_idx, row in enumerate(content):
-            values = self._row_to_values(row, columns)
+            values = self._row_to_values(row, positions, len(columns))
             for cell_idx, acell in enumerate(sheet[first_empty_row + row_idx]):
                 try:
                     acell.value = values[cell_idx]
@@ -1955,18 +2785,32 @@ class XlsxWorkbook(BaseWorkbook):
                     pass
 
     def _default_append_rows(self, content, columns, sheet):
+        if list(columns) == content.columns:
+            # Values are already in the same order as the columns
+            for values in content.iter_lists(with_index=False):
+                sheet.append(values)
+            return
+
+        positions = self._column_positions(columns)
         for row in content:
-            values = self._row_to_values(row, columns)
+            values = self._row_to_values(row, positions, len(columns))
             sheet.append(values)
 
-    def _row_to_values(self, row, columns):
-        values = [""] * len(columns)
+    @staticmethod
+    def _column_positions(columns):
+        # Map column names to their first position, instead of searching
+        # the columns for every value
+        positions = {}
+        for index, column in enumerate(columns):
+            positions.setdefault(column, index)
+        return positions
+
+    def _row_to_values(self, row, positions, width):
+        values = [""] * width
         for column, value in row.items():
-            try:
-                index = columns.index(column)
+            index = positions.get(column)
+            if index is not None:
                 values[index] = value
-            except ValueError:
-                pass
         return values
 
     def remove_worksheet(self, name=None):
@@ -1981,6 +2825,7 @@ class XlsxWorkbook(BaseWorkbook):
 
         sheet = self._book[name]
         self._book.remove(sheet)
+        self.invalidate_sheet(name)
 
     def rename_worksheet(self, title, name=None):
         title = str(title)
@@ -1989,6 +2834,8 @@ class XlsxWorkbook(BaseWorkbook):
 
         sheet.title = title
         self.active = title
+        if self._evaluator is not None:
+            self._evaluator.rename_sheet(name, title)
 
     def find_empty_row(self, name=None):
         name = self._get_sheetname(name)
@@ -2004,16 +2851,28 @@ class XlsxWorkbook(BaseWorkbook):
     def get_cell_value(self, row, column, name=None):
         name = self._get_sheetname(name)
         sheet = self._book[name]
-        cell = self._get_cellname(row, column)
+        cell = sheet[self._get_cellname(row, column)]
+
+        if self._evaluator is not None:
+            return self._evaluator.get_value(name, cell.row, cell.column)
 
-        return sheet[cell].value
+        return cell.value
 
     def set_cell_value(self, row, column, value, name=None):
         name = self._get_sheetname(name)
         sheet = self._book[name]
-        cell = self._get_cellname(row, column)
+        cell = sheet[self._get_cellname(row, column)]
+
+        cell.value = value
+        self.invalidate(name, cell.row, cell.column)
 
-        sheet[cell].value = value
+    def invalidate(self, name, row, column):
+        if self._evaluator is not None:
+            self._evaluator.invalidate(name, row, column)
+
+    def invalidate_sheet(self, name):
+        if self._evaluator is not None:
+            self._evaluator.invalidate_sheet(name)
 
     def set_cell_format(self, row, column, fmt, name=None):
         name = self._get_sheetname(name)
@@ -2036,13 +2895,61 @@ class XlsxWorkbook(BaseWorkbook):
         img.anchor = cell
         sheet.add_image(img)
 
+    def get_range_values(self, min_row, min_col, max_row, max_col, name=None):
+        name = self._get_sheetname(name)
+        sheet = self._book[name]
+        width = max_col - min_col + 1
+        height = max_row - min_row + 1
+
+        # Iterating cells outside of the used area would create them, which
+        # moves the end of the worksheet, unless it's read-only
+        if not self.read_only:
+            max_row = min(max_row, sheet.max_row)
+            max_col = min(max_col, sheet.max_column)
+
+        rows = []
+        if min_row <= max_row and min_col <= max_col:
+            rows = sheet.iter_rows(
+                min_row=min_row,
+                max_row=max_row,
+                min_col=min_col,
+                max_col=max_col,
+                values_only=True,
+            )
+        if self._evaluator is not None:
+            rows = (
+                self._evaluator.resolve_row(name, index, values, min_col)
+                for index, values in enumerate(rows, min_row)
+            )
+
+        values = [list(row) + [None] * (width - len(row)) for row in rows]
+        values.extend([None] * width for _ in range(height - len(values)))
+        return values
+
+    def set_range_values(self, row, column, rows, name=None):
+        name = self._get_sheetname(name)
+        sheet = self._book[name]
+
+        for row_index, values in enumerate(rows, int(row)):
+            for col_index, value in enumerate(values, int(column)):
+                sheet.cell(row_index, col_index).value = value
+                self.invalidate(name, row_index, col_index)
+
 
 class XlsWorkbook(BaseWorkbook):
-    """Container for manipulating legacy Excel files (.xls)"""
+    """Container for manipulating legacy Excel files (.xls)
 
-    def __init__(self, *args, **kwargs):
+    Every modification re-creates the workbook, unless ``buffered`` is set,
+    in which case cell values and formats are collected in memory and applied
+    all at once when the workbook is flushed, e.g. before saving it.
+    """
+
+    def __init__(self, *args, buffered: bool = False, **kwargs):
         super().__init__(*args, **kwargs)
+        self.buffered = buffered
         self._images = []
+        # Map of (sheet name, row, column) to (value, style) not yet written
+        self._pending = {}
 
     @staticmethod
     def is_sheet_empty(sheet):
@@ -2132,12 +3039,13 @@ class XlsWorkbook(BaseWorkbook):
         except TypeError:
             extension = None
 
-        options = {"on_demand": True, "formatting_info": True}
+        # Reading formatting is slow, and it's needed only for modifying
+        # the workbook without losing the existing formatting, which is
+        # why read-only workbooks can not be modified or saved
+        options = {"on_demand": True, "formatting_info": not read_only}
 
-        if read_only or write_only or data_only:
-            self.logger.info(
-                "Modes read_only/write_only/data_only not supported with .xls"
-            )
+        if write_only or data_only:
+            self.logger.info("Modes write_only/data_only not supported with .xls")
 
         if hasattr(path, "read"):
             options["file_contents"] = path.read()
@@ -2146,7 +3054,9 @@ class XlsWorkbook(BaseWorkbook):
 
         self._book = xlrd.open_workbook(**options)
         self._extension = extension
+        self._read_only = read_only
         self._images = []
+        self._pending = {}
 
     def close(self):
         self._book.release_resources()
@@ -2154,9 +3064,15 @@ class XlsWorkbook(BaseWorkbook):
         self._extension = None
         self._active = None
         self._images = []
+        self._pending = {}
+
+    def _require_writable(self):
+        if self.read_only:
+            raise ValueError("Workbook is opened in read-only mode")
 
     @contextmanager
     def _book_write(self):
+        self._require_writable()
         book = xlutils_copy(self._book)
         yield book
 
@@ -2164,11 +3080,27 @@ class XlsWorkbook(BaseWorkbook):
         try:
             book.save(fd)
             fd.seek(0)
+            images = self._images
             self.close()
             self.open(fd)
+            self._images = images
         finally:
             fd.close()
 
+    def flush(self):
+        """Write all buffered cell values and formats into the workbook."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        with self._book_write() as book:
+            for (name, row, column), (value, style) in pending.items():
+                sheet = book.get_sheet(name)
+                if style is None:
+                    sheet.write(row, column, value)
+                else:
+                    sheet.write(row, column, value, style)
+
     def validate_content(self):
         self._validate_content(self._book)
 
@@ -2177,23 +3109,36 @@ class XlsWorkbook(BaseWorkbook):
         if not path:
             raise ValueError("No path defined for workbook")
 
+        self._require_writable()
+        self.flush()
         book = xlutils_copy(self._book)
         self._insert_images(book)
         book.save(path)
 
     def create_worksheet(self, name):
+        self.flush()
         with self._book_write() as book:
             book.add_sheet(name)
 
         self.active = name
 
     def read_worksheet(self, name=None, header=False, start=None) -> List[dict]:
+        name = self._get_sheetname(name)
+        data = list(self.iter_worksheet(name, header, start))
+
+        self.active = name
+        return data
+
+    def iter_worksheet(
+        self, name=None, header=False, start=None
+    ) -> Generator[dict, None, None]:
+        self.flush()
         name = self._get_sheetname(name)
         sheet = self._book.sheet_by_name(name)
         start = self._to_index(start)
 
         if start >= sheet.nrows:
-            return []
+            return
 
         if header:
             columns = [self._parse_type(cell) for cell in sheet.row(start)]
@@ -2205,7 +3150,6 @@ class XlsWorkbook(BaseWorkbook):
         columns = [str(value) if value is not None else value for value in columns]
         columns = ensure_unique(columns)
 
-        data = []
         for r in range(start, sheet.nrows):
             row = {}
             for c in range(sheet.ncols):
@@ -2213,10 +3157,7 @@ class XlsWorkbook(BaseWorkbook):
                 if column is not None:
                     cell = sheet.cell(r, c)
                     row[column] = self._parse_type(cell)
-            data.append(row)
-
-        self.active = name
-        return data
+            yield row
 
     def _parse_type(self, cell):
         value = cell.value
@@ -2244,6 +3185,7 @@ class XlsWorkbook(BaseWorkbook):
         if not content:
             return
 
+        self.flush()
         name = self._get_sheetname(name)
         sheet_read = self._book.sheet_by_name(name)
         start = self._to_index(start)
@@ -2294,6 +3236,7 @@ class XlsWorkbook(BaseWorkbook):
         if name == self.active:
             self.active = others[0]
 
+        self.flush()
         with self._book_write() as book:
             # This is pretty ugly, but there seems to be no other way to
             # remove sheets from the xlwt.Workbook instance
@@ -2311,6 +3254,7 @@ class XlsWorkbook(BaseWorkbook):
         title = str(title)
         name = self._get_sheetname(name)
 
+        self.flush()
         with self._book_write() as book:
             sheet = book.get_sheet(name)
             sheet.name = title
@@ -2318,6 +3262,7 @@ class XlsWorkbook(BaseWorkbook):
         self.active = title
 
     def find_empty_row(self, name=None):
+        self.flush()
         name = self._get_sheetname(name)
         sheet = self._book.sheet_by_name(name)
 
@@ -2331,37 +3276,96 @@ class XlsWorkbook(BaseWorkbook):
 
     def get_cell_value(self, row, column, name=None):
         name = self._get_sheetname(name)
-        sheet = self._book.sheet_by_name(name)
         row, column = self._get_cell(row, column)
 
+        pending = self._pending.get((name, row, column))
+        if pending is not None:
+            return pending[0]
+
+        sheet = self._book.sheet_by_name(name)
         return sheet.cell_value(row, column)
 
     def set_cell_value(self, row, column, value, name=None):
+        self._require_writable()
         name = self._get_sheetname(name)
         row, column = self._get_cell(row, column)
 
+        if self.buffered:
+            self._pending[(name, row, column)] = (value, None)
+            return
+
         with self._book_write() as book:
             sheet = book.get_sheet(name)
             sheet.write(row, column, value)
 
     def set_cell_format(self, row, column, fmt, name=None):
+        self._require_writable()
         name = self._get_sheetname(name)
-        sheet = self._book.sheet_by_name(name)
         row, column = self._get_cell(row, column)
 
-        value = sheet.cell_value(row, column)
+        value = self.get_cell_value(row + 1, column + 1, name)
         style = xlwt.XFStyle()
         style.num_format_str = str(fmt)
 
+        if self.buffered:
+            self._pending[(name, row, column)] = (value, style)
+            return
+
         with self._book_write() as book:
             sheet = book.get_sheet(name)
             sheet.write(row, column, value, style)
 
     def insert_image(self, row, column, image, name=None):
+        self._require_writable()
         name = self._get_sheetname(name)
         row, column = self._get_cell(row, column)
         self._images.append((name, row, column, image))
 
+    def get_range_values(self, min_row, min_col, max_row, max_col, name=None):
+        self.flush()
+        name = self._get_sheetname(name)
+        sheet = self._book.sheet_by_name(name)
+
+        # Empty cells, also outside of the sheet, are None as with .xlsx files
+        empty = (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK)
+        width = int(max_col) - int(min_col) + 1
+
+        rows = []
+        for row in range(int(min_row) - 1, int(max_row)):
+            if row >= sheet.nrows:
+                rows.append([None] * width)
+                continue
+            cells = sheet.row_slice(row, int(min_col) - 1, int(max_col))
+            values = [
+                None if cell.ctype in empty else self._parse_type(cell)
+                for cell in cells
+            ]
+            values.extend([None] * (width - len(values)))
+            rows.append(values)
+
+        return rows
+
+    def set_range_values(self, row, column, rows, name=None):
+        self._require_writable()
+        name = self._get_sheetname(name)
+        row, column = self._get_cell(row, column)
+
+        cells = [
+            ((name, row_index, col_index), value)
+            for row_index, values in enumerate(rows, row)
+            for col_index, value in enumerate(values, column)
+        ]
+
+        if self.buffered:
+            for key, value in cells:
+                self._pending[key] = (value, None)
+            return
+
+        with self._book_write() as book:
+            sheet = book.get_sheet(name)
+            for (_, row_index, col_index), value in cells:
+                sheet.write(row_index, col_index, value)
+
     def _insert_images(self, book):
         for name, row, column, image in self._images:
             stream = BytesIO()
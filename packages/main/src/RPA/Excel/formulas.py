@@ -0,0 +1,728 @@
+"""Evaluation of common Excel formulas for workbooks opened with openpyxl.
+
+Values of formula cells are only available if the workbook was last saved
+by an application which calculates them, e.g. Excel. This module calculates
+the missing values in-process, for a subset of Excel's operators and functions.
+"""
+import datetime
+import logging
+import math
+import operator
+import re
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import openpyxl
+from openpyxl.formula.tokenizer import Token, Tokenizer
+from openpyxl.utils.cell import range_boundaries
+from openpyxl.utils.datetime import to_excel
+
+
+# Cell location as (worksheet title, row, column)
+CellKey = Tuple[str, int, int]
+
+ERRORS = ("#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A")
+
+# Binding powers of infix operators, higher binds tighter
+INFIX_POWER = {
+    "=": 1,
+    "<>": 1,
+    "<": 1,
+    ">": 1,
+    "<=": 1,
+    ">=": 1,
+    "&": 2,
+    "+": 3,
+    "-": 3,
+    "*": 4,
+    "/": 4,
+    "^": 5,
+}
+POSTFIX_POWER = 6
+PREFIX_POWER = 7
+
+RE_REFERENCE = re.compile(r"^(?:(?:'((?:[^']|'')+)'|([^'!]+))!)?([^!]+)$")
+
+
+class FormulaError(Exception):
+    """Excel error value, e.g. ``#DIV/0!``, raised during evaluation."""
+
+    def __init__(self, code: str):
+        super().__init__(code)
+        self.code = code
+
+
+class UnsupportedFormula(Exception):
+    """Formula uses syntax or functions which can't be evaluated."""
+
+
+class Range:
+    """Rectangular block of cell values referenced in a formula."""
+
+    def __init__(self, rows: List[List[Any]]):
+        self.rows = rows
+
+    @property
+    def is_cell(self) -> bool:
+        return len(self.rows) == 1 and len(self.rows[0]) == 1
+
+    def values(self) -> List[Any]:
+        return [value for row in self.rows for value in row]
+
+    def vector(self) -> List[Any]:
+        """Values of a single row or column."""
+        if len(self.rows) == 1:
+            return list(self.rows[0])
+        if all(len(row) == 1 for row in self.rows):
+            return [row[0] for row in self.rows]
+        raise FormulaError("#N/A")
+
+
+def to_number(value: Any) -> float:
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, (datetime.date, datetime.time, datetime.timedelta)):
+        return to_excel(value)
+    if isinstance(value, str):
+        if value in ERRORS:
+            raise FormulaError(value)
+        try:
+            return float(value)
+        except ValueError as err:
+            raise FormulaError("#VALUE!") from err
+    raise FormulaError("#VALUE!")
+
+
+def to_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, str) and value in ERRORS:
+        raise FormulaError(value)
+    return str(value)
+
+
+def to_bool(value: Any) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, str):
+        if value in ERRORS:
+            raise FormulaError(value)
+        if value.upper() in ("TRUE", "FALSE"):
+            return value.upper() == "TRUE"
+        raise FormulaError("#VALUE!")
+    return bool(to_number(value))
+
+
+def compare(left: Any, right: Any) -> int:
+    """Compare values like Excel: numbers before text before logical values,
+    and text case-insensitively. Returns -1, 0 or 1.
+    """
+
+    def rank(value):
+        if isinstance(value, bool):
+            return 2
+        if isinstance(value, str):
+            return 1
+        return 0
+
+    # Empty cells are equal to the empty value of the other type
+    if left is None:
+        left = {0: 0, 1: "", 2: False}[rank(right)]
+    if right is None:
+        right = {0: 0, 1: "", 2: False}[rank(left)]
+
+    for value in (left, right):
+        if isinstance(value, str) and value in ERRORS:
+            raise FormulaError(value)
+
+    if rank(left) != rank(right):
+        return -1 if rank(left) < rank(right) else 1
+
+    if isinstance(left, str):
+        left, right = left.lower(), right.lower()
+    else:
+        left, right = to_number(left), to_number(right)
+
+    return (left > right) - (left < right)
+
+
+def _numbers(args: List[Any]) -> List[float]:
+    """Numbers of function arguments, where values in ranges are counted
+    only if they're numbers, but other arguments are converted.
+    """
+    numbers = []
+    for arg in args:
+        if isinstance(arg, Range):
+            for value in arg.values():
+                if isinstance(value, str) and value in ERRORS:
+                    raise FormulaError(value)
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    numbers.append(value)
+        else:
+            numbers.append(to_number(arg))
+    return numbers
+
+
+def _scalar(value: Any) -> Any:
+    if isinstance(value, Range):
+        if not value.is_cell:
+            raise FormulaError("#VALUE!")
+        value = value.rows[0][0]
+    if isinstance(value, str) and value in ERRORS:
+        raise FormulaError(value)
+    return value
+
+
+def _round(number: float, digits: int) -> float:
+    # Excel rounds halves away from zero
+    factor = 10 ** int(digits)
+    return math.copysign(math.floor(abs(number) * factor + 0.5) / factor, number)
+
+
+def _lookup(value: Any, values: List[Any], match_type: int) -> int:
+    """Index of the matching value, like MATCH in Excel."""
+    if match_type == 0:
+        for idx, candidate in enumerate(values):
+            if candidate is not None and compare(candidate, value) == 0:
+                return idx
+        raise FormulaError("#N/A")
+
+    # Approximate match expects sorted values, and returns the last one
+    # which is smaller (or larger) or equal
+    found = None
+    for idx, candidate in enumerate(values):
+        if candidate is None:
+            continue
+        order = compare(candidate, value)
+        if (match_type > 0 and order > 0) or (match_type < 0 and order < 0):
+            break
+        found = idx
+    if found is None:
+        raise FormulaError("#N/A")
+    return found
+
+
+def _vlookup(value, table, column, approximate=True):
+    value, column = _scalar(value), int(to_number(_scalar(column)))
+    if not isinstance(table, Range):
+        raise FormulaError("#VALUE!")
+    if column < 1:
+        raise FormulaError("#VALUE!")
+    if any(column > len(row) for row in table.rows):
+        raise FormulaError("#REF!")
+
+    match_type = 1 if to_bool(_scalar(approximate)) else 0
+    idx = _lookup(value, [row[0] for row in table.rows], match_type)
+    return table.rows[idx][column - 1]
+
+
+def _index(table, row, column=None):
+    if not isinstance(table, Range):
+        raise FormulaError("#VALUE!")
+    row = int(to_number(_scalar(row)))
+    column = int(to_number(_scalar(column))) if column is not None else None
+
+    # Single row or column can be indexed with one number
+    if column is None:
+        if len(table.rows) == 1:
+            row, column = 1, row
+        else:
+            column = 1
+
+    if row < 1 or column < 1:
+        raise FormulaError("#VALUE!")
+    try:
+        return table.rows[row - 1][column - 1]
+    except IndexError as err:
+        raise FormulaError("#REF!") from err
+
+
+def _match(value, table, match_type=1):
+    if not isinstance(table, Range):
+        raise FormulaError("#N/A")
+    match_type = int(to_number(_scalar(match_type)))
+    return _lookup(_scalar(value), table.vector(), match_type) + 1
+
+
+def _average(*args):
+    numbers = _numbers(args)
+    if not numbers:
+        raise FormulaError("#DIV/0!")
+    return sum(numbers) / len(numbers)
+
+
+def _count(*args):
+    count = 0
+    for arg in args:
+        values = arg.values() if isinstance(arg, Range) else [arg]
+        count += sum(
+            1
+            for value in values
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        )
+    return count
+
+
+def _counta(*args):
+    count = 0
+    for arg in args:
+        values = arg.values() if isinstance(arg, Range) else [arg]
+        count += sum(1 for value in values if value is not None)
+    return count
+
+
+def _logical(args: Tuple[Any, ...]) -> List[bool]:
+    values = []
+    for arg in args:
+        if isinstance(arg, Range):
+            values.extend(to_bool(value) for value in arg.values() if value is not None)
+        else:
+            values.append(to_bool(arg))
+    if not values:
+        raise FormulaError("#VALUE!")
+    return values
+
+
+# Functions which get their arguments evaluated, but ranges as Range objects
+FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "SUM": lambda *args: sum(_numbers(args)),
+    "AVERAGE": _average,
+    "MIN": lambda *args: min(_numbers(args), default=0),
+    "MAX": lambda *args: max(_numbers(args), default=0),
+    "COUNT": _count,
+    "COUNTA": _counta,
+    "AND": lambda *args: all(_logical(args)),
+    "OR": lambda *args: any(_logical(args)),
+    "NOT": lambda value: not to_bool(_scalar(value)),
+    "ABS": lambda value: abs(to_number(_scalar(value))),
+    "ROUND": lambda value, digits: _round(
+        to_number(_scalar(value)), to_number(_scalar(digits))
+    ),
+    "CONCATENATE": lambda *args: "".join(to_text(_scalar(arg)) for arg in args),
+    "VLOOKUP": _vlookup,
+    "INDEX": _index,
+    "MATCH": _match,
+}
+
+
+class FormulaEvaluator:
+    """Calculates values of formula cells in a workbook opened with
+    ``data_only``, where values are missing.
+
+    Formulas are read from the workbook file once, when first needed.
+    Calculated values are cached, and a graph of the cells each formula
+    depends on is kept, so that changing a cell with ``invalidate`` only
+    clears the values of the formulas which depend on it. Formulas of
+    the file are not used anymore for cells which have been changed, or
+    for worksheets whose cells have been moved with ``invalidate_sheet``.
+
+    :param book: workbook opened with ``data_only``
+    :param path: path to the workbook file for reading the formulas
+    """
+
+    def __init__(self, book: openpyxl.Workbook, path: Any):
+        self.logger = logging.getLogger(__name__)
+        self._book = book
+        self._path = path
+        self._formulas: Optional[Dict[str, Dict[Tuple[int, int], str]]] = None
+        self._parsed: Dict[str, Any] = {}
+        self._values: Dict[CellKey, Any] = {}
+        self._dependents: Dict[CellKey, Set[CellKey]] = defaultdict(set)
+        self._evaluating: Set[CellKey] = set()
+        # Cells and worksheets changed in memory, which the file doesn't match
+        self._written: Set[CellKey] = set()
+        self._moved: Set[str] = set()
+
+    @property
+    def formulas(self) -> Dict[str, Dict[Tuple[int, int], str]]:
+        if self._formulas is None:
+            self._formulas = self._read_formulas()
+        return self._formulas
+
+    def _read_formulas(self) -> Dict[str, Dict[Tuple[int, int], str]]:
+        # pylint: disable=protected-access
+        formulas = {}
+        book = openpyxl.load_workbook(self._path, data_only=False)
+        try:
+            for sheet in book.worksheets:
+                formulas[sheet.title] = {
+                    (row, column): cell.value
+                    for (row, column), cell in sheet._cells.items()
+                    if cell.data_type == "f" and isinstance(cell.value, str)
+                }
+        finally:
+            book.close()
+        return formulas
+
+    def get_value(self, sheet: str, row: int, column: int) -> Any:
+        """Value of a cell, calculated from its formula if it has one
+        but the workbook does not have its value.
+        """
+        return self._cell_value((sheet, row, column))
+
+    def resolve_row(
+        self, sheet: str, row: int, values: Tuple[Any, ...], column: int = 1
+    ) -> Tuple[Any, ...]:
+        """Fill in missing values of formula cells in a row of values,
+        which starts from the given column.
+        """
+        if not any(value is None or _is_formula(value) for value in values):
+            return values
+        return tuple(
+            self.get_value(sheet, row, index)
+            if _is_formula(value)
+            or (value is None and self._file_formula((sheet, row, index)))
+            else value
+            for index, value in enumerate(values, column)
+        )
+
+    def invalidate(self, sheet: str, row: int, column: int) -> None:
+        """Clear calculated values which depend on the given cell,
+        which has been changed in memory.
+        """
+        self._written.add((sheet, row, column))
+        stack = [(sheet, row, column)]
+        while stack:
+            key = stack.pop()
+            self._values.pop(key, None)
+            stack.extend(self._dependents.pop(key, ()))
+
+    def invalidate_sheet(self, sheet: str) -> None:
+        """Clear all calculated values, and stop using the formulas of
+        the file for a worksheet whose cells have moved, e.g. by inserting
+        or deleting rows.
+        """
+        self._moved.add(sheet)
+        self.clear()
+
+    def rename_sheet(self, old: str, new: str) -> None:
+        """Keep using the formulas of the file for a renamed worksheet."""
+        if self._formulas is not None and old in self._formulas:
+            self._formulas[new] = self._formulas.pop(old)
+        if old in self._moved:
+            self._moved.discard(old)
+            self._moved.add(new)
+        self._written = {
+            (new if sheet == old else sheet, row, column)
+            for sheet, row, column in self._written
+        }
+        self.clear()
+
+    def clear(self) -> None:
+        """Clear all calculated values."""
+        self._values.clear()
+        self._dependents.clear()
+
+    def _file_formula(self, key: CellKey) -> Optional[str]:
+        """Formula of a cell in the file, unless changed since."""
+        sheet, row, column = key
+        if sheet in self._moved or key in self._written:
+            return None
+        return self.formulas.get(sheet, {}).get((row, column))
+
+    @staticmethod
+    def _normalize(value: Any) -> Any:
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    def _cell_value(self, key: CellKey) -> Any:
+        # pylint: disable=protected-access
+        sheet, row, column = key
+        cell = self._book[sheet]._cells.get((row, column))
+        value = cell.value if cell is not None else None
+
+        if _is_formula(value):
+            formula = value
+        elif value is None:
+            formula = self._file_formula(key)
+        else:
+            return value
+
+        if formula is None:
+            return None
+        if key in self._values:
+            return self._values[key]
+        if key in self._evaluating:
+            self.logger.debug("Circular reference in cell: %s", key)
+            return None
+
+        self._evaluating.add(key)
+        try:
+            result = self._normalize(self._evaluate(key, formula))
+        finally:
+            self._evaluating.discard(key)
+
+        self._values[key] = result
+        return result
+
+    def _evaluate(self, key: CellKey, formula: str) -> Any:
+        try:
+            if formula not in self._parsed:
+                self._parsed[formula] = Parser(formula).parse()
+            result = _scalar(self._eval(self._parsed[formula], key))
+            return 0 if result is None else result
+        except FormulaError as err:
+            return err.code
+        except UnsupportedFormula as err:
+            self.logger.debug("Unable to evaluate formula '%s': %s", formula, err)
+            return None
+
+    def _eval(self, node: Tuple, key: CellKey) -> Any:
+        # pylint: disable=too-many-return-statements
+        kind = node[0]
+        if kind == "value":
+            return node[1]
+        if kind == "error":
+            raise FormulaError(node[1])
+        if kind == "ref":
+            return self._reference(node[1], key)
+        if kind == "prefix":
+            value = to_number(_scalar(self._eval(node[2], key)))
+            return -value if node[1] == "-" else value
+        if kind == "postfix":
+            return to_number(_scalar(self._eval(node[2], key))) / 100
+        if kind == "infix":
+            left = _scalar(self._eval(node[2], key))
+            right = _scalar(self._eval(node[3], key))
+            return _infix(node[1], left, right)
+        if kind == "func":
+            return self._function(node[1], node[2], key)
+        raise UnsupportedFormula(f"Unknown expression: {kind}")
+
+    def _function(self, name: str, args: List[Tuple], key: CellKey) -> Any:
+        # Conditional functions evaluate only the arguments they need
+        if name == "IF":
+            return self._if(args, key)
+        if name == "IFERROR":
+            return self._iferror(args, key)
+
+        func = FUNCTIONS.get(name)
+        if func is None:
+            raise UnsupportedFormula(f"Unsupported function: {name}")
+        values = [self._eval(arg, key) for arg in args]
+        try:
+            return func(*values)
+        except TypeError as err:
+            # Wrong amount of arguments
+            raise FormulaError("#VALUE!") from err
+
+    def _if(self, args: List[Tuple], key: CellKey) -> Any:
+        if not 1 <= len(args) <= 3:
+            raise FormulaError("#VALUE!")
+        if to_bool(_scalar(self._eval(args[0], key))):
+            return self._eval(args[1], key) if len(args) > 1 else True
+        return self._eval(args[2], key) if len(args) > 2 else False
+
+    def _iferror(self, args: List[Tuple], key: CellKey) -> Any:
+        if len(args) != 2:
+            raise FormulaError("#VALUE!")
+        try:
+            return _scalar(self._eval(args[0], key))
+        except FormulaError:
+            return self._eval(args[1], key)
+
+    def _reference(self, reference: str, key: CellKey) -> Range:
+        match = RE_REFERENCE.match(reference)
+        if not match:
+            raise UnsupportedFormula(f"Unknown reference: {reference}")
+
+        quoted, plain, cells = match.groups()
+        sheet = quoted.replace("''", "'") if quoted else plain or key[0]
+        sheet = self._sheet_title(sheet)
+
+        try:
+            min_col, min_row, max_col, max_row = range_boundaries(cells.upper())
+        except ValueError as err:
+            # Probably a defined name, which is not supported
+            raise UnsupportedFormula(f"Unknown reference: {reference}") from err
+
+        # Whole rows or columns are limited to the used area
+        worksheet = self._book[sheet]
+        min_col, min_row = min_col or 1, min_row or 1
+        max_col = max_col or worksheet.max_column
+        max_row = max_row or worksheet.max_row
+
+        rows = []
+        for row in range(min_row, max_row + 1):
+            values = []
+            for column in range(min_col, max_col + 1):
+                precedent = (sheet, row, column)
+                self._dependents[precedent].add(key)
+                values.append(self._cell_value(precedent))
+            rows.append(values)
+
+        return Range(rows)
+
+    def _sheet_title(self, name: str) -> str:
+        if name in self._book.sheetnames:
+            return name
+        for title in self._book.sheetnames:
+            if title.lower() == name.lower():
+                return title
+        raise FormulaError("#REF!")
+
+
+def _is_formula(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith("=") and len(value) > 1
+
+
+def _divide(left: float, right: float) -> float:
+    if right == 0:
+        raise FormulaError("#DIV/0!")
+    return left / right
+
+
+def _power(left: float, right: float) -> float:
+    try:
+        result = float(left) ** right
+    except (OverflowError, ZeroDivisionError) as err:
+        raise FormulaError("#NUM!") from err
+    if isinstance(result, complex):
+        raise FormulaError("#NUM!")
+    return result
+
+
+ARITHMETIC: Dict[str, Callable[[float, float], float]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": _divide,
+    "^": _power,
+}
+
+COMPARISON: Dict[str, Callable[[int], bool]] = {
+    "=": lambda order: order == 0,
+    "<>": lambda order: order != 0,
+    "<": lambda order: order < 0,
+    ">": lambda order: order > 0,
+    "<=": lambda order: order <= 0,
+    ">=": lambda order: order >= 0,
+}
+
+
+def _infix(operator_: str, left: Any, right: Any) -> Any:
+    if operator_ == "&":
+        return to_text(left) + to_text(right)
+    if operator_ in COMPARISON:
+        return COMPARISON[operator_](compare(left, right))
+    if operator_ in ARITHMETIC:
+        return ARITHMETIC[operator_](to_number(left), to_number(right))
+    raise UnsupportedFormula(f"Unknown operator: {operator_}")
+
+
+class Parser:
+    """Parser of formula tokens into a tree of tuples, e.g.
+    ``("infix", "+", ("ref", "A1"), ("value", 1))``.
+    """
+
+    def __init__(self, formula: str):
+        self.formula = formula
+        try:
+            tokens = Tokenizer(formula).items
+        except Exception as err:  # pylint: disable=broad-except
+            raise UnsupportedFormula(str(err)) from err
+        self.tokens = [token for token in tokens if token.type != Token.WSPACE]
+        self.pos = 0
+
+    def parse(self) -> Tuple:
+        node = self._expression(0)
+        if self.pos != len(self.tokens):
+            raise UnsupportedFormula(f"Unexpected token: {self._peek().value}")
+        return node
+
+    def _peek(self) -> Optional[Token]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _next(self) -> Token:
+        token = self._peek()
+        if token is None:
+            raise UnsupportedFormula("Unexpected end of formula")
+        self.pos += 1
+        return token
+
+    def _expression(self, power: int) -> Tuple:
+        left = self._operand()
+        while True:
+            token = self._peek()
+            if token is None:
+                break
+            if token.type == Token.OP_POST and POSTFIX_POWER > power:
+                self.pos += 1
+                left = ("postfix", token.value, left)
+            elif token.type == Token.OP_IN and INFIX_POWER.get(token.value, 0) > power:
+                self.pos += 1
+                right = self._expression(INFIX_POWER[token.value])
+                left = ("infix", token.value, left, right)
+            elif token.type == Token.OP_IN and token.value not in INFIX_POWER:
+                raise UnsupportedFormula(f"Unsupported operator: {token.value}")
+            else:
+                break
+        return left
+
+    def _operand(self) -> Tuple:
+        # pylint: disable=too-many-return-statements
+        token = self._next()
+
+        if token.type == Token.OPERAND:
+            if token.subtype == Token.NUMBER:
+                return ("value", float(token.value))
+            if token.subtype == Token.TEXT:
+                return ("value", token.value[1:-1].replace('""', '"'))
+            if token.subtype == Token.LOGICAL:
+                return ("value", token.value.upper() == "TRUE")
+            if token.subtype == Token.ERROR:
+                return ("error", token.value)
+            if token.subtype == Token.RANGE:
+                return ("ref", token.value)
+        elif token.type == Token.OP_PRE:
+            return ("prefix", token.value, self._expression(PREFIX_POWER))
+        elif token.type == Token.PAREN and token.subtype == Token.OPEN:
+            node = self._expression(0)
+            self._expect(Token.PAREN)
+            return node
+        elif token.type == Token.FUNC and token.subtype == Token.OPEN:
+            return ("func", token.value[:-1].upper(), self._arguments())
+
+        raise UnsupportedFormula(f"Unexpected token: {token.value}")
+
+    def _arguments(self) -> List[Tuple]:
+        args = []
+        if self._is_closing(self._peek()):
+            self.pos += 1
+            return args
+
+        while True:
+            token = self._peek()
+            if self._is_closing(token) or (token and token.type == Token.SEP):
+                # Omitted argument, e.g. in VLOOKUP(A1, B:C, 2, )
+                args.append(("value", None))
+            else:
+                args.append(self._expression(0))
+
+            token = self._next()
+            if self._is_closing(token):
+                return args
+            if token.type != Token.SEP or token.subtype != Token.ARG:
+                raise UnsupportedFormula(f"Unexpected token: {token.value}")
+
+    @staticmethod
+    def _is_closing(token: Optional[Token]) -> bool:
+        return (
+            token is not None
+            and token.type == Token.FUNC
+            and token.subtype == Token.CLOSE
+        )
+
+    def _expect(self, kind: str) -> None:
+        token = self._next()
+        if token.type != kind or token.subtype != Token.CLOSE:
+            raise UnsupportedFormula(f"Unexpected token: {token.value}")
@@ -5,11 +5,12 @@ import os
 from pathlib import Path
 from typing import Optional, Dict, List, Union, Any, Tuple
 
+import requests
 from robot.api.deco import library, keyword
 from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
 
-from RPA.HTTP import HTTP
 from RPA.RobotLogListener import RobotLogListener
+from RPA.Robocorp.utils import get_session
 
 try:
     BuiltIn().import_library("RPA.RobotLogListener")
@@ -236,7 +237,16 @@ class Process:
             "robocorp_api_server", f"{process_api_host_env}/process-v1"
         )
         self.set_credentials(workspace_id, process_id, workspace_api_key)
-        self.http = HTTP()
+        self._session = get_session()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request with the shared session, which keeps connections
+        alive between requests, and raise an error on unsuccessful status.
+        """
+        self.logger.debug("%s %s", method.upper(), url)
+        response = self._session.request(method, url, **kwargs)
+        response.raise_for_status()
+        return response
 
     @keyword(tags=["set"])
     def set_workspace_id(self, workspace_id: Optional[str] = None) -> None:
@@ -328,7 +338,8 @@ class Process:
         ========== ====== =======
         """  # noqa: E501
         endpoint = "runs-batch" if batch else "runs"
-        response = self.http.session_less_post(
+        response = self._request(
+            "post",
             url=f"{self.process_api(process_id)}/{endpoint}",
             headers=self.headers,
             json=work_items or [],
@@ -359,7 +370,8 @@ class Process:
             request_data["workItemIds"] = extra_info
         # elif ctype == ConfigurationType.storages:
         #    request_data["storages"] = extra_info
-        response = self.http.session_less_post(
+        response = self._request(
+            "post",
             url=f"{self.process_api(process_id)}/run-request",
             headers=self.headers,
             data=json.dumps(request_data),
@@ -381,12 +393,12 @@ class Process:
         :return: The integer that represents the work item id
         """
         files = [files] if isinstance(files, str) else files or []
-        response = self.http.session_less_post(
+        response = self._request(
+            "post",
             url=f"{self.process_api(process_id)}/work-items",
             headers=self.headers,
             json={"payload": payload or {}},
         )
-        response.raise_for_status()
         response_json = response.json()
         workitem_id = response_json["id"]
         for f in files:
@@ -410,14 +422,14 @@ class Process:
         process_id: Optional[str] = None,
     ) -> Tuple[str, Dict[str, Any]]:
         upload_filesize = Path(filepath).stat().st_size
-        response = self.http.session_less_post(
+        response = self._request(
+            "post",
             url=f"{self.process_api(process_id)}/work-items/{workitem_id}/files/upload",
             headers=self.headers,
             data=json.dumps(
                 {"fileName": workitem_filename, "fileSize": upload_filesize}
             ),
         )
-        response.raise_for_status()
         return response.status_code, response.json()
 
     def upload_file_to_s3(
@@ -427,8 +439,7 @@ class Process:
             url = data["url"]
             fields = data["fields"]
             files = {"file": (workitem_filename, infile.read())}
-            response = self.http.session_less_post(url, data=fields, files=files)
-            response.raise_for_status()
+            response = self._request("post", url, data=fields, files=files)
             return response.status_code, response.text
 
     @keyword(tags=["process", "get"])
@@ -438,11 +449,11 @@ class Process:
         :param workspace_id: specific Control Room workspace to which process belongs to
         :return: the JSON data of the process runs based on the provided parameters
         """
-        response = self.http.session_less_get(
+        response = self._request(
+            "get",
             url=f"{self.workspace_api(workspace_id)}/processes",
             headers=self.headers,
         )
-        response.raise_for_status()
         return response.json()["data"]
 
     @keyword(tags=["process", "get", "work item"])
@@ -460,12 +471,12 @@ class Process:
         :param process_id: specific process to which items belongs to
         :return: the JSON data of the process runs based on the provided parameters
         """
-        response = self.http.session_less_get(
+        response = self._request(
+            "get",
             url=f"{self.process_api(process_id)}/work-items",
             headers=self.headers,
             params={"includeData": str(include_data).lower()},
         )
-        response.raise_for_status()
         data = response.json()["data"]
         return (
             [d for d in data if d["state"].upper() == item_state.upper()]
@@ -490,7 +501,8 @@ class Process:
          the response (default False)
         :param item_state: state of work items to return (default all)
         """
-        response = self.http.session_less_get(
+        response = self._request(
+            "get",
             url=f"{self.process_api(process_id)}/runs/{process_run_id}/work-items",
             headers=self.headers,
             params={
@@ -499,7 +511,6 @@ class Process:
                 "sortOrder": "desc",
             },
         )
-        response.raise_for_status()
         data = response.json()["data"]
         return (
             [d for d in data if d["state"].upper() == item_state.upper()]
@@ -522,12 +533,12 @@ class Process:
         :param process_id: specific process to which runs belongs to
         :return: the JSON of the work items associated with a given process
         """
-        response = self.http.session_less_get(
+        response = self._request(
+            "get",
             url=f"{self.process_api(process_id)}/work-items/{workitem_id}",
             headers=self.headers,
             params={"includeData": str(include_data).lower()},
         )
-        response.raise_for_status()
         return response.json()
 
     @keyword(tags=["process", "get", "runs"])
@@ -544,12 +555,12 @@ class Process:
         :param process_id: specific process to which runs belongs to
         :return: the JSON data of the process runs based on the provided parameters
         """
-        response = self.http.session_less_get(
+        response = self._request(
+            "get",
             url=f"{self.process_api(process_id)}/runs",
             headers=self.headers,
             params={"limit": limit},
         )
-        response.raise_for_status()
         data = response.json()["data"]
         return (
             [d for d in data if d["state"].upper() == run_state.upper()]
@@ -571,12 +582,12 @@ class Process:
         :param workspace_id: specific Control Room workspace to which process belongs to
         :return: the JSON data of the process runs based on the provided parameters
         """
-        response = self.http.session_less_get(
+        response = self._request(
+            "get",
             url=f"{self.workspace_api(workspace_id)}/pruns",
             headers=self.headers,
             params={"limit": limit},
         )
-        response.raise_for_status()
         data = response.json()
         return (
             [d for d in data if d["state"].upper() == run_state.upper()]
@@ -601,11 +612,11 @@ class Process:
         request_url = f"{self.process_api(process_id)}/runs/{process_run_id}"
         if step_run_id:
             request_url = f"{request_url}/robotRuns/{step_run_id}"
-        response = self.http.session_less_get(
+        response = self._request(
+            "get",
             url=request_url,
             headers=self.headers,
         )
-        response.raise_for_status()
         return response.json()
 
     @keyword(tags=["process", "get"])
@@ -633,7 +644,8 @@ class Process:
         :param process_id: specific process to start
         :return: the response JSON
         """
-        response = self.http.session_less_post(
+        response = self._request(
+            "post",
             url=f"{self.process_api(process_id)}/work-items/{work_item_id}/retry",
             headers=self.headers,
         )
@@ -657,11 +669,11 @@ class Process:
         request_url = f"{self.process_api(process_id)}/runs/{process_run_id}"
         request_url = f"{request_url}/robotRuns/{step_run_id}/artifacts"
         self.logger.info("GET %s", request_url)
-        response = self.http.session_less_get(
+        response = self._request(
+            "get",
             url=request_url,
             headers=self.headers,
         )
-        response.raise_for_status()
         return response.json()
 
     @keyword(tags=["process", "get", "runs", "artifacts"])
@@ -687,9 +699,9 @@ class Process:
             f"{request_url}/robotRuns/{step_run_id}/artifacts/{artifact_id}/{filename}"
         )
         self.logger.info("GET %s", request_url)
-        response = self.http.session_less_get(
+        response = self._request(
+            "get",
             url=request_url,
             headers=self.headers,
         )
-        response.raise_for_status()
         return response.json()
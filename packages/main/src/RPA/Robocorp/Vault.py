@@ -9,7 +9,6 @@ import traceback
 from abc import abstractmethod, ABCMeta
 from typing import Tuple
 
-import requests
 import yaml
 from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.backends import default_backend
@@ -19,7 +18,7 @@ from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
 
 from RPA.core.helpers import import_by_name, required_env
-from .utils import url_join, resolve_path
+from .utils import get_session, url_join, resolve_path
 
 
 class RobocorpVaultError(RuntimeError):
@@ -252,6 +251,7 @@ class RobocorpVault(BaseSecretManager):
         # Generated lazily on request
         self.__private_key = None
         self.__public_bytes = None
+        self._session = get_session()
 
     @property
     def headers(self):
@@ -316,7 +316,7 @@ class RobocorpVault(BaseSecretManager):
         url = self.create_secret_url(secret_name)
 
         try:
-            response = requests.get(url, headers=self.headers, params=self.params)
+            response = self._session.get(url, headers=self.headers, params=self.params)
             response.raise_for_status()
 
             payload = response.json()
@@ -388,7 +388,7 @@ class RobocorpVault(BaseSecretManager):
 
         url = self.create_secret_url(secret.name)
         try:
-            response = requests.put(url, headers=self.headers, json=payload)
+            response = self._session.put(url, headers=self.headers, json=payload)
             response.raise_for_status()
         except Exception as e:
             self.logger.debug(traceback.format_exc())
@@ -402,7 +402,7 @@ class RobocorpVault(BaseSecretManager):
         """Get the public key for AES encryption with the existing token."""
         url = self.create_public_key_url()
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self._session.get(url, headers=self.headers)
             response.raise_for_status()
         except Exception as e:
             self.logger.debug(traceback.format_exc())
@@ -1,15 +1,29 @@
-import copy
+import atexit
 import email
 import fnmatch
 import json
 import logging
 import os
+import tempfile
 from abc import ABC, abstractmethod
 from enum import Enum
 from pathlib import Path
-from shutil import copy2
-from threading import Event
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from shutil import copy2, copyfileobj
+from queue import Queue
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ThreadPoolExecutor, wait
+from threading import Event, RLock, Semaphore, Thread, local
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import yaml
 from robot.api.deco import keyword, library
@@ -20,20 +34,27 @@ from RPA.core.logger import deprecation
 from RPA.core.notebook import notebook_print
 from RPA.FileSystem import FileSystem
 from RPA.Robocorp.utils import (
+    ChangeTracker,
     JSONType,
+    MultipartStream,
     Requests,
+    TrackedDict,
     get_dot_value,
-    is_json_equal,
+    get_stream_size,
     json_dumps,
     resolve_path,
     set_dot_value,
+    track_changes,
     truncate,
+    untrack_changes,
     url_join,
 )
 
 
 UNDEFINED = object()  # Undefined default value
 ENCODING = "utf-8"
+CHUNK_SIZE = 1024 * 1024  # Bytes read at once when streaming files
+FILE_WORKERS = 4  # Work item files uploaded or downloaded in parallel
 
 _STRINGS_TYPE = Union[str, Tuple[str, ...]]
 AUTO_PARSE_EMAIL_TYPE = Optional[Dict[_STRINGS_TYPE, _STRINGS_TYPE]]
@@ -99,13 +120,26 @@ class BaseAdapter(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_file(self, item_id: str, name: str) -> bytes:
-        """Read file's contents from work item."""
+    def get_file(
+        self, item_id: str, name: str, fd: Optional[BinaryIO] = None
+    ) -> Optional[bytes]:
+        """Read file's contents from work item, or write them in chunks into
+        the binary file object ``fd`` if given.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    def add_file(self, item_id: str, name: str, *, original_name: str, content: bytes):
-        """Attach file to work item."""
+    def add_file(
+        self,
+        item_id: str,
+        name: str,
+        *,
+        original_name: str,
+        content: Union[bytes, BinaryIO],
+    ):
+        """Attach file to work item, with the content given as bytes or read in
+        chunks from a binary file object.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -113,6 +147,9 @@ class BaseAdapter(ABC):
         """Remove attached file from work item."""
         raise NotImplementedError
 
+    def close(self):
+        """Release any resources held by the adapter."""
+
 
 class RobocorpAdapter(BaseAdapter):
     """Adapter for saving/loading work items from Robocorp Control Room.
@@ -144,6 +181,8 @@ class RobocorpAdapter(BaseAdapter):
 
         self._workitem_requests = self._process_requests = None
         self._init_workitem_requests()
+        # Metadata of attached files, like their IDs, by work item ID and file name.
+        self._file_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
         self._init_process_requests()
 
     def _init_workitem_requests(self):
@@ -244,6 +283,8 @@ class RobocorpAdapter(BaseAdapter):
             exception,
         )
         self._process_requests.post(url, json=body)
+        # Released items are not accessed anymore.
+        self._file_cache.pop(item_id, None)
 
     def create_output(self, parent_id: str, payload: Optional[JSONType] = None) -> str:
         # Putting "output" for the current input work item identified by `parent_id`.
@@ -279,9 +320,14 @@ class RobocorpAdapter(BaseAdapter):
         logging.info("Listing work item files at: %s", url)
         response = self._workitem_requests.get(url)
 
-        return [item["fileName"] for item in response.json()]
+        files = response.json()
+        # Duplicate filenames should never exist, but keep the last one just in case
+        self._file_cache[item_id] = {item["fileName"]: item for item in files}
+        return [item["fileName"] for item in files]
 
-    def get_file(self, item_id: str, name: str) -> bytes:
+    def get_file(
+        self, item_id: str, name: str, fd: Optional[BinaryIO] = None
+    ) -> Optional[bytes]:
         # Robocorp API returns URL for S3 download.
         file_id = self.file_id(item_id, name)
         url = url_join(item_id, "files", file_id)
@@ -296,17 +342,36 @@ class RobocorpAdapter(BaseAdapter):
             _handle_error=lambda resp: resp.raise_for_status(),
             _sensitive=True,
             headers={},
+            stream=fd is not None,
         )
-        return response.content
+        if fd is None:
+            return response.content
+
+        with response:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                fd.write(chunk)
+        return None
 
-    def add_file(self, item_id: str, name: str, *, original_name: str, content: bytes):
+    def add_file(
+        self,
+        item_id: str,
+        name: str,
+        *,
+        original_name: str,
+        content: Union[bytes, BinaryIO],
+    ):
         # Note that here the `original_name` is useless here. (used with `FileAdapter`
         #   only)
         del original_name
 
+        if isinstance(content, bytes):
+            size = len(content)
+        else:
+            size = get_stream_size(content)
+
         # Robocorp API returns pre-signed POST details for S3 upload.
         url = url_join(item_id, "files")
-        body = {"fileName": str(name), "fileSize": len(content)}
+        body = {"fileName": str(name), "fileSize": size}
         logging.info(
             "Adding work item file into: %s (name: %s, size: %d)",
             url,
@@ -315,44 +380,56 @@ class RobocorpAdapter(BaseAdapter):
         )
         response = self._workitem_requests.post(url, json=body)
         data = response.json()
+        self._file_cache.pop(item_id, None)
 
         # Perform the actual file upload.
         url = data["url"]
         fields = data["fields"]
-        files = {"file": (name, content)}
+        if isinstance(content, bytes):
+            files = {"file": (name, content)}
+            self._workitem_requests.post(
+                url,
+                _handle_error=lambda resp: resp.raise_for_status(),
+                _sensitive=True,
+                headers={},
+                data=fields,
+                files=files,
+            )
+            return
+
+        stream = MultipartStream(fields, "file", name, content)
         self._workitem_requests.post(
             url,
             _handle_error=lambda resp: resp.raise_for_status(),
             _sensitive=True,
-            headers={},
-            data=fields,
-            files=files,
+            headers={"Content-Type": stream.content_type},
+            data=stream,
         )
 
     def remove_file(self, item_id: str, name: str):
         file_id = self.file_id(item_id, name)
         url = url_join(item_id, "files", file_id)
         self._workitem_requests.delete(url)
+        self._file_cache.get(item_id, {}).pop(name, None)
 
     def file_id(self, item_id: str, name: str) -> str:
-        url = url_join(item_id, "files")
-        response = self._workitem_requests.get(url)
+        files = self._file_cache.get(item_id)
+        if files is None or name not in files:
+            # Unknown or changed since listed, so list the files again.
+            self.list_files(item_id)
+            files = self._file_cache[item_id]
 
-        files = response.json()
         if not files:
             raise FileNotFoundError("No files in work item")
 
-        matches = [item for item in files if item["fileName"] == name]
-        if not matches:
+        if name not in files:
             raise FileNotFoundError(
                 "File with name '{name}' not in: {names}".format(
-                    name=name, names=", ".join(item["fileName"] for item in files)
+                    name=name, names=", ".join(files)
                 )
             )
 
-        # Duplicate filenames should never exist,
-        # but use last item just in case
-        return matches[-1]["fileId"]
+        return files[name]["fileId"]
 
 
 class FileAdapter(BaseAdapter):
@@ -366,21 +443,48 @@ class FileAdapter(BaseAdapter):
     Reads and writes all work item files from/to the same parent
     folder as the given input database.
 
+    Database files with the ``.jsonl`` extension are read and written
+    as JSON Lines, with one work item per line.
+
+    By default the whole database file is written again on every change.
+    In journal mode, changed work items are appended instead to an adjacent
+    ``<filename>.journal`` file, which is compacted into the database file
+    after every ``COMPACT_EVERY`` changes and when the adapter is closed.
+
     Optional environment variables:
 
     * RPA_INPUT_WORKITEM_PATH:  Path to work items input database file
     * RPA_OUTPUT_WORKITEM_PATH:  Path to work items output database file
+    * RPA_WORKITEMS_JOURNAL:  Enable journal mode if not empty
     """
 
+    #: Amount of journaled changes after which the database file is written
+    COMPACT_EVERY = 1000
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self._input_path = UNDEFINED
         self._output_path = UNDEFINED
 
-        self.inputs: List[Dict[str, Any]] = self.load_database()
+        self._inputs: Optional[List[Dict[str, Any]]] = None
         self.outputs: List[Dict[str, Any]] = []
         self.index: int = 0
+        # Files can be added from several threads, which all save the database.
+        self._lock = RLock()
+
+        self.journal = bool(os.getenv("RPA_WORKITEMS_JOURNAL"))
+        # Changes journaled per source since written, or `None` if not written
+        self._journaled: Dict[str, Optional[int]] = {"input": None, "output": None}
+        if self.journal:
+            atexit.register(self.close)
+
+    @property
+    def inputs(self) -> List[Dict[str, Any]]:
+        # Loaded on first access, which also numbers the output items.
+        if self._inputs is None:
+            self._inputs = self.load_database()
+        return self._inputs
 
     def _get_item(self, item_id: str) -> Tuple[str, Dict[str, Any]]:
         # The work item ID is analogue to inputs/outputs list queues index.
@@ -459,31 +563,80 @@ class FileAdapter(BaseAdapter):
 
         return self._output_path
 
-    def _save_to_disk(self, source: str) -> None:
+    def _get_database(self, source: str) -> Tuple[Path, List[Dict[str, Any]]]:
         if source == "input":
             if not self.input_path:
                 raise RuntimeError(
                     "Can't save an input item without a path defined, use "
                     "'RPA_INPUT_WORKITEM_PATH' env for this matter"
                 )
-            path = self.input_path
-            data = self.inputs
-        else:
-            path = self.output_path
-            data = self.outputs
+            return self.input_path, self.inputs
+
+        return self.output_path, self.outputs
+
+    @staticmethod
+    def _journal_path(path: Path) -> Path:
+        return path.with_name(path.name + ".journal")
+
+    def _save_to_disk(self, source: str, item_id: Optional[str] = None) -> None:
+        path, data = self._get_database(source)
+
+        with self._lock:
+            journaled = self._journaled[source]
+            if (
+                self.journal
+                and item_id is not None
+                and journaled is not None
+                and journaled < self.COMPACT_EVERY
+            ):
+                index = int(item_id)
+                if source == "output":
+                    index -= len(self.inputs)
+                entry = {"index": index, "item": data[index]}
+                with open(self._journal_path(path), "a", encoding=ENCODING) as fd:
+                    fd.write(json_dumps(entry) + "\n")
+                self._journaled[source] = journaled + 1
+                return
 
-        with open(path, "w", encoding=ENCODING) as fd:
-            fd.write(json_dumps(data, indent=4))
+            self._write_database(path, data)
+            self._journaled[source] = 0
 
         logging.info("Saved into %s file: %s", source, path)
 
+    def _write_database(self, path: Path, data: List[Dict[str, Any]]) -> None:
+        # Replaced at once, so the database stays valid if interrupted.
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding=ENCODING) as fd:
+            if path.suffix == ".jsonl":
+                for item in data:
+                    fd.write(json_dumps(item) + "\n")
+            else:
+                fd.write(json_dumps(data, indent=4))
+        os.replace(tmp_path, path)
+
+        # All the journaled changes are part of the database now.
+        journal_path = self._journal_path(path)
+        if journal_path.exists():
+            journal_path.unlink()
+
+    def close(self):
+        """Write journaled changes into the database files."""
+        with self._lock:
+            for source, journaled in self._journaled.items():
+                if journaled:
+                    self._save_to_disk(source)
+
+        if self.journal:
+            atexit.unregister(self.close)
+
     def create_output(self, _: str, payload: Optional[JSONType] = None) -> str:
         # Note that the `parent_id` is not used during local development.
         item: Dict[str, Any] = {"payload": payload, "files": {}}
-        self.outputs.append(item)
-
-        self._save_to_disk("output")
-        return str(len(self.inputs) + len(self.outputs) - 1)  # new output work item ID
+        with self._lock:
+            self.outputs.append(item)
+            item_id = str(len(self.inputs) + len(self.outputs) - 1)
+            self._save_to_disk("output", item_id)
+        return item_id  # new output work item ID
 
     def load_payload(self, item_id: str) -> JSONType:
         _, item = self._get_item(item_id)
@@ -491,15 +644,18 @@ class FileAdapter(BaseAdapter):
 
     def save_payload(self, item_id: str, payload: JSONType):
         source, item = self._get_item(item_id)
-        item["payload"] = payload
-        self._save_to_disk(source)
+        with self._lock:
+            item["payload"] = payload
+            self._save_to_disk(source, item_id)
 
     def list_files(self, item_id: str) -> List[str]:
         _, item = self._get_item(item_id)
         files = item.get("files", {})
         return list(files.keys())
 
-    def get_file(self, item_id: str, name: str) -> bytes:
+    def get_file(
+        self, item_id: str, name: str, fd: Optional[BinaryIO] = None
+    ) -> Optional[bytes]:
         source, item = self._get_item(item_id)
         files = item.get("files", {})
 
@@ -510,23 +666,48 @@ class FileAdapter(BaseAdapter):
             )
             path = parent / path
 
+        if fd is None:
+            return Path(path).read_bytes()
+
+        target = getattr(fd, "name", None)
+        if isinstance(target, str) and Path(target).resolve() == Path(path).resolve():
+            # Already in place, and the file object might have truncated it.
+            logging.info("Using existing file: %s", path)
+            return None
+
         with open(path, "rb") as infile:
-            return infile.read()
+            copyfileobj(infile, fd, CHUNK_SIZE)
+        return None
 
-    def add_file(self, item_id: str, name: str, *, original_name: str, content: bytes):
+    def add_file(
+        self,
+        item_id: str,
+        name: str,
+        *,
+        original_name: str,
+        content: Union[bytes, BinaryIO],
+    ):
         source, item = self._get_item(item_id)
-        files = item.setdefault("files", {})
 
         parent = (
             self.input_path.parent if source == "input" else self.output_path.parent
         )
         path = parent / original_name  # the file on disk will keep its original name
-        with open(path, "wb") as fd:
-            fd.write(content)
-        logging.info("Created file: %s", path)
-        files[name] = original_name  # file path relative to the work item
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+            logging.info("Created file: %s", path)
+        elif Path(getattr(content, "name", "")).resolve() == path.resolve():
+            # Already in place, and opening it for writing would truncate it.
+            logging.info("Using existing file: %s", path)
+        else:
+            with open(path, "wb") as fd:
+                copyfileobj(content, fd, CHUNK_SIZE)
+            logging.info("Created file: %s", path)
 
-        self._save_to_disk(source)
+        with self._lock:
+            files = item.setdefault("files", {})
+            files[name] = original_name  # file path relative to the work item
+            self._save_to_disk(source, item_id)
 
     def remove_file(self, item_id: str, name: str):
         source, item = self._get_item(item_id)
@@ -535,20 +716,53 @@ class FileAdapter(BaseAdapter):
         path = files[name]
         logging.info("Would remove file: %s", path)
         # Note that the file doesn't get removed from disk as well.
-        del files[name]
+        with self._lock:
+            del files[name]
+            self._save_to_disk(source, item_id)
+
+    @staticmethod
+    def _read_database(path: Path) -> Any:
+        with open(path, "r", encoding=ENCODING) as infile:
+            if Path(path).suffix == ".jsonl":
+                # Parsed line by line, without reading the whole file at once.
+                return [json.loads(line) for line in infile if line.strip()]
+            return json.load(infile)
+
+    def _replay_journal(self, path: Path, data: List[Dict[str, Any]]) -> None:
+        journal_path = self._journal_path(path)
+        if not journal_path.exists():
+            return
 
-        self._save_to_disk(source)
+        # Left behind by an interrupted run, and not yet part of the database.
+        logging.info("Replaying work items journal: %s", journal_path)
+        journaled: Optional[int] = 0
+        with open(journal_path, "r", encoding=ENCODING) as infile:
+            for line in infile:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Partially written last change, so the database file has to
+                    # be written again before journaling more changes.
+                    journaled = None
+                    break
+                if entry["index"] < len(data):
+                    data[entry["index"]] = entry["item"]
+                else:
+                    data.append(entry["item"])
+                journaled += 1
+        self._journaled["input"] = journaled
 
     def load_database(self) -> List:
         try:
             try:
-                with open(self.input_path, "r", encoding=ENCODING) as infile:
-                    data = json.load(infile)
+                data = self._read_database(self.input_path)
             except (TypeError, FileNotFoundError):
                 logging.warning("No input work items file found: %s", self.input_path)
                 data = []
 
             if isinstance(data, list):
+                if data:
+                    self._replay_journal(self.input_path, data)
                 assert all(
                     isinstance(d, dict) for d in data
                 ), "Items should be dictionaries"
@@ -567,6 +781,189 @@ class FileAdapter(BaseAdapter):
             return [{"payload": {}}]
 
 
+class PrefetchAdapter(BaseAdapter):
+    """Adapter wrapper which reserves input work items ahead of time.
+
+    After :meth:`start` has been called, a background thread reserves up to
+    ``lookahead`` input work items from the wrapped adapter, and loads their
+    payloads and file listings while the current item is being processed.
+    Before that, and after the given amount of items has been reserved,
+    all calls are passed through to the wrapped adapter.
+
+    Prefetched items which were never handed out are released as failed
+    with an application error on :meth:`close`, so that they can be
+    retried in Control Room.
+
+    :param adapter:   Adapter instance to wrap
+    :param lookahead: Maximum amount of reserved, but not yet processed items
+    """
+
+    UNPROCESSED_CODE = "PREFETCHED_ITEM_UNPROCESSED"
+
+    def __init__(self, adapter: BaseAdapter, lookahead: int):
+        if lookahead < 1:
+            raise ValueError("Prefetch lookahead should be at least 1")
+
+        #: Wrapped adapter doing the actual work
+        self.adapter = adapter
+        self.lookahead = lookahead
+
+        self._slots = Semaphore(lookahead)
+        self._queue: Queue = Queue()
+        self._thread: Optional[Thread] = None
+        self._stopped = Event()
+        #: Amount of items left to reserve in the background, if limited
+        self._remaining: Optional[int] = None
+
+        #: Preloaded content, handed out once per item
+        self._payloads: Dict[str, JSONType] = {}
+        self._files: Dict[str, List[str]] = {}
+
+    def start(self, limit: Optional[int] = None):
+        """Start reserving input work items in the background, at most
+        ``limit`` items if given. Does nothing if already started.
+        """
+        if self._stopped.is_set():
+            raise RuntimeError("Work items prefetching has been stopped")
+        if self._thread is not None or (limit is not None and limit < 1):
+            return
+
+        self._remaining = limit
+        self._thread = Thread(
+            target=self._prefetch, name="WorkItemsPrefetch", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _prefetch(self):
+        while self._remaining is None or self._remaining > 0:
+            self._slots.acquire()  # pylint: disable=consider-using-with
+            if self._stopped.is_set():
+                return
+
+            try:
+                item_id = self.adapter.reserve_input()
+            except Exception as exc:  # pylint: disable=broad-except
+                # Includes `EmptyQueue`, which ends prefetching as well.
+                self._queue.put((None, exc))
+                return
+
+            self._preload(item_id)
+            self._queue.put((item_id, None))
+            if self._remaining is not None:
+                self._remaining -= 1
+
+        # Marks the end of prefetched items
+        self._queue.put((None, None))
+
+    def _preload(self, item_id: str):
+        try:
+            self._payloads[item_id] = self.adapter.load_payload(item_id)
+            self._files[item_id] = self.adapter.list_files(item_id)
+        except Exception as exc:  # pylint: disable=broad-except
+            # Loaded again on demand, which raises the error in the right place.
+            logging.debug("Failed to prefetch work item %r: %s", item_id, exc)
+            self._payloads.pop(item_id, None)
+            self._files.pop(item_id, None)
+
+    def reserve_input(self) -> str:
+        if self._stopped.is_set():
+            raise RuntimeError("Work items prefetching has been stopped")
+        if self._thread is None:
+            return self.adapter.reserve_input()
+
+        item_id, error = self._queue.get()
+        if item_id is None:
+            # Prefetching has ended, either by reaching its limit or an error
+            self._thread.join()
+            self._thread = None
+            atexit.unregister(self.close)
+            if error is not None:
+                raise error
+            return self.adapter.reserve_input()
+
+        self._slots.release()
+        return item_id
+
+    def release_input(
+        self, item_id: str, state: State, exception: Optional[dict] = None
+    ):
+        self.adapter.release_input(item_id, state, exception=exception)
+
+    def create_output(self, parent_id: str, payload: Optional[JSONType] = None) -> str:
+        return self.adapter.create_output(parent_id, payload=payload)
+
+    def load_payload(self, item_id: str) -> JSONType:
+        try:
+            return self._payloads.pop(item_id)
+        except KeyError:
+            return self.adapter.load_payload(item_id)
+
+    def save_payload(self, item_id: str, payload: JSONType):
+        self._payloads.pop(item_id, None)
+        self.adapter.save_payload(item_id, payload)
+
+    def list_files(self, item_id: str) -> List[str]:
+        try:
+            return self._files.pop(item_id)
+        except KeyError:
+            return self.adapter.list_files(item_id)
+
+    def get_file(
+        self, item_id: str, name: str, fd: Optional[BinaryIO] = None
+    ) -> Optional[bytes]:
+        return self.adapter.get_file(item_id, name, fd=fd)
+
+    def add_file(
+        self,
+        item_id: str,
+        name: str,
+        *,
+        original_name: str,
+        content: Union[bytes, BinaryIO],
+    ):
+        self._files.pop(item_id, None)
+        self.adapter.add_file(
+            item_id, name, original_name=original_name, content=content
+        )
+
+    def remove_file(self, item_id: str, name: str):
+        self._files.pop(item_id, None)
+        self.adapter.remove_file(item_id, name)
+
+    def close(self):
+        """Stop prefetching and release all reserved, but unprocessed items."""
+        if self._stopped.is_set():
+            return
+
+        self._stopped.set()
+        if self._thread is not None:
+            self._slots.release()  # wake up the thread if waiting for a free slot
+            self._thread.join()
+            atexit.unregister(self.close)
+
+        while not self._queue.empty():
+            item_id, _ = self._queue.get()
+            if item_id is None:
+                continue
+
+            self._payloads.pop(item_id, None)
+            self._files.pop(item_id, None)
+            exception = {
+                "type": Error.APPLICATION.value,
+                "code": self.UNPROCESSED_CODE,
+                "message": "Prefetched input work item was not processed",
+            }
+            try:
+                self.adapter.release_input(item_id, State.FAILED, exception=exception)
+            except Exception as exc:  # pylint: disable=broad-except
+                logging.warning(
+                    "Failed to release prefetched work item %r: %s", item_id, exc
+                )
+
+        self.adapter.close()
+
+
 class WorkItem:
     """Base class for input and output work items.
 
@@ -584,9 +981,10 @@ class WorkItem:
         assert self.id is not None or self.parent_id is not None
         #: Item's state on release; can be set once
         self.state: Optional[State] = None
-        #: Remote JSON payload, and queued changes
-        self._payload: JSONType = {}
-        self._payload_cache: JSONType = {}
+        #: JSON payload, and the state of its changes when last loaded or saved
+        self._tracker = ChangeTracker()
+        self._payload: JSONType = TrackedDict(self._tracker)
+        self._saved_state = self._tracker.state()
         #: Remote attached files, and queued changes
         self._files: List[str] = []
         self._files_to_add: Dict[str, Path] = {}
@@ -602,18 +1000,20 @@ class WorkItem:
         """Check if work item has unsaved changes."""
         return (
             self.id is None
-            or not is_json_equal(self._payload, self._payload_cache)
+            or self._tracker.state() != self._saved_state
             or self._files_to_add
             or self._files_to_remove
         )
 
     @property
     def payload(self):
-        return self._payload_cache
+        """JSON payload, in which any change is tracked."""
+        return self._payload
 
     @payload.setter
     def payload(self, value):
-        self._payload_cache = value
+        self._payload = self._tracker.adopt(value)
+        self._tracker.changed()
 
     @property
     def files(self):
@@ -626,37 +1026,49 @@ class WorkItem:
 
     def load(self):
         """Load data payload and list of files."""
-        self._payload = self.adapter.load_payload(self.id)
-        self._payload_cache = copy.deepcopy(self._payload)
+        self._tracker = ChangeTracker()
+        self._payload = track_changes(self.adapter.load_payload(self.id), self._tracker)
+        self._saved_state = self._tracker.state()
 
         self._files = self.adapter.list_files(self.id)
         self._files_to_add = {}
         self._files_to_remove = []
 
     def save(self):
-        """Save data payload and attach/remove files."""
+        """Save data payload if changed, and attach/remove files."""
+        state = self._tracker.state()
         if self.id is None:
-            self.id = self.adapter.create_output(self.parent_id, payload=self.payload)
-        else:
-            self.adapter.save_payload(self.id, self.payload)
+            payload = untrack_changes(self.payload)
+            self.id = self.adapter.create_output(self.parent_id, payload=payload)
+        elif state != self._saved_state:
+            self.adapter.save_payload(self.id, untrack_changes(self.payload))
 
         for name in self._files_to_remove:
             self.adapter.remove_file(self.id, name)
 
-        for name, path in self._files_to_add.items():
-            with open(path, "rb") as infile:
-                self.adapter.add_file(
-                    self.id, name, original_name=path.name, content=infile.read()
-                )
+        if len(self._files_to_add) > 1:
+            with ThreadPoolExecutor(
+                max_workers=FILE_WORKERS, thread_name_prefix="WorkItemUpload"
+            ) as executor:
+                # Consume the results for raising the first error, if any.
+                list(executor.map(self._upload_file, *zip(*self._files_to_add.items())))
+        else:
+            for name, path in self._files_to_add.items():
+                self._upload_file(name, path)
 
         # Empty unsaved values
-        self._payload = self._payload_cache
-        self._payload_cache = copy.deepcopy(self._payload)
+        self._saved_state = state
 
         self._files = self.files
         self._files_to_add = {}
         self._files_to_remove = []
 
+    def _upload_file(self, name: str, path: Path):
+        with open(path, "rb") as infile:
+            self.adapter.add_file(
+                self.id, name, original_name=path.name, content=infile
+            )
+
     def get_file(self, name, path=None) -> str:
         """Load an attached file and store it on the local filesystem.
 
@@ -676,13 +1088,43 @@ class WorkItem:
             if Path(local_path).resolve() != Path(path).resolve():
                 copy2(local_path, path)
         else:
-            content = self.adapter.get_file(self.id, name)
-            with open(path, "wb") as outfile:
-                outfile.write(content)
+            # Downloaded next to the destination first, which keeps an existing
+            # file intact on errors, or if it's the attached file itself.
+            fd, partial = tempfile.mkstemp(
+                dir=Path(path).resolve().parent, prefix=f".{Path(path).name}."
+            )
+            try:
+                with os.fdopen(fd, "wb") as outfile:
+                    self.adapter.get_file(self.id, name, fd=outfile)
+                os.replace(partial, path)
+            except BaseException:
+                Path(partial).unlink(missing_ok=True)
+                raise
 
         # Always return absolute path
         return str(Path(path).resolve())
 
+    def get_files(self, names, dirname=None) -> List[str]:
+        """Load several attached files concurrently and store them on the local
+        filesystem.
+
+        :param names:   Names of attached files
+        :param dirname: Destination directory. Default to current working directory.
+        :returns:       Paths to created files, in the same order as the names
+        """
+
+        def get_file(name):
+            path = os.path.join(dirname, name) if dirname else None
+            return self.get_file(name, path)
+
+        if len(names) < 2:
+            return [get_file(name) for name in names]
+
+        with ThreadPoolExecutor(
+            max_workers=FILE_WORKERS, thread_name_prefix="WorkItemDownload"
+        ) as executor:
+            return list(executor.map(get_file, names))
+
     def add_file(self, path, name=None):
         """Add file to current work item. Does not upload
         until ``save()`` is called.
@@ -754,6 +1196,25 @@ class WorkItems:
     After an input has been loaded its payload and files can be accessed
     through corresponding keywords, and optionally these values can be modified.
 
+    **Prefetching inputs**
+
+    Reserving an input work item and loading its payload and files takes
+    several calls to Control Room, which adds latency to every processed item.
+    With the library import argument ``prefetch`` set to a number, that many
+    upcoming input work items are reserved and loaded in the background while
+    ``For Each Input Work Item`` is processing the current one. No more items
+    are reserved than its ``items_limit`` allows, and items retrieved with
+    ``Get Input Work Item`` outside of it are not prefetched.
+
+    .. code-block:: robotframework
+
+        *** Settings ***
+        Library    RPA.Robocorp.WorkItems    prefetch=5
+
+    Prefetched items which are left unprocessed when the execution ends, for
+    example when the iteration stops early because of an error, are
+    released as failed with an application error, so that they can be retried.
+
     **E-mail triggering**
 
     Since a process can be started in Control Room by sending an e-mail, a body
@@ -939,6 +1400,7 @@ class WorkItems:
         default_adapter: Union[Type[BaseAdapter], str] = RobocorpAdapter,
         # pylint: disable=dangerous-default-value
         auto_parse_email: AUTO_PARSE_EMAIL_TYPE = AUTO_PARSE_EMAIL_DEFAULT,
+        prefetch: int = 0,
     ):
         self.ROBOT_LIBRARY_LISTENER = self
 
@@ -957,32 +1419,47 @@ class WorkItems:
         #: Adapter for reading/writing items
         self._adapter_class = self._load_adapter(default_adapter)
         self._adapter: Optional[BaseAdapter] = None
+        #: Amount of input work items to reserve ahead of time
+        self.prefetch = int(prefetch or 0)
 
         # Know when we're iterating (and consuming) all the work items in the queue.
         self._under_iteration = Event()
+        # Current and input work items of each concurrent iteration worker.
+        self._worker = local()
 
     @property
     def adapter(self):
         if self._adapter is None:
-            self._adapter = self._adapter_class()
+            adapter = self._adapter_class()
+            if self.prefetch > 0:
+                adapter = PrefetchAdapter(adapter, lookahead=self.prefetch)
+            self._adapter = adapter
         return self._adapter
 
     @property
     def current(self) -> WorkItem:
-        if self._current is None:
+        current = getattr(self._worker, "current", None) or self._current
+        if current is None:
             raise RuntimeError("No active work item")
 
-        return self._current
+        return current
 
     @current.setter
     def current(self, value):
         if not isinstance(value, WorkItem):
             raise ValueError(f"Not a work item: {value}")
 
-        self._current = value
+        if getattr(self._worker, "input", None) is not None:
+            self._worker.current = value
+        else:
+            self._current = value
 
     @property
     def active_input(self) -> Optional[WorkItem]:
+        worker_input = getattr(self._worker, "input", None)
+        if worker_input is not None:  # within a concurrent iteration worker
+            current = self._worker.current
+            return current if current.parent_id is None else worker_input
         if self._current and self._current.parent_id is None:  # input set as current
             return self._current
         if self.inputs:  # other current item set, and taking the last input
@@ -1133,6 +1610,13 @@ class WorkItems:
         """Robot Framework listener method, called when each task ends."""
         self._release_on_failure(attributes)
 
+    def _close(self):
+        """Robot Framework listener method, called when the library goes out of
+        scope.
+        """
+        if self._adapter is not None:
+            self._adapter.close()
+
     @keyword
     def set_current_work_item(self, item: WorkItem):
         # pylint: disable=anomalous-backslash-in-string
@@ -1635,6 +2119,8 @@ class WorkItems:
         """Get files attached to work item that match given pattern.
         Returns a list of absolute paths to the downloaded files.
 
+        Several files are downloaded concurrently.
+
         :param pattern: Filename wildcard pattern
         :param dirname: Destination directory, if not given robot root is used
 
@@ -1649,14 +2135,14 @@ class WorkItems:
                     Handle customer file    ${path}
                 END
         """
-        paths = []
-        for name in self.list_work_item_files():
-            if fnmatch.fnmatch(name, pattern):
-                if dirname:
-                    path = self.get_work_item_file(name, os.path.join(dirname, name))
-                else:
-                    path = self.get_work_item_file(name)
-                paths.append(path)
+        names = [
+            name
+            for name in self.list_work_item_files()
+            if fnmatch.fnmatch(name, pattern)
+        ]
+        paths = self.current.get_files(names, dirname)
+        for path in paths:
+            logging.info("Downloaded file to: %s", path)
 
         logging.info("Downloaded %d file(s)", len(paths))
         return paths
@@ -1729,6 +2215,119 @@ class WorkItems:
 
         return True
 
+    def _start_prefetch(self, items_limit: int):
+        """Start reserving input work items ahead of time, if enabled,
+        but not more than the iteration is going to process.
+        """
+        if not isinstance(self.adapter, PrefetchAdapter):
+            return
+
+        limit = None
+        if items_limit:
+            active_input = self.active_input
+            unprocessed = bool(active_input and active_input.state is None)
+            limit = items_limit - unprocessed
+        self.adapter.start(limit)
+
+    def _reserve_for_iteration(
+        self, items_limit: int
+    ) -> Iterator[Tuple[WorkItem, bool]]:
+        """Yield input work items to process and whether they need loading."""
+        count = 0
+        active_input = self.active_input
+        if active_input and active_input.state is None:
+            yield active_input, False
+            count += 1
+
+        while not items_limit or count < items_limit:
+            try:
+                item_id = self.adapter.reserve_input()
+            except EmptyQueue:
+                return
+
+            item = WorkItem(item_id=item_id, parent_id=None, adapter=self.adapter)
+            self.inputs.append(item)
+            self._current = item
+            yield item, True
+            count += 1
+
+    def _process_in_worker(
+        self, item: WorkItem, load: bool, to_call: Callable[[], Any]
+    ) -> Any:
+        """Process input work item as the current item of this worker thread."""
+        self._worker.input = self._worker.current = item
+        try:
+            if load:
+                item.load()
+                self._parse_work_item_from_email()
+            result = to_call()
+        except Exception as exc:
+            self.release_input_work_item(
+                State.FAILED,
+                exception_type=Error.APPLICATION,
+                message=str(exc),
+                _internal_release=True,
+            )
+            raise
+        else:
+            self.release_input_work_item(State.DONE, _internal_release=True)
+            return result
+        finally:
+            self._worker.input = self._worker.current = None
+
+    @staticmethod
+    def _collect_results(pending, results, ordered, return_when):
+        """Wait for pending calls, store their results and return the first
+        raised exception, if any.
+        """
+        error = None
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            index = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                error = error or exc
+            else:
+                results[index if ordered else len(results)] = result
+        return error
+
+    def _iterate_concurrently(
+        self,
+        to_call: Callable[[], Any],
+        items_limit: int,
+        workers: int,
+        ordered: bool,
+    ) -> List[Any]:
+        results: Dict[int, Any] = {}
+        pending: Dict[Any, int] = {}
+        error = None
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="WorkItems"
+        ) as executor:
+            items = self._reserve_for_iteration(items_limit)
+            for index, (item, load) in enumerate(items):
+                future = executor.submit(self._process_in_worker, item, load, to_call)
+                pending[future] = index
+                if len(pending) >= workers:
+                    # Reserve the next item only when a worker is free.
+                    error = self._collect_results(
+                        pending, results, ordered, FIRST_COMPLETED
+                    )
+                    if error:
+                        break
+
+            if pending:
+                last_error = self._collect_results(
+                    pending, results, ordered, ALL_COMPLETED
+                )
+                error = error or last_error
+
+        if error:
+            raise error
+        return [results[index] for index in sorted(results)]
+
     @keyword
     def for_each_input_work_item(
         self,
@@ -1736,6 +2335,8 @@ class WorkItems:
         *args,
         items_limit: int = 0,
         return_results: bool = True,
+        workers: int = 1,
+        ordered: bool = True,
         **kwargs,
     ) -> List[Any]:
         """Run a keyword or function for each work item in the input queue.
@@ -1743,6 +2344,16 @@ class WorkItems:
         Automatically collects and returns a list of results, switch
         ``return_results`` to ``False`` for avoiding this.
 
+        With ``workers`` greater than one, a Python function is called for
+        several work items concurrently in a pool of threads, which speeds up
+        I/O bound processing like API calls or uploads. Each worker has its own
+        current work item, so the keywords of this library called from the
+        function operate on the item the worker is processing. A new item is
+        reserved only when a worker is free. Every item is released after its
+        call, as failed with an application error if the call raised an
+        exception. In that case no more items are reserved, and the first
+        exception is raised once all running calls have finished.
+
         :param keyword_or_func: The RF keyword or Py function you want to map through
             all the work items
         :param args: Variable list of arguments that go into the called keyword/function
@@ -1752,6 +2363,10 @@ class WorkItems:
             otherwise all the items are retrieved from the queue until depletion
         :param return_results: Collect and return a list of results given each
             keyword/function call if truthy
+        :param workers: Amount of work items processed concurrently, only
+            supported with Python functions
+        :param ordered: Return the results in the order the work items were
+            reserved if truthy, otherwise in the order the calls finished
 
         Example:
 
@@ -1789,18 +2404,52 @@ class WorkItems:
                 logging.info("Payload lengths: %s", lengths)
 
             log_payloads()
+
+        Python example with concurrent workers:
+
+        .. code-block:: python
+
+            import requests
+            from RPA.Robocorp.WorkItems import WorkItems
+
+            library = WorkItems()
+
+            def submit_order():
+                order = library.get_work_item_variable("order")
+                response = requests.post("https://example.com/orders", json=order)
+                response.raise_for_status()
+                return response.json()["id"]
+
+            order_ids = library.for_each_input_work_item(submit_order, workers=8)
         """
 
         self._raise_under_iteration("iterate input work items")
 
+        if workers > 1 and isinstance(keyword_or_func, str):
+            raise ValueError(
+                "Concurrent iteration supports only Python functions, "
+                "not Robot Framework keywords"
+            )
+
         if isinstance(keyword_or_func, str):
             to_call = lambda: BuiltIn().run_keyword(  # noqa: E731
                 keyword_or_func, *args, **kwargs
             )
         else:
             to_call = lambda: keyword_or_func(*args, **kwargs)  # noqa: E731
-        results = []
 
+        self._start_prefetch(items_limit)
+        if workers > 1:
+            try:
+                self._under_iteration.set()
+                results = self._iterate_concurrently(
+                    to_call, items_limit, workers, ordered
+                )
+            finally:
+                self._under_iteration.clear()
+            return results if return_results else None
+
+        results = []
         try:
             self._under_iteration.set()
             count = 0
@@ -1,14 +1,19 @@
+import functools
+import io
 import json
 import logging
 import os
 import random
+import threading
 import time
 import urllib.parse as urlparse
+import uuid
 from json import JSONDecodeError  # pylint: disable=no-name-in-module
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
 from tenacity import (
@@ -18,6 +23,9 @@ from tenacity import (
     stop_after_attempt,
     wait_random_exponential,
 )
+from urllib3.fields import RequestField
+from urllib3.util.retry import Retry
+import yaml
 
 from RPA.JSON import JSONType
 from RPA.RobotLogListener import RobotLogListener
@@ -28,6 +36,12 @@ PathType = Union[Path, str]
 DEBUG_ON = bool(os.getenv("RPA_DEBUG_API"))
 log_to_console = BuiltIn().log_to_console
 
+# Amount of connections kept alive per host in the shared HTTP session
+DEFAULT_POOL_SIZE = int(os.getenv("RPA_API_POOL_SIZE", "10"))
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
 
 def url_join(*parts):
     """Join parts of URL and handle missing/duplicate slashes."""
@@ -45,6 +59,164 @@ def is_json_equal(left: JSONType, right: JSONType):
     return json_dumps(left, sort_keys=True) == json_dumps(right, sort_keys=True)
 
 
+class ChangeTracker:
+    """Counts the changes made to the containers of a tracked JSON payload.
+
+    Dictionaries and lists added to the payload from outside are kept as they
+    are, as the caller may still modify them, and their changes are found by
+    comparing fingerprints of their contents instead.
+    """
+
+    __slots__ = ("version", "_external")
+
+    def __init__(self):
+        self.version = 0
+        self._external: Dict[int, Any] = {}
+
+    def changed(self):
+        self.version += 1
+
+    def adopt(self, value: Any) -> Any:
+        """Value to add into the payload as it is, fingerprinting it for changes
+        if it's a container which is not tracked by this tracker.
+        """
+        if isinstance(value, (TrackedDict, TrackedList)) and value._tracker is self:
+            return value
+        if isinstance(value, (dict, list)):
+            self._external[id(value)] = value
+        return value
+
+    def state(self) -> Tuple[int, int]:
+        """Count of changes, and fingerprint of the containers from outside."""
+        return self.version, hash(repr(list(self._external.values())))
+
+
+def track_changes(value: JSONType, tracker: ChangeTracker) -> JSONType:
+    """Copy the dictionaries and lists of a JSON payload into ones which count
+    their changes with `tracker`.
+    """
+    if isinstance(value, dict):
+        return TrackedDict(tracker, value)
+    if isinstance(value, list):
+        return TrackedList(tracker, value)
+    return value
+
+
+def untrack_changes(value: JSONType) -> JSONType:
+    """Copy a tracked JSON payload into plain dictionaries and lists."""
+    if isinstance(value, dict):
+        return {key: untrack_changes(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [untrack_changes(item) for item in value]
+    return value
+
+
+def _changes(method: Callable) -> Callable:
+    """Count a change after calling a container's mutating method."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._tracker.changed()  # pylint: disable=protected-access
+        return result
+
+    return wrapper
+
+
+class TrackedDict(dict):
+    """Dictionary which counts its changes."""
+
+    __slots__ = ("_tracker",)
+
+    def __init__(self, tracker: ChangeTracker, items=()):
+        super().__init__(
+            (key, track_changes(value, tracker)) for key, value in dict(items).items()
+        )
+        self._tracker = tracker
+
+    def __reduce__(self):
+        return self.__class__, (self._tracker, dict(self))
+
+    @_changes
+    def __setitem__(self, key, value):
+        super().__setitem__(key, self._tracker.adopt(value))
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    __delitem__ = _changes(dict.__delitem__)
+    clear = _changes(dict.clear)
+    pop = _changes(dict.pop)
+    popitem = _changes(dict.popitem)
+
+
+class TrackedList(list):
+    """List which counts its changes."""
+
+    __slots__ = ("_tracker",)
+
+    def __init__(self, tracker: ChangeTracker, items=()):
+        super().__init__(track_changes(item, tracker) for item in items)
+        self._tracker = tracker
+
+    def __reduce__(self):
+        return self.__class__, (self._tracker, list(self))
+
+    def _track(self, items):
+        return [self._tracker.adopt(item) for item in items]
+
+    @_changes
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = self._track(value)
+        else:
+            value = self._tracker.adopt(value)
+        super().__setitem__(index, value)
+
+    @_changes
+    def __iadd__(self, other):
+        return super().__iadd__(self._track(other))
+
+    @_changes
+    def append(self, value):
+        super().append(self._tracker.adopt(value))
+
+    @_changes
+    def extend(self, values):
+        super().extend(self._track(values))
+
+    @_changes
+    def insert(self, index, value):
+        super().insert(index, self._tracker.adopt(value))
+
+    __delitem__ = _changes(list.__delitem__)
+    __imul__ = _changes(list.__imul__)
+    clear = _changes(list.clear)
+    pop = _changes(list.pop)
+    remove = _changes(list.remove)
+    reverse = _changes(list.reverse)
+    sort = _changes(list.sort)
+
+
+for _dumper in (yaml.SafeDumper, yaml.Dumper):
+    _dumper.add_representer(
+        TrackedDict, yaml.representer.SafeRepresenter.represent_dict
+    )
+    _dumper.add_representer(
+        TrackedList, yaml.representer.SafeRepresenter.represent_list
+    )
+
+
 def truncate(text: str, size: int):
     """Truncate a string from the middle."""
     if len(text) <= size:
@@ -89,6 +261,108 @@ def set_dot_value(source: Dict, key: str, *, value: Any):
     source[keys[-1]] = value
 
 
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """Create an HTTP session which keeps a pool of connections alive
+    between requests, instead of opening a new connection for each one.
+    """
+    # Retrying failed requests is left to `Requests`, so only retry once
+    # when opening a connection fails, e.g. if a pooled connection was closed
+    retries = Retry(total=1, connect=1, read=0, status=0, redirect=False)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Get the HTTP session shared by all Control Room API clients."""
+    global _SESSION  # pylint: disable=global-statement
+
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = create_session()
+        return _SESSION
+
+
+def get_stream_size(fd: BinaryIO) -> int:
+    """Get the amount of bytes left to read in a seekable file object."""
+    position = fd.tell()
+    size = fd.seek(0, os.SEEK_END)
+    fd.seek(position)
+    return size - position
+
+
+class MultipartStream:
+    """Readable ``multipart/form-data`` body with form fields and one file,
+    which streams the file's content from the given file object instead of
+    loading it in memory.
+
+    Having a length and being seekable, it can be sent as request ``data``
+    with a ``Content-Length`` header, and sent again when retrying.
+    """
+
+    def __init__(self, fields: Dict[str, str], name: str, filename: str, fd: BinaryIO):
+        boundary = uuid.uuid4().hex
+        #: Value for the ``Content-Type`` header of the request
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        # Headers of the parts are rendered the same way as done by `requests`.
+        head = io.BytesIO()
+        for key, value in fields.items():
+            field = RequestField.from_tuples(key, value)
+            head.write(f"--{boundary}\r\n".encode("latin-1"))
+            head.write(field.render_headers().encode("latin-1"))
+            head.write(f"{value}\r\n".encode("utf-8"))
+        # Like `requests`, no content type is guessed for the file.
+        field = RequestField(name, b"", filename=filename)
+        field.make_multipart()
+        head.write(f"--{boundary}\r\n".encode("latin-1"))
+        head.write(field.render_headers().encode("latin-1"))
+        head.seek(0)
+        tail = f"\r\n--{boundary}--\r\n"
+
+        self._start = fd.tell()
+        self._parts: List[BinaryIO] = [
+            head,
+            fd,
+            io.BytesIO(tail.encode("utf-8")),
+        ]
+        self._length = sum(get_stream_size(part) for part in self._parts)
+        self._index = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        while self._index < len(self._parts) and size != 0:
+            chunk = self._parts[self._index].read(size)
+            if not chunk:
+                self._index += 1
+                continue
+
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+
+        return b"".join(chunks)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if (offset, whence) != (0, os.SEEK_SET):
+            raise io.UnsupportedOperation("Can only seek to the beginning")
+
+        head, fd, tail = self._parts
+        head.seek(0)
+        fd.seek(self._start)
+        tail.seek(0)
+        self._index = 0
+        return 0
+
+
 class RequestsHTTPError(HTTPError):
     """Custom `requests` HTTP error with status code and message."""
 
@@ -102,11 +376,21 @@ class RequestsHTTPError(HTTPError):
 
 
 class Requests:
-    """Wrapper over `requests` 3rd-party with error handling and retrying support."""
+    """Wrapper over `requests` 3rd-party with error handling and retrying support.
 
-    def __init__(self, route_prefix: str, default_headers: Optional[dict] = None):
+    Requests are sent with a pooled ``session``, which is by default shared
+    by all the instances, so that connections to the same host are reused.
+    """
+
+    def __init__(
+        self,
+        route_prefix: str,
+        default_headers: Optional[dict] = None,
+        session: Optional[requests.Session] = None,
+    ):
         self._route_prefix = route_prefix
         self._default_headers = default_headers
+        self._session = session if session is not None else get_session()
 
     def handle_error(self, response: requests.Response):
         resp_status_code = response.status_code
@@ -232,6 +516,11 @@ class Requests:
             url_for_log = urlparse.urlunsplit(
                 [split.scheme, split.netloc, split.path, "", split.fragment]
             )
+        body = kwargs.get("data")
+        if hasattr(body, "seek"):
+            # Streamed bodies are sent again from the start when retrying.
+            body.seek(0)
+
         log_more("%s %r", verb.__name__.upper(), url_for_log)
         response = verb(url, *args, headers=headers, **kwargs)
         handle_error(response)
@@ -239,19 +528,19 @@ class Requests:
 
     # CREATE
     def post(self, *args, **kwargs) -> requests.Response:
-        return self._request(requests.post, *args, **kwargs)
+        return self._request(self._session.post, *args, **kwargs)
 
     # RETRIEVE
     def get(self, *args, **kwargs) -> requests.Response:
-        return self._request(requests.get, *args, **kwargs)
+        return self._request(self._session.get, *args, **kwargs)
 
     # UPDATE
     def put(self, *args, **kwargs) -> requests.Response:
-        return self._request(requests.put, *args, **kwargs)
+        return self._request(self._session.put, *args, **kwargs)
 
     # DELETE
     def delete(self, *args, **kwargs) -> requests.Response:
-        return self._request(requests.delete, *args, **kwargs)
+        return self._request(self._session.delete, *args, **kwargs)
 
 
 def protect_keywords(base: str, keywords: List[str]):
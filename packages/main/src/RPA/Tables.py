@@ -1,10 +1,18 @@
+import bisect
 import copy
 import csv
+import heapq
 import logging
+import math
 import re
 from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
 from enum import Enum
-from itertools import groupby, zip_longest
+from functools import partial
+from itertools import groupby, islice, repeat, zip_longest
 from keyword import iskeyword
 from numbers import Number
 from operator import itemgetter
@@ -33,6 +41,10 @@ Row = Union[Dict, List, Tuple, NamedTuple, set]
 Data = Optional[Union[Dict[Column, Row], List[Row], "Table"]]
 CellCondition = Callable[[Any], bool]
 RowCondition = Callable[[Union[Index, Row]], bool]
+DataType = Union[str, Callable[[str], Any]]
+
+# Amount of rows used for deducing the types of CSV columns
+INFER_TYPES_SAMPLE_SIZE = 100
 
 
 def return_table_as_raw_list(table, heading=False):
@@ -92,9 +104,122 @@ def to_condition(operator: str, value: Any) -> CellCondition:
     if not condition:
         raise ValueError(f"Unknown operator: {operator}")
 
+    # Allow table indexes to answer the condition without evaluating it
+    condition.operator = operator
+    condition.value = value
+
     return condition
 
 
+def to_bool(value: str) -> bool:
+    """Convert string representation of boolean into a boolean."""
+    lowered = value.strip().lower()
+    if lowered == "true":
+        return True
+    elif lowered == "false":
+        return False
+    else:
+        raise ValueError(f"Not a boolean value: {value}")
+
+
+DATA_TYPES: Dict[str, Callable[[str], Any]] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "decimal": Decimal,
+    "bool": to_bool,
+    "date": date.fromisoformat,
+    "datetime": datetime.fromisoformat,
+}
+
+# Types tried in order when deducing the type of string values
+INFERRED_TYPES = ("bool", "int", "float", "date", "datetime")
+
+
+def to_converter(dtype: DataType, strict: bool = True) -> Callable[[str], Any]:
+    """Convert type name or callable into a function which converts
+    string values into that type. Empty strings are converted to None.
+
+    If not ``strict``, values which fail conversion are returned as-is.
+    """
+    if callable(dtype):
+        func = dtype
+    else:
+        name = str(dtype).lower().strip()
+        if name not in DATA_TYPES:
+            options = ", ".join(DATA_TYPES)
+            raise ValueError(f"Unknown data type: {dtype}, available types: {options}")
+        func = DATA_TYPES[name]
+
+    def convert(value: str) -> Any:
+        if value == "":
+            return None
+        try:
+            return func(value)
+        except (ValueError, TypeError, InvalidOperation) as err:
+            if strict:
+                raise ValueError(f"Unable to convert value: {value!r}") from err
+            return value
+
+    return convert
+
+
+def infer_type(values: Iterable[str]) -> Optional[str]:
+    """Deduce the most specific type which all the non-empty
+    string values can be converted to, or None if not found.
+
+    Values like ``nan`` or ``inf`` are accepted for floats, but at least
+    one value has to be a finite number.
+    """
+    values = [value for value in values if value is not None and value != ""]
+    if not values:
+        return None
+
+    for name in INFERRED_TYPES:
+        func = DATA_TYPES[name]
+        try:
+            converted = [func(value) for value in values]
+        except (ValueError, TypeError):
+            continue
+        if name == "float" and not any(math.isfinite(value) for value in converted):
+            continue
+        return name
+
+    return None
+
+
+def _aggregate_mean(values: List[Any]) -> Any:
+    return sum(values) / len(values) if values else None
+
+
+AGGREGATES: Dict[str, Callable[[List[Any]], Any]] = {
+    "sum": sum,
+    "count": len,
+    "min": lambda values: min(values) if values else None,
+    "max": lambda values: max(values) if values else None,
+    "mean": _aggregate_mean,
+    "first": lambda values: values[0] if values else None,
+    "last": lambda values: values[-1] if values else None,
+}
+
+Aggregate = Union[str, Callable[[List[Any]], Any]]
+
+
+def to_aggregate(function: Aggregate) -> Callable[[List[Any]], Any]:
+    """Convert aggregate name or callable into a function which
+    reduces a list of values into a single value.
+    """
+    if callable(function):
+        return function
+
+    name = str(function).lower().strip()
+    if name not in AGGREGATES:
+        options = ", ".join(AGGREGATES)
+        raise ValueError(f"Unknown aggregate: {function}, available: {options}")
+
+    return AGGREGATES[name]
+
+
 def if_none(value: Any, default: Any):
     """Return default if value is None."""
     return value if value is not None else default
@@ -121,6 +246,146 @@ class Dialect(Enum):
     Unix = "unix"
 
 
+class JoinType(Enum):
+    """Which keys are kept when merging tables by index"""
+
+    Outer = "outer"
+    Inner = "inner"
+    Left = "left"
+
+
+class DuplicateKeys(Enum):
+    """How repeated keys within one table are handled when merging by index"""
+
+    Update = "update"
+    First = "first"
+    Error = "error"
+
+
+class PoolType(Enum):
+    """Which kind of worker pool is used for mapping values in parallel"""
+
+    Thread = "thread"
+    Process = "process"
+
+
+def _apply_with_args(func: Callable[..., Any], args: Tuple[Any, ...], value: Any):
+    """Call function with value and additional arguments, in a picklable way."""
+    return func(value, *args)
+
+
+def _map_chunk(func: Callable[[Any], Any], values: List[Any]) -> List[Any]:
+    """Map a chunk of values in a worker of a pool."""
+    return [func(value) for value in values]
+
+
+class TableIndex:
+    """Index of table rows by the values in one or more columns.
+
+    Maps every value, or tuple of values for multiple columns, to the
+    ascending locations of the rows which have it. If ``ordered``, the
+    distinct values are also kept sorted for range lookups.
+
+    :param cols:    Locations of indexed columns
+    :param ordered: Support range lookups
+    """
+
+    def __init__(self, cols: List[int], ordered: bool = False):
+        self.cols = list(cols)
+        self.ordered = ordered
+        self.stale = True
+        self._rows: Dict[Any, List[int]] = {}
+        self._keys: Optional[List[Any]] = None
+
+    def build(self, keys: Iterable[Any]):
+        """Create index from the keys of all rows, in row order."""
+        rows: Dict[Any, List[int]] = {}
+        for idx, key in enumerate(keys):
+            if key in rows:
+                rows[key].append(idx)
+            else:
+                rows[key] = [idx]
+
+        self._rows = rows
+        self._keys = None
+        self.stale = False
+
+    def add(self, idx: int, key: Any):
+        """Add row location with given key."""
+        if self.stale:
+            return
+        try:
+            rows = self._rows.get(key)
+        except TypeError:
+            # Unhashable value, can't be indexed until removed
+            self.stale = True
+            return
+
+        if rows is None:
+            self._rows[key] = [idx]
+            self._keys = None
+        else:
+            bisect.insort(rows, idx)
+
+    def discard(self, idx: int, key: Any):
+        """Remove row location with given key."""
+        if self.stale:
+            return
+        rows = self._rows[key]
+        rows.remove(idx)
+        if not rows:
+            del self._rows[key]
+            self._keys = None
+
+    def lookup(self, value: Any) -> List[int]:
+        """Find rows where key is equal to value."""
+        return list(self._rows.get(value, ()))
+
+    def lookup_any(self, values: Iterable[Any]) -> List[int]:
+        """Find rows where key is equal to any of the values."""
+        found = set()
+        for value in set(values):
+            found.update(self._rows.get(value, ()))
+        return sorted(found)
+
+    def lookup_range(self, operator: str, value: Any) -> List[int]:
+        """Find rows where key compares to value with given operator,
+        ignoring None keys.
+        """
+        if self._keys is None:
+            self._keys = sorted(key for key in self._rows if key is not None)
+
+        keys = self._keys
+        if operator == ">":
+            selected = keys[bisect.bisect_right(keys, value) :]
+        elif operator == ">=":
+            selected = keys[bisect.bisect_left(keys, value) :]
+        elif operator == "<":
+            selected = keys[: bisect.bisect_left(keys, value)]
+        elif operator == "<=":
+            selected = keys[: bisect.bisect_right(keys, value)]
+        else:
+            raise ValueError(f"Unsupported range operator: {operator}")
+
+        return sorted(idx for key in selected for idx in self._rows[key])
+
+    def query(self, operator: str, value: Any) -> Optional[List[int]]:
+        """Find rows where key matches the operator and value, as defined
+        in `to_condition`, or return None if not supported by this index.
+        """
+        try:
+            if operator == "==":
+                return self.lookup(value)
+            if operator == "in" and isinstance(value, (list, tuple, set, frozenset)):
+                return self.lookup_any(value)
+            if operator in (">", ">=", "<", "<=") and self.ordered:
+                return self.lookup_range(operator, value)
+        except TypeError:
+            # Unhashable or incomparable value
+            pass
+        return None
+
+
 class Table:
     """Container class for tabular data.
 
@@ -140,6 +405,9 @@ class Table:
     def __init__(self, data: Data = None, columns: Optional[List[str]] = None):
         self._data = []
         self._columns = []
+        self._indexes: List[TableIndex] = []
+        # Storage may be shared with views of this table, or vice versa
+        self._shared = False
 
         # Use public setter to validate data
         if columns is not None:
@@ -175,6 +443,18 @@ class Table:
         """Initialize table from list-like container."""
         # Assume data is homogenous in regard to row type
         obj = data[0]
+
+        # Plain sequences with predefined columns can be copied as-is
+        if (
+            self._columns
+            and is_list_like(obj)
+            and not is_namedtuple(obj)
+            and not is_dict_like(obj)
+            and not isinstance(obj, set)
+        ):
+            self._init_list_of_lists(data)
+            return
+
         column_names = self._column_name_getter(obj)
         column_values = self._column_value_getter(obj)
 
@@ -209,7 +489,17 @@ class Table:
                 col = self.column_location(column_dst)
                 row[col] = column_values(obj, column_src)
 
-            self._data.append(row)
+            self._append_data_row(row)
+
+    def _init_list_of_lists(self, data: List[Any]):
+        """Initialize table from sequences with values in column order."""
+        width = len(self._columns)
+        for obj in data:
+            if len(obj) > width:
+                raise ValueError(f"Data had more than defined {width} columns")
+            row = list(obj)
+            row.extend([None] * (width - len(row)))
+            self._append_data_row(row)
 
     def _init_dict(self, data: Dict[Column, Row]):
         """Initialize table from dict-like container."""
@@ -238,7 +528,7 @@ class Table:
     def __eq__(self, other: Any):
         if not isinstance(other, Table):
             return False
-        return self._columns == other._columns and self._data == other._data
+        return self._columns == other._columns and self.data == other.data
 
     @property
     def data(self):
@@ -348,9 +638,11 @@ class Table:
             raise ValueError(f"Unknown columns: {names}")
 
         cols = [self.column_location(column) for column in order]
+        if cols == list(range(len(self._columns))):
+            return
 
         self._columns = [self._columns[col] for col in cols]
-        self._data = [[row[col] for col in cols] for row in self._data]
+        self._take_columns(cols)
 
     def _validate_self(self):
         """Validate that internal data is valid and coherent."""
@@ -367,14 +659,15 @@ class Table:
         except ValueError as err:
             raise ValueError(f"Index is not a number: {value}") from err
 
+        size = self.size
         if value < 0:
-            value += self.size
+            value += size
 
-        if self.size == 0:
+        if size == 0:
             raise IndexError("No rows in table")
 
-        if (value < 0) or (value >= self.size):
-            raise IndexError(f"Index ({value}) out of range (0..{self.size - 1})")
+        if (value < 0) or (value >= size):
+            raise IndexError(f"Index ({value}) out of range (0..{size - 1})")
 
         return value
 
@@ -462,18 +755,28 @@ class Table:
         """Create a copy of this table."""
         return copy.deepcopy(self)
 
+    def _copy(self):
+        """Create a copy of this table, which shares storage with this table
+        until either of them is modified. Cell values are not copied.
+        """
+        table = self._view()
+        table._indexes = [
+            TableIndex(index.cols, index.ordered) for index in self._indexes
+        ]
+        return table
+
     def clear(self):
         """Remove all rows from this table."""
-        self._data = []
+        self._take_rows([])
 
     def head(self, rows, as_list=False):
         """Return first n rows of table."""
-        indexes = self.index[: int(rows)]
+        indexes = list(range(self.size)[: int(rows)])
         return self.get_table(indexes, as_list=as_list)
 
     def tail(self, rows, as_list=False):
         """Return last n rows of table."""
-        indexes = self.index[-int(rows) :]
+        indexes = list(range(self.size)[-int(rows) :])
         return self.get_table(indexes, as_list=as_list)
 
     def get(self, indexes=None, columns=None, as_list=False):
@@ -491,7 +794,7 @@ class Table:
         :param indexes: List of indexes, or all if not given
         :param columns: List of columns, or all if not given
         """
-        indexes = if_none(indexes, self.index)
+        indexes = self.index if indexes is None else indexes
         columns = if_none(columns, self._columns)
 
         if is_list_like(indexes) and is_list_like(columns):
@@ -540,9 +843,12 @@ class Table:
         :param indexes: Row indexes to include, or all if not given
         :param as_list: Return column as dictionary, instead of list
         """
-        indexes = if_none(indexes, self.index)
         col = self.column_location(column)
 
+        if indexes is None:
+            values = [row[col] for row in self._data]
+            return values if as_list else dict(enumerate(values))
+
         if as_list:
             column = []
             for index in indexes:
@@ -558,25 +864,77 @@ class Table:
 
     def get_table(self, indexes=None, columns=None, as_list=False):
         """Get a new table from all cells matching indexes and columns."""
-        indexes = if_none(indexes, self.index)
+        indexes = self.index if indexes is None else indexes
         columns = if_none(columns, self._columns)
 
-        if indexes == self.index and columns == self._columns:
-            return self.copy()
+        if (
+            len(indexes) == self.size
+            and indexes == self.index
+            and columns == self._columns
+        ):
+            return self._copy()
 
         idxs = [self.index_location(index) for index in indexes]
         cols = [self.column_location(column) for column in columns]
-        data = [[self._data[idx][col] for col in cols] for idx in idxs]
 
         if as_list:
-            return data
+            return [[self._data[idx][col] for col in cols] for idx in idxs]
         else:
-            return Table(data=data, columns=columns)
+            return self._view(idxs, cols, columns)
+
+    def _view(
+        self,
+        idxs: Optional[List[int]] = None,
+        cols: Optional[List[int]] = None,
+        names: Optional[List[Column]] = None,
+    ) -> "Table":
+        """Create table from the rows and columns in the given locations,
+        or all of them if not given, optionally with new column names.
+
+        Rows with all the columns are shared with the new table, and copied
+        only when either table modifies them.
+        """
+        if idxs is None:
+            rows = list(self._data)
+        else:
+            rows = [self._data[idx] for idx in idxs]
+
+        if cols is None:
+            cols = list(range(len(self._columns)))
+        columns = [self._columns[col] for col in cols] if names is None else names
+
+        if cols == list(range(len(self._columns))):
+            table = self._from_rows(list(columns), rows)
+            if rows:
+                table._shared = self._shared = True
+        else:
+            rows = [[row[col] for col in cols] for row in rows]
+            table = self._from_rows(list(columns), rows)
+
+        return table
+
+    def _own_data(self):
+        """Copy storage which is shared with other tables,
+        before modifying it in-place.
+        """
+        if self._shared:
+            self._data = [list(row) for row in self._data]
+            self._shared = False
+
+    @classmethod
+    def _from_rows(cls, columns: List[Column], rows: List[List[Any]]) -> "Table":
+        """Create table directly from rows which are already in column order,
+        without copying them.
+        """
+        table = cls(columns=columns)
+        table._data = rows
+        table._validate_self()
+        return table
 
     def get_slice(self, start: Optional[Index] = None, end: Optional[Index] = None):
         """Get a new table from rows between start and end index."""
         index = self._slice_index(slice(start, end))
-        return self.get_table(index, self._columns)
+        return self._view(index)
 
     def _add_row(self, index):
         """Add a new empty row into the table."""
@@ -589,7 +947,9 @@ class Table:
         for empty in range(self.size, index):
             self._add_row(empty)
 
-        self._data.append([None] * len(self._columns))
+        self._append_data_row([None] * len(self._columns))
+        if self._indexes:
+            self._index_row(self.size - 1)
 
         return self.size - 1
 
@@ -607,12 +967,115 @@ class Table:
                 self._add_column(empty)
 
         self._columns.append(column)
-        for idx in self.index:
-            row = self._data[idx]
-            row.append(None)
+        self._append_data_column()
 
         return len(self._columns) - 1
 
+    def _append_data_row(self, row: List[Any]):
+        """Append a row of values, in column order, into the storage."""
+        self._data.append(row)
+
+    def _append_data_column(self):
+        """Append an empty column into the storage."""
+        self._own_data()
+        for row in self._data:
+            row.append(None)
+
+    def _remove_data_column(self, col: int):
+        """Remove a column, by location, from the storage."""
+        self._own_data()
+        for row in self._data:
+            del row[col]
+
+    def _take_data_rows(self, idxs: List[int]):
+        """Keep only the rows in the given locations, in the given order."""
+        self._data = [self._data[idx] for idx in idxs]
+
+    def _take_data_columns(self, cols: List[int]):
+        """Keep only the columns in the given locations, in the given order."""
+        self._data = [[row[col] for col in cols] for row in self._data]
+        self._shared = False
+
+    def _get_data_cell(self, idx: int, col: int) -> Any:
+        """Get value from the storage by row and column location."""
+        return self._data[idx][col]
+
+    def _set_data_cell(self, idx: int, col: int, value: Any):
+        """Set value in the storage by row and column location."""
+        self._own_data()
+        self._data[idx][col] = value
+
+    def _set_data_row(self, idx: int, row: List[Any]):
+        """Replace a row of values, in column order, in the storage."""
+        self._data[idx] = row
+
+    def _set_data_column(self, col: int, values: List[Any]):
+        """Replace the values of a column in the storage."""
+        self._own_data()
+        for row, value in zip(self._data, values):
+            row[col] = value
+
+    def _take_rows(self, idxs: List[int]):
+        """Keep only the rows in the given locations, in the given order."""
+        self._take_data_rows(idxs)
+        for index in self._indexes:
+            index.stale = True
+
+    def _take_columns(self, cols: List[int]):
+        """Keep only the columns in the given locations, in the given order."""
+        self._take_data_columns(cols)
+        self._indexes = []
+
+    def create_index(self, columns: Union[Column, List[Column]], ordered=False):
+        """Create an index for finding rows by the values in one or more columns.
+
+        The index is used automatically when finding or filtering rows with
+        conditions created by `to_condition`, for the ``==`` and ``in``
+        operators, and for the range operators if `ordered` is true.
+        It's kept up to date when cells and rows are added or modified,
+        and rebuilt when needed after rows are removed or reordered.
+
+        :param columns: Column, or list of columns, to index
+        :param ordered: Support range operators, e.g. ``<`` and ``>=``
+        """
+        cols = [self.column_location(column) for column in to_list(columns)]
+        index = TableIndex(cols, ordered)
+        try:
+            self._build_index(index)
+        except TypeError as err:
+            raise ValueError(f"Column values are not hashable: {err}") from err
+
+        self._indexes = [other for other in self._indexes if other.cols != cols]
+        self._indexes.append(index)
+
+    def drop_index(self, columns: Union[Column, List[Column]]):
+        """Remove index created for columns, if it exists."""
+        cols = [self.column_location(column) for column in to_list(columns)]
+        self._indexes = [index for index in self._indexes if index.cols != cols]
+
+    def _build_index(self, index: TableIndex):
+        """Create index from the current values of its columns."""
+        values = [self._column_values(col) for col in index.cols]
+        index.build(values[0] if len(values) == 1 else zip(*values))
+
+    def _index_key(self, index: TableIndex, idx: int) -> Any:
+        """Key of row, by location, in given index."""
+        if len(index.cols) == 1:
+            return self._get_data_cell(idx, index.cols[0])
+        return tuple(self._get_data_cell(idx, col) for col in index.cols)
+
+    def _index_row(self, idx: int, col: Optional[int] = None):
+        """Add row to indexes, or only those which include column."""
+        for index in self._indexes:
+            if col is None or col in index.cols:
+                index.add(idx, self._index_key(index, idx))
+
+    def _unindex_row(self, idx: int, col: Optional[int] = None):
+        """Remove row from indexes, or only those which include column."""
+        for index in self._indexes:
+            if col is None or col in index.cols:
+                index.discard(idx, self._index_key(index, idx))
+
     def set(self, indexes=None, columns=None, values=None):
         """Sets multiple cell values at a time.
 
@@ -651,7 +1114,12 @@ class Table:
         except (IndexError, ValueError):
             col = self._add_column(column)
 
-        self._data[idx][col] = value
+        if self._indexes:
+            self._unindex_row(idx, col)
+            self._set_data_cell(idx, col, value)
+            self._index_row(idx, col)
+        else:
+            self._set_data_cell(idx, col, value)
 
     def set_row(self, index, values):
         """Set values in row. If index is missing, it is created."""
@@ -663,7 +1131,12 @@ class Table:
         column_values = self._column_value_getter(values)
         row = [column_values(values, column) for column in self._columns]
 
-        self._data[idx] = row
+        if self._indexes:
+            self._unindex_row(idx)
+            self._set_data_row(idx, row)
+            self._index_row(idx)
+        else:
+            self._set_data_row(idx, row)
 
     def set_column(self, column, values):
         """Set values in column. If column is missing, it is created."""
@@ -675,10 +1148,14 @@ class Table:
             )
 
         if column not in self._columns:
-            self._add_column(column)
+            col = self._add_column(column)
+        else:
+            col = self.column_location(column)
 
-        for index in self.index:
-            self.set_cell(index, column, values[index])
+        self._set_data_column(col, values)
+        for index in self._indexes:
+            if col in index.cols:
+                index.stale = True
 
     def append_row(self, row=None):
         """Append new row to table."""
@@ -704,8 +1181,8 @@ class Table:
             names = ", ".join(str(name) for name in unknown)
             raise ValueError(f"Unable to remove unknown rows: {names}")
 
-        for index in sorted(indexes, reverse=True):
-            del self._data[index]
+        removed = set(indexes)
+        self._take_rows([idx for idx in self.index if idx not in removed])
 
     def delete_columns(self, columns):
         """Remove columns with matching names."""
@@ -718,10 +1195,14 @@ class Table:
 
         for column in columns:
             col = self.column_location(column)
-            for idx in self.index:
-                del self._data[idx][col]
+            self._remove_data_column(col)
             del self._columns[col]
 
+            # Remove indexes of the column, and move the following columns
+            self._indexes = [index for index in self._indexes if col not in index.cols]
+            for index in self._indexes:
+                index.cols = [other - (other > col) for other in index.cols]
+
     def append_table(self, table):
         """Append data from table to current data."""
         if not table:
@@ -734,44 +1215,81 @@ class Table:
 
         self.set(indexes=indexes, columns=table.columns, values=table.data)
 
-    def sort_by_column(self, columns, ascending=False):
-        """Sort table by columns."""
+    def sort_by_column(
+        self,
+        columns: Union[Column, List[Column]],
+        ascending: Union[bool, List[bool]] = False,
+        limit: Optional[int] = None,
+    ):
+        """Sort table by columns.
+
+        Values of different types are ordered by their type name, after
+        numbers, and None values are ordered before all other values.
+        Rows with equal values keep their original order.
+
+        :param columns:   Column, or list of columns, to sort by
+        :param ascending: Sort order, or list of sort orders per column
+        :param limit:     Keep only this amount of rows from the start
+                          of the sorted table
+        """
         columns = to_list(columns)
+        ascending = to_list(ascending, len(columns))
+        if len(ascending) != len(columns):
+            raise ValueError("Sort order should be given for each column")
 
-        # Create sort criteria list, with each row as tuple of column values
-        values = (self.get_column(column, as_list=True) for column in columns)
-        values = list(zip(*values))
-        assert len(values) == self.size
-
-        def sorter(row):
-            """Sort table by given values, while allowing for disparate types.
-            Order priority:
-                - Values by typename
-                - Numeric types
-                - None values
-            """
-            criteria = []
-            for value in row[1]:  # Ignore enumeration
-                criteria.append(
-                    (
-                        value is not None,
-                        "" if isinstance(value, Number) else type(value).__name__,
-                        value,
-                    )
-                )
-            return criteria
+        keys = [
+            self._sort_keys(self._column_values(self.column_location(column)))
+            for column in columns
+        ]
 
-        # Store original index order using enumerate() before sort,
-        # and use it to sort data later
-        values = sorted(enumerate(values), key=sorter, reverse=not ascending)
-        idxs = [value[0] for value in values]
+        size = self.size
+        if limit is not None and int(limit) < size and len(set(ascending)) <= 1:
+            # Select the top rows with a heap instead of sorting everything
+            limit = max(int(limit), 0)
+            key = keys[0] if len(keys) == 1 else list(zip(*keys))
+            select = heapq.nsmallest if ascending[0] else heapq.nlargest
+            idxs = select(limit, range(size), key=key.__getitem__)
+        else:
+            # Stable sort by each column in turn, starting from the last one
+            idxs = list(range(size))
+            for key, order in reversed(list(zip(keys, ascending))):
+                idxs.sort(key=key.__getitem__, reverse=not order)
+            if limit is not None:
+                del idxs[max(int(limit), 0) :]
 
-        # Re-order data
-        self._data = [self._data[idx] for idx in idxs]
+        self._take_rows(idxs)
+
+    @staticmethod
+    def _sort_keys(values: List[Any]) -> List[Any]:
+        """Create sort keys for column values, while allowing for disparate types.
+        Order priority:
+            - None values
+            - Numeric types
+            - Values by typename
+
+        Values are used as-is when they are all numbers or of the same type.
+        """
+        types = set(map(type, values))
+        nullable = type(None) in types
+        types.discard(type(None))
+
+        if len(types) <= 1 or all(issubclass(typ, Number) for typ in types):
+            if not nullable:
+                return values
+            return [(value is not None, value) for value in values]
+
+        return [
+            (
+                value is not None,
+                "" if isinstance(value, Number) else type(value).__name__,
+                value,
+            )
+            for value in values
+        ]
 
     def group_by_column(self, column):
         """Group rows by column value and return as list of tables."""
-        ref = self.copy()
+        ref = self._copy()
         ref.sort_by_column(column)
 
         col = self.column_location(column)
@@ -780,15 +1298,78 @@ class Table:
         result = []
         ref.clear()
         for _, group in groups:
-            table = ref.copy()
+            table = ref._copy()
             table.append_rows(group)
             result.append(table)
 
         return result
 
+    def group_and_aggregate(
+        self,
+        columns: Union[Column, List[Column]],
+        aggregations: List[Tuple[Column, Optional[Column], Aggregate]],
+    ) -> "Table":
+        """Group rows by the values of `columns` and reduce each group
+        into one row of aggregated values.
+
+        Groups are found in one pass over the rows using a hash of
+        the grouping values, and are returned in order of first appearance.
+        The grouping values must be hashable.
+
+        :param columns:      Column, or list of columns, to group by
+        :param aggregations: List of (name, column, function) triples, where
+                             function is a name in `AGGREGATES` or a callable.
+                             It's called with the group's values of `column`,
+                             excluding None values, or with the row indexes
+                             of the group if `column` is None
+        :return:             Table with the grouping columns and one column
+                             per aggregation
+        """
+        columns = to_list(columns)
+        cols = [self.column_location(column) for column in columns]
+
+        keys = [self._column_values(col) for col in cols]
+        keys = keys[0] if len(keys) == 1 else zip(*keys)
+
+        groups: Dict[Any, List[int]] = {}
+        try:
+            for idx, key in enumerate(keys):
+                group = groups.get(key)
+                if group is None:
+                    groups[key] = [idx]
+                else:
+                    group.append(idx)
+        except TypeError as err:
+            raise ValueError(f"Column values are not hashable: {err}") from err
+
+        if len(cols) == 1:
+            data = [[key] for key in groups]
+        else:
+            data = [list(key) for key in groups]
+
+        names = []
+        for name, column, function in aggregations:
+            func = to_aggregate(function)
+            if column is None:
+                values = None
+            else:
+                values = self._column_values(self.column_location(column))
+
+            for row, idxs in zip(data, groups.values()):
+                if values is None:
+                    group = idxs
+                else:
+                    group = [values[idx] for idx in idxs]
+                    group = [value for value in group if value is not None]
+                row.append(func(group))
+
+            names.append(name)
+
+        columns = [self._columns[col] for col in cols]
+        return self._from_rows(columns + names, data)
+
     def _filter(self, condition: RowCondition):
-        filtered = list(filter(lambda idx: not condition(idx), self.index))
-        self.delete_rows(filtered)
+        self._take_rows([idx for idx in self.index if condition(idx)])
 
     def filter_all(self, condition: RowCondition):
         """Remove rows by evaluating `condition` for every row.
@@ -809,16 +1390,465 @@ class Table:
         The filtering will be done in-place and all the rows where it evaluates to
         falsy are removed.
         """
+        self.filter_by_conditions([(column, condition)])
+
+    def filter_by_conditions(
+        self, conditions: List[Tuple[Column, CellCondition]], match: str = "all"
+    ):
+        """Remove rows by evaluating `conditions` for cells in their columns.
+
+        The filtering will be done in-place and all the rows not matching
+        the conditions, as defined by `match`, are removed.
+        """
+        self._take_rows(self.find_indexes(conditions, match))
+
+    def find_indexes(
+        self, conditions: List[Tuple[Column, CellCondition]], match: str = "all"
+    ) -> List[int]:
+        """Find indexes of rows where cells match the given conditions.
+
+        :param conditions: List of (column, condition) pairs
+        :param match:      Either ``all`` to require every condition to be
+                           true, or ``any`` to require at least one
+        """
+        match = str(match).lower().strip()
+        if match not in ("all", "any"):
+            raise ValueError(f"Unknown match type: {match}")
+
+        # Resolve every column only once
+        resolved = [
+            (self.column_location(column), condition)
+            for column, condition in conditions
+        ]
+
+        if not resolved:
+            return self.index if match == "all" else []
+
+        if self._indexes:
+            found = self._find_indexed(resolved, match)
+            if found is not None:
+                return found
+
+        pairs = [(self._column_values(col), condition) for col, condition in resolved]
+
+        if len(pairs) == 1:
+            values, condition = pairs[0]
+            return [idx for idx, value in enumerate(values) if condition(value)]
+
+        if match == "all":
+            # Narrow down the candidates with each condition
+            idxs = range(self.size)
+            for values, condition in pairs:
+                idxs = [idx for idx in idxs if condition(values[idx])]
+            return list(idxs)
+
+        # Only test the rows not matched by previous conditions
+        matched = set()
+        remaining = range(self.size)
+        for values, condition in pairs:
+            found = [idx for idx in remaining if condition(values[idx])]
+            matched.update(found)
+            remaining = [idx for idx in remaining if idx not in matched]
+        return sorted(matched)
+
+    def _find_indexed(
+        self, resolved: List[Tuple[int, CellCondition]], match: str
+    ) -> Optional[List[int]]:
+        """Find rows matching conditions with the help of indexes,
+        or return None if they can't be used.
+        """
+        if match == "any":
+            found = set()
+            for col, condition in resolved:
+                idxs = self._index_lookup(col, condition)
+                if idxs is None:
+                    return None
+                found.update(idxs)
+            return sorted(found)
+
+        candidates = None
+        for col, condition in resolved:
+            candidates = self._index_lookup(col, condition)
+            if candidates is not None:
+                break
+        else:
+            # Index of multiple columns with equality conditions for all of them
+            equals = {
+                col: condition.value
+                for col, condition in resolved
+                if getattr(condition, "operator", None) == "=="
+            }
+            for index in self._indexes:
+                if len(index.cols) > 1 and all(col in equals for col in index.cols):
+                    index = self._get_index(index.cols)
+                    if index is not None:
+                        key = tuple(equals[col] for col in index.cols)
+                        candidates = index.query("==", key)
+                    break
+
+        if candidates is None:
+            return None
+
+        return [
+            idx
+            for idx in candidates
+            if all(
+                condition(self._get_data_cell(idx, col)) for col, condition in resolved
+            )
+        ]
+
+    def _get_index(self, cols: List[int]) -> Optional[TableIndex]:
+        """Get up to date index of given columns, if it exists."""
+        index = next((index for index in self._indexes if index.cols == cols), None)
+        if index is not None and index.stale:
+            try:
+                self._build_index(index)
+            except TypeError:
+                return None
+        return index
+
+    def _index_lookup(self, col: int, condition: CellCondition) -> Optional[List[int]]:
+        """Find rows with the index of a column, if it exists and
+        supports the condition. Otherwise returns None.
+        """
+        index = self._get_index([col])
+        if index is None or not hasattr(condition, "operator"):
+            return None
+        return index.query(condition.operator, condition.value)
+
+    def _column_values(self, col: int) -> List[Any]:
+        """Values of a column, by location, as a sequence. Not to be modified."""
+        return [row[col] for row in self._data]
+
+    def iter_lists(self, with_index=True):
+        """Iterate rows with values as lists."""
+        for idx, row in zip(self.index, self._data):
+            if with_index:
+                yield idx, list(row)
+            else:
+                yield list(row)
+
+    def iter_dicts(self, with_index=True) -> Generator[Dict[Column, Any], None, None]:
+        """Iterate rows with values as dicts."""
+        for index in self.index:
+            row = {"index": index} if with_index else {}
+            for column in self._columns:
+                row[column] = self.get_cell(index, column)
+            yield row
+
+    def iter_tuples(self, with_index=True, name="Row"):
+        """Iterate rows with values as namedtuples.
+        Converts column names to valid Python identifiers,
+        e.g. "First Name" -> "First_Name"
+        """
+        columns = {column: to_identifier(column) for column in self._columns}
+
+        fields = ["index"] if with_index else []
+        fields.extend(columns.values())
+
+        container = namedtuple(name, fields)
+        for row in self.iter_dicts(with_index):
+            row = {columns[k]: v for k, v in row.items()}
+            yield container(**row)
+
+    def to_list(self, with_index=True):
+        """Convert table to list representation."""
+        export = []
 
-        def _check_cell(index: int) -> bool:
-            cell = self.get_cell(index, column)
-            return condition(cell)
+        for index in self.index:
+            row = OrderedDict()
+            if with_index:
+                row["index"] = index
+            for column in self._columns:
+                row[column] = self.get_cell(index, column)
+            export.append(row)
+
+        return export
+
+    def to_dict(self, with_index=True):
+        """Convert table to dict representation."""
+        export = OrderedDict()
+
+        if with_index:
+            export["index"] = self.index
+
+        for column in self._columns:
+            export[column] = []
+
+        for index in self.index:
+            for column in self._columns:
+                value = self.get_cell(index, column)
+                export[column].append(value)
+
+        return export
+
+
+class ColumnTable(Table):
+    """Container class for tabular data, which stores values column-wise.
+
+    Has the same interface and supported data formats as `Table`, but
+    keeps one list of values per column instead of one list per row.
+    Reading, adding, and removing columns, or filtering rows by the values
+    of a single column, are done without touching every row separately.
+
+    :param data:     Values for table,  see "Supported data formats"
+    :param columns:  Names for columns, should match data dimensions
+    """
+
+    def __init__(self, data: Data = None, columns: Optional[List[str]] = None):
+        self._store: List[List[Any]] = []
+        self._size = 0
+        super().__init__(data, columns)
+
+    @classmethod
+    def _from_store(
+        cls, columns: List[Column], store: List[List[Any]], size: int
+    ) -> "ColumnTable":
+        """Create table directly from already column-oriented values."""
+        table = cls(columns=columns)
+        table._store = store
+        table._size = size
+        table._validate_self()
+        return table
+
+    @classmethod
+    def _from_rows(cls, columns: List[Column], rows: List[List[Any]]) -> "Table":
+        """Create table from rows which are already in column order."""
+        if columns and rows:
+            store = [list(values) for values in zip(*rows)]
+        else:
+            store = [[] for _ in columns]
+        return cls._from_store(columns, store, len(rows))
+
+    def _init_empty(self):
+        """Initialize table with empty data."""
+        self._store = [[] for _ in self._columns]
+        self._size = 0
+
+    def _init_table(self, table: Table):
+        """Initialize table with another table."""
+        if not self.columns:
+            self.columns = table.columns
+        self._store = [
+            table.get_column(column, as_list=True) for column in table.columns
+        ]
+        self._size = table.size
+
+    def _init_dict(self, data: Dict[Column, Row]):
+        """Initialize table from dict-like container."""
+        if not self._columns:
+            self._columns = list(data.keys())
+
+        # Filter values by defined columns
+        store = [
+            list(to_list(values))
+            for column, values in data.items()
+            if column in self._columns
+        ]
+
+        size = max((len(values) for values in store), default=0)
+        if not size:
+            self._init_empty()
+            return
+
+        for values in store:
+            values.extend([None] * (size - len(values)))
+
+        self._store = store
+        self._size = size
+
+    @property
+    def data(self):
+        return [list(row) for row in self._iter_rows()]
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @Table.columns.setter
+    def columns(self, names):
+        """Rename columns with given values."""
+        Table.columns.fset(self, names)
+        if not self._size:
+            self._store = [[] for _ in self._columns]
+
+    def _validate_columns(self, names):
+        """Validate that given column names can be used."""
+        super()._validate_columns(names)
+
+        if self._size and len(names) != len(self._store):
+            raise ValueError("Invalid columns length")
+
+    def _validate_self(self):
+        """Validate that internal data is valid and coherent."""
+        self._validate_columns(self._columns)
+
+        if len(self._store) != len(self._columns) or any(
+            len(values) != self._size for values in self._store
+        ):
+            raise ValueError("Columns length does not match data")
+
+    def _iter_rows(self) -> Iterable[Tuple]:
+        """Iterate rows as tuples of values."""
+        if not self._store:
+            return iter([()] * self._size)
+        return zip(*self._store)
+
+    def _append_data_row(self, row: List[Any]):
+        """Append a row of values, in column order, into the storage."""
+        self._own_data()
+        for values, value in zip(self._store, row):
+            values.append(value)
+        self._size += 1
+
+    def _append_data_column(self):
+        """Append an empty column into the storage."""
+        self._store.append([None] * self._size)
+
+    def _remove_data_column(self, col: int):
+        """Remove a column, by location, from the storage."""
+        del self._store[col]
+
+    def _take_data_rows(self, idxs: List[int]):
+        """Keep only the rows in the given locations, in the given order."""
+        self._store = [[values[idx] for idx in idxs] for values in self._store]
+        self._size = len(idxs)
+        self._shared = False
+
+    def _take_data_columns(self, cols: List[int]):
+        """Keep only the columns in the given locations, in the given order."""
+        self._store = [self._store[col] for col in cols]
+
+    def _get_data_cell(self, idx: int, col: int) -> Any:
+        """Get value from the storage by row and column location."""
+        return self._store[col][idx]
+
+    def _set_data_cell(self, idx: int, col: int, value: Any):
+        """Set value in the storage by row and column location."""
+        self._own_data()
+        self._store[col][idx] = value
+
+    def _set_data_row(self, idx: int, row: List[Any]):
+        """Replace a row of values, in column order, in the storage."""
+        self._own_data()
+        for values, value in zip(self._store, row):
+            values[idx] = value
+
+    def _set_data_column(self, col: int, values: List[Any]):
+        """Replace the values of a column in the storage."""
+        self._store[col] = list(values)
+
+    def get_cell(self, index, column):
+        """Get single cell value."""
+        idx = self.index_location(index)
+        col = self.column_location(column)
+
+        return self._store[col][idx]
+
+    def get_row(self, index: Index, columns=None, as_list=False):
+        """Get column values from row.
+
+        :param index:   Index for row
+        :param columns: Column names to include, or all if not given
+        :param as_list: Return row as dictionary, instead of list
+        """
+        columns = if_none(columns, self._columns)
+        idx = self.index_location(index)
+        cols = [self.column_location(column) for column in columns]
+
+        if as_list:
+            return [self._store[col][idx] for col in cols]
+        else:
+            return {self._columns[col]: self._store[col][idx] for col in cols}
+
+    def get_column(self, column, indexes=None, as_list=False):
+        """Get row values from column.
+
+        :param columns: Name for column
+        :param indexes: Row indexes to include, or all if not given
+        :param as_list: Return column as dictionary, instead of list
+        """
+        col = self.column_location(column)
+        values = self._store[col]
+
+        if indexes is None:
+            return list(values) if as_list else dict(enumerate(values))
+
+        idxs = [self.index_location(index) for index in indexes]
+        if as_list:
+            return [values[idx] for idx in idxs]
+        else:
+            return {idx: values[idx] for idx in idxs}
+
+    def get_table(self, indexes=None, columns=None, as_list=False):
+        """Get a new table from all cells matching indexes and columns."""
+        indexes = self.index if indexes is None else indexes
+        columns = if_none(columns, self._columns)
+
+        if (
+            len(indexes) == self.size
+            and indexes == self.index
+            and columns == self._columns
+        ):
+            return self._copy()
+
+        idxs = [self.index_location(index) for index in indexes]
+        cols = [self.column_location(column) for column in columns]
+
+        if as_list:
+            return [[self._store[col][idx] for col in cols] for idx in idxs]
+        else:
+            return self._view(idxs, cols, columns)
+
+    def _view(
+        self,
+        idxs: Optional[List[int]] = None,
+        cols: Optional[List[int]] = None,
+        names: Optional[List[Column]] = None,
+    ) -> "Table":
+        """Create table from the rows and columns in the given locations,
+        or all of them if not given, optionally with new column names.
+
+        Columns with all the rows are shared with the new table, and copied
+        only when either table modifies them.
+        """
+        if cols is None:
+            cols = list(range(len(self._columns)))
+        columns = [self._columns[col] for col in cols] if names is None else names
+        columns = list(columns)
+
+        if idxs is None or (len(idxs) == self._size and idxs == self.index):
+            table = self._from_store(
+                columns, [self._store[col] for col in cols], self._size
+            )
+            if self._size:
+                table._shared = self._shared = True
+        elif idxs and idxs == list(range(idxs[0], idxs[0] + len(idxs))):
+            # Contiguous range of rows, e.g. head, tail or slice
+            start, end = idxs[0], idxs[0] + len(idxs)
+            store = [self._store[col][start:end] for col in cols]
+            table = self._from_store(columns, store, len(idxs))
+        else:
+            store = [[self._store[col][idx] for idx in idxs] for col in cols]
+            table = self._from_store(columns, store, len(idxs))
+
+        return table
+
+    def _own_data(self):
+        """Copy storage which is shared with other tables,
+        before modifying it in-place.
+        """
+        if self._shared:
+            self._store = [list(values) for values in self._store]
+            self._shared = False
 
-        self._filter(_check_cell)
+    def _column_values(self, col: int) -> List[Any]:
+        """Values of a column, by location, as a sequence. Not to be modified."""
+        return self._store[col]
 
     def iter_lists(self, with_index=True):
         """Iterate rows with values as lists."""
-        for idx, row in zip(self.index, self._data):
+        for idx, row in enumerate(self._iter_rows()):
             if with_index:
                 yield idx, list(row)
             else:
@@ -826,41 +1856,12 @@ class Table:
 
     def iter_dicts(self, with_index=True) -> Generator[Dict[Column, Any], None, None]:
         """Iterate rows with values as dicts."""
-        for index in self.index:
-            row = {"index": index} if with_index else {}
-            for column in self._columns:
-                row[column] = self.get_cell(index, column)
+        columns = self.columns
+        for idx, values in enumerate(self._iter_rows()):
+            row = {"index": idx} if with_index else {}
+            row.update(zip(columns, values))
             yield row
 
-    def iter_tuples(self, with_index=True, name="Row"):
-        """Iterate rows with values as namedtuples.
-        Converts column names to valid Python identifiers,
-        e.g. "First Name" -> "First_Name"
-        """
-        columns = {column: to_identifier(column) for column in self._columns}
-
-        fields = ["index"] if with_index else []
-        fields.extend(columns.values())
-
-        container = namedtuple(name, fields)
-        for row in self.iter_dicts(with_index):
-            row = {columns[k]: v for k, v in row.items()}
-            yield container(**row)
-
-    def to_list(self, with_index=True):
-        """Convert table to list representation."""
-        export = []
-
-        for index in self.index:
-            row = OrderedDict()
-            if with_index:
-                row["index"] = index
-            for column in self._columns:
-                row[column] = self.get_cell(index, column)
-            export.append(row)
-
-        return export
-
     def to_dict(self, with_index=True):
         """Convert table to dict representation."""
         export = OrderedDict()
@@ -868,13 +1869,8 @@ class Table:
         if with_index:
             export["index"] = self.index
 
-        for column in self._columns:
-            export[column] = []
-
-        for index in self.index:
-            for column in self._columns:
-                value = self.get_cell(index, column)
-                export[column].append(value)
+        for column, values in zip(self._columns, self._store):
+            export[column] = list(values)
 
         return export
 
@@ -995,22 +1991,31 @@ class Tables:
             raise TypeError("Keyword requires Table object")
 
     def create_table(
-        self, data: Data = None, trim: bool = False, columns: List[str] = None
+        self,
+        data: Data = None,
+        trim: bool = False,
+        columns: List[str] = None,
+        columnar: bool = False,
     ) -> Table:
         """Create Table object from data.
 
         Data can be a combination of various iterable containers, e.g.
         list of lists, list of dicts, dict of lists.
 
-        :param data:    Source data for table
-        :param trim:    Remove all empty rows from the end of the worksheet,
-                        default `False`
-        :param columns: Names of columns (optional)
-        :return:        Table object
+        :param data:     Source data for table
+        :param trim:     Remove all empty rows from the end of the worksheet,
+                         default `False`
+        :param columns:  Names of columns (optional)
+        :param columnar: Store the table values per column instead of per row,
+                         default `False`
+        :return:         Table object
 
         See the main library documentation for more information about
         supported data types.
 
+        A columnar table behaves exactly like a regular one, but it's faster
+        to read, add, remove, and filter columns of large tables with it.
+
         Example:
 
         .. code-block:: robotframework
@@ -1023,8 +2028,12 @@ class Tables:
             ...    name=${Table_Data_name}
             ...    age=${Table_Data_age}
             ${table}=    Create Table    ${Table_Data}
+
+            # Create a table optimized for column operations
+            ${table}=    Create Table    ${Table_Data}    columnar=${TRUE}
         """
-        table = Table(data, columns)
+        table_type = ColumnTable if columnar else Table
+        table = table_type(data, columns)
 
         if trim:
             self.trim_empty_rows(table)
@@ -1086,16 +2095,47 @@ class Tables:
         self._requires_table(table)
         table.clear()
 
-    def merge_tables(self, *tables: Table, index: Optional[str] = None) -> Table:
+    def merge_tables(
+        self,
+        *tables: Table,
+        index: Optional[Union[str, List[str]]] = None,
+        how: Union[str, JoinType] = JoinType.Outer,
+        duplicates: Union[str, DuplicateKeys] = DuplicateKeys.Update,
+    ) -> Table:
         """Create a union of two tables and their contents.
 
-        :param tables: Tables to merge
-        :param index:  Column name to use as index for merge
-        :return:       Table object
+        :param tables:     Tables to merge
+        :param index:      Column name, or list of names, to use as index for merge
+        :param how:        Which index values to keep: ``outer``, ``inner``,
+                           or ``left``, default ``outer``
+        :param duplicates: How to handle an index value repeated within one
+                           table: ``update``, ``first``, or ``error``,
+                           default ``update``
+        :return:           Table object
 
         By default rows from all tables are appended one after the other.
         Optionally a column name can be given with ``index``, which is
-        used to merge rows together.
+        used to merge rows together. Multiple column names can be given
+        as a list, in which case rows are merged when all of the values
+        in those columns match.
+
+        When merging with an index, ``how`` defines which rows end up in
+        the result:
+
+        ====== ==========================================================
+        How    Description
+        ====== ==========================================================
+        outer  Rows from all tables are kept (default)
+        inner  Only rows with an index value found in every table are kept
+        left   Only rows with an index value found in the first table
+               are kept
+        ====== ==========================================================
+
+        Values of later tables overwrite values of earlier tables in the
+        same column. If the same index value is repeated within a single
+        table, ``duplicates`` decides what happens: ``update`` merges the
+        rows and later values overwrite earlier ones (default), ``first``
+        ignores the repeated rows, and ``error`` raises an exception.
 
         Example:
 
@@ -1128,50 +2168,101 @@ class Tables:
                 ...    Price: ${product}[Price]
                 ...    Stock: ${product}[Stock]
             END
+
+            # Only products which have both a price and a stock entry
+            ${keys}=        Create list    Name    Store
+            ${products}=    Merge tables    ${prices}    ${stock}
+            ...    index=${keys}    how=inner
         """
         if index is None:
             return self._merge_by_append(tables)
         else:
-            return self._merge_by_index(tables, index)
+            return self._merge_by_index(tables, index, how, duplicates)
 
     def _merge_by_append(self, tables: Tuple[Table, ...]):
         """Merge tables by appending columns and rows."""
         columns = uniq(column for table in tables for column in table.columns)
+        locations = {column: col for col, column in enumerate(columns)}
 
-        merged = Table(columns=columns)
+        rows = []
         for table in tables:
-            merged.append_rows(table)
+            cols = [locations[column] for column in table.columns]
+            for values in table.iter_lists(with_index=False):
+                row = [None] * len(columns)
+                for col, value in zip(cols, values):
+                    row[col] = value
+                rows.append(row)
 
-        return merged
+        return Table(rows, columns)
 
-    def _merge_by_index(self, tables: Tuple[Table, ...], index: str):
-        """Merge tables by using a column as shared key."""
+    def _merge_by_index(
+        self,
+        tables: Tuple[Table, ...],
+        index: Union[str, List[str]],
+        how: Union[str, JoinType],
+        duplicates: Union[str, DuplicateKeys],
+    ):
+        """Merge tables by using one or more columns as shared key.
+
+        Builds a hash map from key to merged row while reading every
+        table once, instead of searching the merged rows for each key.
+        """
+        how, duplicates = self._merge_options(how, duplicates)
+
+        keys = to_list(index)
         columns = uniq(column for table in tables for column in table.columns)
-        merged = Table(columns=columns)
-
-        seen = {}
-
-        def find_index(row):
-            """Find index for row, if key already exists."""
-            value = row[index]
-            if value in seen:
-                return seen[value]
-            for row_ in merged.iter_dicts(True):
-                if row_[index] == value:
-                    seen[value] = row_["index"]
-                    return row_["index"]
-            return None
+        locations = {column: col for col, column in enumerate(columns)}
+
+        rows: List[List[Any]] = []
+        found: List[int] = []  # Amount of tables each row was found in
+        positions: Dict[Any, int] = {}  # Map of key to merged row position
+        sizes: List[int] = []  # Amount of merged rows after each table
 
         for table in tables:
-            for row in table.iter_dicts(False):
-                row_index = find_index(row)
-                if row_index is None:
-                    merged.append_row(row)
+            cols = [locations[column] for column in table.columns]
+            key_cols = [table.column_location(key) for key in keys]
+
+            seen = set()
+            for values in table.iter_lists(with_index=False):
+                key = tuple(values[col] for col in key_cols)
+
+                if key in seen:
+                    if duplicates is DuplicateKeys.Error:
+                        raise ValueError(f"Duplicate value(s) for index: {key}")
+                    if duplicates is DuplicateKeys.First:
+                        continue
                 else:
-                    for column, value in row.items():
-                        merged.set_cell(row_index, column, value)
+                    seen.add(key)
+                    position = positions.get(key)
+                    if position is None:
+                        position = positions[key] = len(rows)
+                        rows.append([None] * len(columns))
+                        found.append(0)
+                    found[position] += 1
+
+                row = rows[positions[key]]
+                for col, value in zip(cols, values):
+                    row[col] = value
+
+            sizes.append(len(rows))
 
-        return merged
+        if how is JoinType.Inner:
+            rows = [row for row, count in zip(rows, found) if count == len(tables)]
+        elif how is JoinType.Left:
+            rows = rows[: next(iter(sizes), 0)]
+
+        return Table(rows, columns)
+
+    @staticmethod
+    def _merge_options(
+        how: Union[str, JoinType], duplicates: Union[str, DuplicateKeys]
+    ) -> Tuple[JoinType, DuplicateKeys]:
+        """Convert merge options given as strings into enums."""
+        how = JoinType(how.value if isinstance(how, JoinType) else how)
+        duplicates = DuplicateKeys(
+            duplicates.value if isinstance(duplicates, DuplicateKeys) else duplicates
+        )
+        return how, duplicates
 
     def get_table_dimensions(self, table: Table) -> Tuple[int, int]:
         """Return table dimensions, as (rows, columns).
@@ -1589,7 +2680,15 @@ class Tables:
         self._requires_table(table)
         table.set_cell(row, column, value)
 
-    def find_table_rows(self, table: Table, column: Column, operator: str, value: Any):
+    def find_table_rows(
+        self,
+        table: Table,
+        column: Column,
+        operator: str,
+        value: Any,
+        *conditions: Any,
+        match: str = "all",
+    ):
         """Find all the rows in a table which match a condition for a given column.
 
         :param table: Table to search into.
@@ -1597,6 +2696,10 @@ class Tables:
         :param operator: Comparison operator used with every cell value on the
             specified column.
         :param value: Value to compare against.
+        :param conditions: Additional conditions, each given as a column,
+            an operator, and a value. (optional)
+        :param match: Either ``all`` to find rows matching every condition,
+            or ``any`` to find rows matching at least one, default ``all``.
         :return: New `Table` object containing all the rows matching the condition.
 
         Supported operators:
@@ -1629,27 +2732,99 @@ class Tables:
 
             # Find all rows where the status does not contain "removed"
             @{rows} =    Find table rows    ${table}    Status  not contains  removed
+
+            # Find all rows where price is between 100 and 200
+            @{rows} =    Find table rows    ${table}    Price  >=  ${100}
+            ...    Price  <=  ${200}
+
+            # Find all rows where the status is either new or open
+            @{rows} =    Find table rows    ${table}    Status  ==  new
+            ...    Status  ==  open    match=any
         """
         self._requires_table(table)
 
-        condition = to_condition(operator, value)
-
-        matches = []
-        for index in table.index:
-            cell = table.get_cell(index, column)
-            if condition(cell):
-                matches.append(index)
+        conditions = self._to_conditions(column, operator, value, *conditions)
+        matches = table.find_indexes(conditions, match)
 
         return table.get_table(matches)
 
+    def create_table_index(
+        self,
+        table: Table,
+        columns: Union[Column, List[Column]],
+        ordered: bool = False,
+    ):
+        """Create an index for one or more columns, which speeds up
+        finding rows by the values of those columns.
+
+        :param table:   Table to index
+        :param columns: Column, or list of columns, to index
+        :param ordered: Also support range operators, e.g. ``>`` and ``<=``,
+                        default ``False``
+
+        The index is used automatically by ``Find table rows`` and
+        ``Filter table by column`` for the ``==`` and ``in`` operators,
+        and with ``ordered`` also for ``>``, ``<``, ``>=``, and ``<=``.
+        An index of multiple columns is used when all of its columns
+        are compared with ``==``.
+
+        The index is kept up to date when rows are added or modified,
+        and rebuilt on the next search after rows are removed or sorted.
+        Creating it costs about as much as one search without it, so it's
+        useful when the same table is searched repeatedly, e.g. in a loop.
+
+        Examples:
+
+        .. code-block:: robotframework
+
+            Create table index    ${invoices}    InvoiceId
+            FOR    ${payment}    IN    @{payments}
+                ${matches}=    Find table rows    ${invoices}
+                ...    InvoiceId  ==  ${payment}[InvoiceId]
+            END
+
+            # Index for finding rows by date ranges
+            Create table index    ${invoices}    DueDate    ordered=${TRUE}
+        """
+        self._requires_table(table)
+        table.create_index(columns, ordered=ordered)
+
+    @staticmethod
+    def _to_conditions(*args: Any) -> List[Tuple[Column, CellCondition]]:
+        """Convert flat list of columns, operators, and values into
+        list of (column, condition) pairs.
+        """
+        if len(args) % 3:
+            raise ValueError(
+                "Conditions should be given as a column, an operator, and a value"
+            )
+
+        return [
+            (column, to_condition(operator, value))
+            for column, operator, value in zip(args[::3], args[1::3], args[2::3])
+        ]
+
     def sort_table_by_column(
-        self, table: Table, column: Column, ascending: bool = True
+        self,
+        table: Table,
+        column: Union[Column, List[Column]],
+        ascending: Union[bool, List[bool]] = True,
+        limit: Optional[int] = None,
     ):
         """Sort a table in-place according to ``column``.
 
         :param table:       Table to sort
-        :param column:      Column to sort with
-        :param ascending:   Table sort order
+        :param column:      Column to sort with, or list of columns
+        :param ascending:   Table sort order, or list of sort orders per column
+        :param limit:       Keep only the given amount of rows from the start
+                            of the sorted table, optional
+
+        When sorting with multiple columns, rows with equal values in the first
+        column are sorted by the next column, and so on. Rows with equal values
+        in all the columns keep their original order.
+
+        Using ``limit`` to get only the first rows, e.g. the ten largest orders,
+        is faster than sorting the whole table.
 
         Examples:
 
@@ -1660,9 +2835,17 @@ class Tables:
 
             # Sorts the `order_date` column descending
             Sort table by column    ${orders}    order_date    ascending=${FALSE}
+
+            # Sorts by customer, and the newest orders first for each customer
+            ${columns}=    Create list    customer    order_date
+            ${order}=      Create list    ${TRUE}    ${FALSE}
+            Sort table by column    ${orders}    ${columns}    ascending=${order}
+
+            # Keeps only the ten largest orders
+            Sort table by column    ${orders}    amount    ascending=${FALSE}  limit=10
         """
         self._requires_table(table)
-        table.sort_by_column(column, ascending=ascending)
+        table.sort_by_column(column, ascending=ascending, limit=limit)
 
     def group_table_by_column(self, table: Table, column: Column) -> List[Table]:
         """Group a table by ``column`` and return a list of grouped Tables.
@@ -1689,16 +2872,102 @@ class Tables:
         self.logger.info("Found %s groups", len(groups))
         return groups
 
+    def group_table_and_aggregate(
+        self,
+        table: Table,
+        columns: Union[Column, List[Column]],
+        *aggregations: Union[str, Tuple[Aggregate, Column]],
+        **named_aggregations: Union[str, Tuple[Aggregate, Column]],
+    ) -> Table:
+        """Group a table by ``columns`` and compute aggregated values,
+        such as sums or counts, for every group.
+
+        :param table:               Table to use for grouping
+        :param columns:             Column, or list of columns, to group by
+        :param aggregations:        Aggregations, named automatically
+        :param named_aggregations:  Aggregations, named by the argument name
+        :return:                    New table with one row per group
+
+        Each aggregation is given as ``function:column``, e.g. ``sum:amount``,
+        where the function is one of ``sum``, ``count``, ``min``, ``max``,
+        ``mean``, ``first``, or ``last``. Empty values are ignored, and
+        ``count`` without a column counts all the rows of the group.
+        From Python, a custom function can be given as a ``(function, column)``
+        tuple, where the function is called with the list of the group's values.
+
+        Aggregations given without a name are named ``column_function``,
+        e.g. ``amount_sum``, or only ``count`` for counting rows.
+
+        The groups are computed in one pass over the table, without sorting it
+        or creating a table per group, and are in order of first appearance.
+
+        Examples:
+
+        .. code-block:: robotframework
+
+            # Total amount and number of orders for every customer
+            ${totals}=    Group table and aggregate    ${orders}    customer
+            ...    total=sum:amount    orders=count
+
+            # Returns columns "region", "product", "price_min" and "price_max"
+            ${prices}=    Group table and aggregate    ${sales}
+            ...    ${{ ["region", "product"] }}    min:price    max:price
+
+        .. code-block:: python
+
+            totals = tables.group_table_and_aggregate(
+                orders,
+                "customer",
+                total=("sum", "amount"),
+                spread=(statistics.pstdev, "amount"),
+            )
+        """
+        self._requires_table(table)
+
+        specs = [(None, spec) for spec in aggregations]
+        specs.extend(named_aggregations.items())
+        if not specs:
+            raise ValueError("No aggregations given")
+
+        triples = []
+        for name, spec in specs:
+            if isinstance(spec, str):
+                function, _, column = spec.partition(":")
+                function, column = function.strip(), column.strip() or None
+            else:
+                function, column = spec
+
+            if name is None:
+                label = getattr(function, "__name__", str(function))
+                name = label if column is None else f"{column}_{label}"
+
+            triples.append((name, column, function))
+
+        result = table.group_and_aggregate(columns, triples)
+        self.logger.info("Found %s groups", len(result))
+        return result
+
     def filter_table_by_column(
-        self, table: Table, column: Column, operator: str, value: Any
+        self,
+        table: Table,
+        column: Column,
+        operator: str,
+        value: Any,
+        *conditions: Any,
+        match: str = "all",
     ):
         """Remove all rows where column values don't match the
         given condition.
 
-        :param table:     Table to filter
-        :param column:    Column to filter with
-        :param operator:  Filtering operator, e.g. >, <, ==, contains
-        :param value:     Value to compare column to (using operator)
+        :param table:      Table to filter
+        :param column:     Column to filter with
+        :param operator:   Filtering operator, e.g. >, <, ==, contains
+        :param value:      Value to compare column to (using operator)
+        :param conditions: Additional conditions, each given as a column,
+                           an operator, and a value (optional)
+        :param match:      Either ``all`` to keep rows matching every condition,
+                           or ``any`` to keep rows matching at least one,
+                           default ``all``
 
         See the keyword ``Find table rows`` for all supported operators
         and their descriptions.
@@ -1715,13 +2984,17 @@ class Tables:
             # Remove uwnanted product types
             @{types}=    Create list    Unknown    Removed
             Filter table by column    ${table}   product_type  not in  ${types}
+
+            # Only accept non-zero prices of known products
+            Filter table by column    ${table}   price  !=  ${0}
+            ...    product_type  not in  ${types}
         """
         self._requires_table(table)
 
-        condition = to_condition(operator, value)
+        conditions = self._to_conditions(column, operator, value, *conditions)
 
         before = len(table)
-        table.filter_by_column(column, condition)
+        table.filter_by_conditions(conditions, match)
         after = len(table)
 
         self.logger.info("Filtered %d rows", after - before)
@@ -1749,7 +3022,17 @@ class Tables:
 
         self.logger.info("Removed %d row(s)", before - after)
 
-    def map_column_values(self, table: Table, column: Column, name: str, *args):
+    def map_column_values(
+        self,
+        table: Table,
+        column: Column,
+        name: Union[str, Callable[..., Any]],
+        *args,
+        workers: int = 1,
+        pool: Union[str, PoolType] = PoolType.Thread,
+        chunk_size: Optional[int] = None,
+        memoize: bool = False,
+    ):
         """Run a keyword for each cell in a given column, and replace its content with
         the return value.
 
@@ -1757,11 +3040,26 @@ class Tables:
 
         :param table: Table to modify.
         :param column: Column to modify.
-        :param name: Mapping keyword name.
+        :param name: Mapping keyword name, or a Python callable.
         :param args: Additional keyword arguments. (optional)
+        :param workers: Amount of cells mapped in parallel, default 1.
+        :param pool: Type of worker pool, ``thread`` or ``process``,
+            default ``thread``.
+        :param chunk_size: Amount of cells given to a worker at a time. (optional)
+        :param memoize: Map each distinct cell value only once, default ``False``.
 
         The cell value will be given as the first argument to the mapping keyword.
 
+        Mapping in parallel with ``workers`` requires a Python callable, as
+        Robot Framework keywords can only be run one at a time. Threads are suited
+        for functions which wait on I/O, e.g. HTTP requests, and processes for
+        functions which are heavy on computation, in which case the callable and
+        the values should be picklable. The mapped values are always in the
+        original order of the rows.
+
+        With ``memoize``, repeated cell values are mapped only once, which
+        requires the values to be hashable.
+
         Examples:
 
         .. code-block:: robotframework
@@ -1771,17 +3069,134 @@ class Tables:
 
             # Look up values with a custom keyword
             Map column values    ${table}    User     Map user ID to name
+
+            # Look up each distinct user once, with a Python function
+            # which is run in ten threads
+            Map column values    ${table}    User     ${USERS.lookup_name}
+            ...    workers=10    memoize=${TRUE}
+
+        .. code-block:: python
+
+            tables.map_column_values(table, "User", lookup_name, workers=10)
+        """
+        self._requires_table(table)
+
+        func = self._to_mapper(name, args, workers)
+        values = table.get_column(column, as_list=True)
+        values = self._map_values(func, values, workers, pool, chunk_size, memoize)
+
+        table.set_column(column, values)
+
+    def map_table_rows(
+        self,
+        table: Table,
+        column: Column,
+        name: Union[str, Callable[..., Any]],
+        *args,
+        workers: int = 1,
+        pool: Union[str, PoolType] = PoolType.Thread,
+        chunk_size: Optional[int] = None,
+    ):
+        """Run a keyword for each row of a table, and set the return value
+        to a given column. If the column does not exist, it is created.
+
+        :param table: Table to modify.
+        :param column: Column for the return values.
+        :param name: Mapping keyword name, or a Python callable.
+        :param args: Additional keyword arguments. (optional)
+        :param workers: Amount of rows mapped in parallel, default 1.
+        :param pool: Type of worker pool, ``thread`` or ``process``,
+            default ``thread``.
+        :param chunk_size: Amount of rows given to a worker at a time. (optional)
+
+        The row will be given as a dictionary as the first argument to
+        the mapping keyword. Running in parallel works in the same way as with
+        ``Map column values``.
+
+        Examples:
+
+        .. code-block:: robotframework
+
+            # Compute the total of every order row with a custom keyword
+            Map table rows    ${orders}    Total    Calculate order total
+
+        .. code-block:: python
+
+            tables.map_table_rows(orders, "Status", fetch_order_status, workers=8)
         """
         self._requires_table(table)
 
-        values = []
-        for index in table.index:
-            cell = table.get_cell(index, column)
-            output = BuiltIn().run_keyword(name, cell, *args)
-            values.append(output)
+        func = self._to_mapper(name, args, workers)
+        rows = list(table.iter_dicts(with_index=False))
+        values = self._map_values(func, rows, workers, pool, chunk_size, False)
 
         table.set_column(column, values)
 
+    @staticmethod
+    def _to_mapper(
+        name: Union[str, Callable[..., Any]], args: Tuple[Any, ...], workers: int
+    ) -> Callable[[Any], Any]:
+        """Convert keyword name or callable into a function of one value."""
+        if callable(name):
+            return partial(_apply_with_args, name, args) if args else name
+
+        if int(workers) > 1:
+            raise ValueError(
+                "Keywords can not be run in parallel, use a Python callable instead"
+            )
+
+        def run_keyword(value: Any) -> Any:
+            return BuiltIn().run_keyword(name, value, *args)
+
+        return run_keyword
+
+    def _map_values(
+        self,
+        func: Callable[[Any], Any],
+        values: List[Any],
+        workers: int,
+        pool: Union[str, PoolType],
+        chunk_size: Optional[int],
+        memoize: bool,
+    ) -> List[Any]:
+        """Map values with a function, possibly in a pool of workers,
+        and return the results in the same order.
+        """
+        if memoize:
+            try:
+                unique = list(dict.fromkeys(values))
+            except TypeError as err:
+                raise ValueError(f"Values are not hashable: {err}") from err
+
+            results = self._map_values(func, unique, workers, pool, chunk_size, False)
+            self.logger.info("Mapped %d distinct values", len(unique))
+            mapping = dict(zip(unique, results))
+            return [mapping[value] for value in values]
+
+        workers = int(workers)
+        if workers <= 1 or len(values) <= 1:
+            return [func(value) for value in values]
+
+        pool = PoolType(pool.value if isinstance(pool, PoolType) else pool)
+        if chunk_size is None:
+            # Few chunks per worker, to balance load without too much overhead
+            chunk_size = -(-len(values) // (workers * 4))
+        chunk_size = int(chunk_size)
+        if chunk_size < 1:
+            raise ValueError("Chunk size should be a positive integer")
+
+        chunks = [
+            values[start : start + chunk_size]
+            for start in range(0, len(values), chunk_size)
+        ]
+
+        executor = (
+            ThreadPoolExecutor if pool is PoolType.Thread else ProcessPoolExecutor
+        )
+        with executor(max_workers=workers) as pool_:
+            results = pool_.map(_map_chunk, repeat(func), chunks)
+            return [result for chunk in results for result in chunk]
+
     def filter_empty_rows(self, table: Table):
         """Remove all rows from a table which have only ``None`` values.
 
@@ -1862,6 +3277,8 @@ class Tables:
         delimiters: Optional[str] = None,
         column_unknown: str = "Unknown",
         encoding: Optional[str] = None,
+        dtypes: Optional[Dict[Column, DataType]] = None,
+        infer_types: bool = False,
     ) -> Table:
         """Read a CSV file as a table.
 
@@ -1873,6 +3290,10 @@ class Tables:
         :param column_unknown:  Column name for unknown fields
         :param encoding:        Text encoding for input file,
                                 uses system encoding by default
+        :param dtypes:          Types to convert column values to,
+                                as a mapping of column name to type
+        :param infer_types:     Deduce types of other columns from
+                                the first rows of the file
         :return:                Table object
 
         By default attempts to deduce the CSV format and headers
@@ -1892,6 +3313,21 @@ class Tables:
         the header defines, the remaining values are put into the column
         given by ``column_unknown``. By default it has the value "Unknown".
 
+        By default all values are read as strings. Values can be converted
+        while reading the file by giving their types in ``dtypes``,
+        where the keys are column names from the header, or positions
+        of columns if the file has no header. Supported types are
+        ``str``, ``int``, ``float``, ``decimal``, ``bool``, ``date``,
+        and ``datetime`` (in ISO 8601 format). A Python callable which
+        accepts a string can also be used as a type.
+
+        With ``infer_types`` the types of the remaining columns are deduced
+        from the first 100 rows. Columns are converted to the first type
+        of ``bool``, ``int``, ``float``, ``date``, and ``datetime`` which
+        all the sampled values match, and values which later fail the
+        conversion are kept as strings. In both cases empty fields are
+        converted to ``None``.
+
         Examples:
 
         .. code-block:: robotframework
@@ -1903,6 +3339,133 @@ class Tables:
             # Source dialect is known and given explicitly
             ${table}=    Read table from CSV    export-excel.csv    dialect=excel
             Log   Found columns: ${table.columns}
+
+            # Convert values to numbers while reading
+            &{types}=    Create dictionary    Units Sold=int    Unit Price=decimal
+            ${table}=    Read table from CSV    orders.csv    dtypes=${types}
+
+            # Let the types be deduced from the contents
+            ${table}=    Read table from CSV    orders.csv    infer_types=${TRUE}
+        """
+        dialect, header = self._sniff_csv(path, header, dialect, delimiters, encoding)
+        chunks = self._iter_csv(
+            path,
+            chunk_size=None,
+            header=header,
+            columns=columns,
+            dialect=dialect,
+            column_unknown=column_unknown,
+            encoding=encoding,
+            dtypes=dtypes,
+            infer_types=infer_types,
+        )
+        # Closing the reader closes the file, without waiting for it to finish
+        with closing(chunks):
+            table = next(chunks, None) or Table(columns=columns)
+        notebook_table(self.table_head(table, 10))
+
+        if header and column_unknown in table.columns:
+            self.logger.warning(
+                "CSV file (%s) had fields not defined in header, "
+                "which can be the result of a wrong dialect",
+                path,
+            )
+
+        return table
+
+    @keyword("Iterate table from CSV")
+    def iterate_table_from_csv(
+        self,
+        path: str,
+        chunk_size: int = 10000,
+        header: Optional[bool] = None,
+        columns: Optional[List[str]] = None,
+        dialect: Optional[Union[str, Dialect]] = None,
+        delimiters: Optional[str] = None,
+        column_unknown: str = "Unknown",
+        encoding: Optional[str] = None,
+        dtypes: Optional[Dict[Column, DataType]] = None,
+        infer_types: bool = False,
+    ) -> Generator[Table, None, None]:
+        """Read a CSV file in chunks, as consecutive tables of limited size.
+
+        :param path:            Path to CSV file
+        :param chunk_size:      Maximum amount of rows in each table,
+                                default 10000
+        :param header:          CSV file includes header
+        :param columns:         Names of columns in resulting tables
+        :param dialect:         Format of CSV file
+        :param delimiters:      String of possible delimiters
+        :param column_unknown:  Column name for unknown fields
+        :param encoding:        Text encoding for input file,
+                                uses system encoding by default
+        :param dtypes:          Types to convert column values to,
+                                as a mapping of column name to type
+        :param infer_types:     Deduce types of other columns from
+                                the first rows of the file
+        :return:                Iterator of Table objects
+
+        Only one chunk of the file is kept in memory at a time, which allows
+        processing files that are too large to be read with
+        ``Read table from CSV``. The other arguments work the same way as
+        in that keyword, but the ``column_unknown`` column is only added to
+        the chunks which have rows with fields not defined in the header.
+        Types deduced with ``infer_types`` are based on the first chunk,
+        and used for all the chunks.
+
+        The chunks are read lazily, so the file is read only as far as
+        the returned iterator is consumed. The file is closed when all
+        the chunks have been read, or when the iterator is closed
+        with its ``close()`` method, e.g. after stopping early.
+
+        Examples:
+
+        .. code-block:: robotframework
+
+            ${chunks}=    Iterate table from CSV    orders.csv    chunk_size=5000
+            WHILE    True
+                ${orders}=    Evaluate    next($chunks, None)
+                IF    $orders is None    BREAK
+                Process orders    ${orders}
+            END
+
+        .. code-block:: python
+
+            from contextlib import closing
+
+            for orders in library.iterate_table_from_csv("orders.csv"):
+                process_orders(orders)
+
+            with closing(library.iterate_table_from_csv("orders.csv")) as chunks:
+                first_orders = next(chunks)
+        """
+        chunk_size = int(chunk_size)
+        if chunk_size < 1:
+            raise ValueError("Chunk size should be a positive number")
+
+        dialect, header = self._sniff_csv(path, header, dialect, delimiters, encoding)
+        return self._iter_csv(
+            path,
+            chunk_size=chunk_size,
+            header=header,
+            columns=columns,
+            dialect=dialect,
+            column_unknown=column_unknown,
+            encoding=encoding,
+            dtypes=dtypes,
+            infer_types=infer_types,
+        )
+
+    @staticmethod
+    def _sniff_csv(
+        path: str,
+        header: Optional[bool],
+        dialect: Optional[Union[str, Dialect]],
+        delimiters: Optional[str],
+        encoding: Optional[str],
+    ) -> Tuple[Any, bool]:
+        """Deduce CSV dialect and header from the first line of the file,
+        if not given explicitly.
         """
         sniffer = csv.Sniffer()
         with open(path, newline="", encoding=encoding) as fd:
@@ -1918,26 +3481,152 @@ class Tables:
         if header is None:
             header = sniffer.has_header(sample)
 
+        return dialect_name, header
+
+    def _iter_csv(
+        self,
+        path: str,
+        chunk_size: Optional[int],
+        header: bool,
+        columns: Optional[List[str]],
+        dialect: Any,
+        column_unknown: str,
+        encoding: Optional[str],
+        dtypes: Optional[Dict[Column, DataType]] = None,
+        infer_types: bool = False,
+    ) -> Generator[Table, None, None]:
+        """Read CSV file as tables of at most ``chunk_size`` rows,
+        or as one table if not given.
+        """
         with open(path, newline="", encoding=encoding) as fd:
-            if header:
-                reader = csv.DictReader(
-                    fd, dialect=dialect_name, restkey=str(column_unknown)
-                )
+            reader = csv.reader(fd, dialect=dialect)
+            fieldnames = (next(reader, None) or []) if header else None
+            converters = None
+
+            while True:
+                rows = list(islice(reader, chunk_size))
+                if not rows:
+                    break
+
+                if fieldnames is not None:
+                    # Skip empty lines, similarly to csv.DictReader
+                    rows = [row for row in rows if row]
+                    if not rows:
+                        continue
+
+                if converters is None:
+                    converters = self._csv_converters(
+                        rows, fieldnames or columns, dtypes, infer_types
+                    )
+
+                if converters:
+                    self._convert_csv_rows(rows, converters, fieldnames)
+
+                if fieldnames is None:
+                    yield Table(rows, columns)
+                else:
+                    yield self._csv_rows_to_table(
+                        rows, fieldnames, columns, str(column_unknown)
+                    )
+
+    @staticmethod
+    def _convert_csv_rows(
+        rows: List[List[str]],
+        converters: List[Tuple[int, Callable[[str], Any]]],
+        fieldnames: Optional[List[str]],
+    ):
+        """Convert values of CSV fields in-place, before creating a table."""
+        col = None
+        try:
+            for row in rows:
+                size = len(row)
+                for col, convert in converters:
+                    if col < size:
+                        row[col] = convert(row[col])
+        except ValueError as err:
+            name = fieldnames[col] if fieldnames else col
+            raise ValueError(f"Invalid value in column {name}: {err}") from err
+
+    @staticmethod
+    def _csv_converters(
+        rows: List[List[str]],
+        names: Optional[List[Column]],
+        dtypes: Optional[Dict[Column, DataType]],
+        infer_types: bool,
+    ) -> List[Tuple[int, Callable[[str], Any]]]:
+        """Create list of converters for CSV fields, by field position."""
+        names = list(names or [])
+        # Last field wins for duplicate names in header
+        locations = {name: col for col, name in enumerate(names)}
+
+        converters = {}
+        for column, dtype in (dtypes or {}).items():
+            if column in locations:
+                col = locations[column]
             else:
-                reader = csv.reader(fd, dialect=dialect_name)
-            rows = list(reader)
+                try:
+                    col = int(column)
+                except ValueError as err:
+                    raise ValueError(f"Unknown column for type: {column}") from err
+
+            # Plain strings need no conversion
+            converters[col] = None if dtype in ("str", str) else to_converter(dtype)
+
+        if infer_types:
+            sample = rows[:INFER_TYPES_SAMPLE_SIZE]
+            # Fields outside of the header go to the unknown column as-is
+            width = len(names) if names else max(len(row) for row in sample)
+            for col in range(width):
+                if col in converters:
+                    continue
+                dtype = infer_type(row[col] for row in sample if col < len(row))
+                if dtype is not None:
+                    converters[col] = to_converter(dtype, strict=False)
+
+        return [
+            (col, convert) for col, convert in converters.items() if convert is not None
+        ]
 
-        table = Table(rows, columns)
-        notebook_table(self.table_head(table, 10))
+    @staticmethod
+    def _csv_rows_to_table(
+        rows: List[List[str]],
+        fieldnames: List[str],
+        columns: Optional[List[str]],
+        column_unknown: str,
+    ) -> Table:
+        """Create table from CSV rows with header, without intermediate dicts.
 
-        if header and column_unknown in table.columns:
-            self.logger.warning(
-                "CSV file (%s) had fields not defined in header, "
-                "which can be the result of a wrong dialect",
-                path,
-            )
+        Follows the conventions of csv.DictReader: missing fields are None,
+        additional fields are gathered as a list into ``column_unknown``,
+        and the last field wins for duplicate names in the header.
+        """
+        width = len(fieldnames)
+        locations = {name: col for col, name in enumerate(fieldnames)}
+        names = list(locations)
 
-        return table
+        extra = any(len(row) > width for row in rows)
+        if extra:
+            names.append(column_unknown)
+
+        if columns:
+            # Select and order columns by name, unknown names are left empty
+            named = {name: col for col, name in enumerate(names)}
+            selected = [named.get(column) for column in columns]
+        else:
+            selected = None
+
+        cols = list(locations.values())
+        data = []
+        for row in rows:
+            size = len(row)
+            values = [row[col] if col < size else None for col in cols]
+            if extra:
+                values.append(row[width:] or None)
+            if selected is not None:
+                values = [values[col] if col is not None else None for col in selected]
+            data.append(values)
+
+        return Table(data, columns or names)
 
     @keyword("Write table to CSV")
     def write_table_to_csv(
@@ -1948,6 +3637,7 @@ class Tables:
         dialect: Union[str, Dialect] = Dialect.Excel,
         encoding: Optional[str] = None,
         delimiter: Optional[str] = ",",
+        append: bool = False,
     ):
         """Write a table as a CSV file.
 
@@ -1958,15 +3648,24 @@ class Tables:
         :param encoding: Text encoding for output file,
                          uses system encoding by default
         :param delimiter: Delimiter character between columns
+        :param append:   Append rows to the end of an existing file,
+                         in which case the header is written only if
+                         the file is empty
 
         Builtin ``dialect`` values are ``excel``, ``excel-tab``, and ``unix``.
 
+        Appending allows writing large amounts of data in smaller parts,
+        for instance the chunks from ``Iterate table from CSV``.
+
         Example:
 
         .. code-block:: robotframework
 
             ${sheet}=    Read worksheet as table    orders.xlsx    header=${TRUE}
             Write table to CSV    ${sheet}    output.csv
+
+            # Add more rows to the end of the file
+            Write table to CSV    ${more}    output.csv    append=${TRUE}
         """
         self._requires_table(table)
 
@@ -1975,13 +3674,11 @@ class Tables:
         else:
             dialect_name = dialect
 
-        with open(path, mode="w", newline="", encoding=encoding) as fd:
-            writer = csv.DictWriter(
-                fd, fieldnames=table.columns, dialect=dialect_name, delimiter=delimiter
-            )
+        mode = "a" if append else "w"
+        with open(path, mode=mode, newline="", encoding=encoding) as fd:
+            writer = csv.writer(fd, dialect=dialect_name, delimiter=delimiter)
 
-            if header:
-                writer.writeheader()
+            if header and not (append and fd.tell()):
+                writer.writerow(table.columns)
 
-            for row in table.iter_dicts(with_index=False):
-                writer.writerow(row)
+            writer.writerows(table.iter_lists(with_index=False))
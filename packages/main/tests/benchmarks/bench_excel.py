@@ -0,0 +1,160 @@
+"""Benchmarks for the RPA.Excel.Files library.
+
+These are not run as part of the test suite, but can be executed
+manually to compare the performance of different implementations:
+
+    python tests/benchmarks/bench_excel.py [files] [rows]
+"""
+import pathlib
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+from openpyxl.utils.exceptions import InvalidFileException
+
+from RPA.Excel.Files import Files, XlsWorkbook, XlsxWorkbook
+from RPA.Tables import Tables
+
+
+@contextmanager
+def timer(name: str):
+    start = time.perf_counter()
+    yield
+    duration = time.perf_counter() - start
+    print(f"{name:<48} {duration:>8.3f}s")
+
+
+def legacy_load_workbook(path, data_only=False, read_only=False):
+    """Previous implementation of loading a workbook, which always tries
+    openpyxl first and falls back to xlrd only after it has failed.
+    """
+    # pylint: disable=broad-except
+    path = pathlib.Path(path).resolve(strict=True)
+
+    try:
+        book = XlsxWorkbook(path)
+        book.open(data_only=data_only, read_only=read_only)
+        return book
+    except InvalidFileException:
+        pass
+    except Exception:
+        pass
+
+    book = XlsWorkbook(path)
+    book.open()
+    return book
+
+
+def create_corpus(root: pathlib.Path, files: int, rows: int):
+    """Create a mix of ``.xlsx`` and ``.xls`` files, and ``.xls`` files
+    with an ``.xlsx`` extension which are common in the wild.
+    """
+    library = Files()
+    content = {
+        "id": list(range(rows)),
+        "name": [f"name-{idx}" for idx in range(rows)],
+        "price": [float(idx % 500) for idx in range(rows)],
+    }
+
+    paths = []
+    for idx in range(files):
+        fmt, suffix = [("xlsx", "xlsx"), ("xls", "xls"), ("xls", "xlsx")][idx % 3]
+        path = root / f"book-{idx}.{suffix}"
+        library.create_workbook(fmt=fmt)
+        library.append_rows_to_worksheet(content, header=True)
+        library.save_workbook(str(path))
+        library.close_workbook()
+        paths.append(str(path))
+
+    return paths
+
+
+def bench_open(files: int, rows: int):
+    library = Files()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = create_corpus(pathlib.Path(tmp), files, rows)
+
+        with timer(f"open workbooks, legacy ({files} files, {rows} rows)"):
+            for path in paths:
+                legacy_load_workbook(path).close()
+
+        with timer(f"open workbooks, sniffed ({files} files, {rows} rows)"):
+            for path in paths:
+                library.open_workbook(path)
+                library.close_workbook()
+
+        with timer(f"open and read, legacy ({files} files, {rows} rows)"):
+            for path in paths:
+                book = legacy_load_workbook(path)
+                book.read_worksheet(header=True)
+                book.close()
+
+        with timer(f"open and read, sniffed ({files} files, {rows} rows)"):
+            for path in paths:
+                library.open_workbook(path)
+                library.read_worksheet(header=True)
+                library.close_workbook()
+
+        with timer(f"open and read, fast ({files} files, {rows} rows)"):
+            for path in paths:
+                library.open_workbook(path, fast=True)
+                library.read_worksheet(header=True)
+                library.close_workbook()
+
+
+def bench_switch(rows: int, lookups: int = 50):
+    library = Files()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        first, second = create_corpus(pathlib.Path(tmp), 2, rows)
+
+        with timer(f"cross-workbook lookups, reopen ({lookups} lookups)"):
+            for _ in range(lookups):
+                for path in (first, second):
+                    library.open_workbook(path)
+                    library.get_cell_value(rows // 2, "B")
+            library.close_workbook()
+
+        with timer(f"cross-workbook lookups, aliases ({lookups} lookups)"):
+            library.open_workbook(first, alias="first")
+            library.open_workbook(second, alias="second")
+            for _ in range(lookups):
+                for alias in ("first", "second"):
+                    library.switch_workbook(alias)
+                    library.get_cell_value(rows // 2, "B")
+            library.close_all_workbooks()
+
+
+def bench_ingest(files: int, rows: int):
+    library = Files()
+    tables = Tables()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = create_corpus(pathlib.Path(tmp), files, rows)
+
+        with timer(f"read files one by one ({files} files, {rows} rows)"):
+            merged = []
+            for path in paths:
+                library.open_workbook(path)
+                merged.append(library.read_worksheet_as_table(header=True))
+                library.close_workbook()
+            expected = tables.merge_tables(*merged)
+
+        with timer(f"read files in parallel ({files} files, {rows} rows)"):
+            table = library.read_worksheets_from_files(paths, source_column=None)
+
+        assert len(table) == len(expected)
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    bench_open(files, rows)
+    bench_switch(rows)
+    bench_ingest(files, rows)
+
+
+if __name__ == "__main__":
+    main()
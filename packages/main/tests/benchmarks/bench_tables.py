@@ -0,0 +1,183 @@
+"""Benchmarks for the RPA.Tables library.
+
+These are not run as part of the test suite, but can be executed
+manually to compare the performance of different implementations:
+
+    python tests/benchmarks/bench_tables.py [rows]
+"""
+import sys
+import time
+from contextlib import contextmanager
+
+from RPA.Tables import ColumnTable, Table, Tables, to_condition, uniq
+
+
+@contextmanager
+def timer(name: str):
+    start = time.perf_counter()
+    yield
+    duration = time.perf_counter() - start
+    print(f"{name:<48} {duration:>8.3f}s")
+
+
+def legacy_merge_by_index(tables, index):
+    """Previous implementation of ``Merge Tables`` with an index,
+    which rescans the merged rows for every unseen key.
+    """
+    columns = uniq(column for table in tables for column in table.columns)
+    merged = Table(columns=columns)
+
+    seen = {}
+
+    def find_index(row):
+        value = row[index]
+        if value in seen:
+            return seen[value]
+        for row_ in merged.iter_dicts(True):
+            if row_[index] == value:
+                seen[value] = row_["index"]
+                return row_["index"]
+        return None
+
+    for table in tables:
+        for row in table.iter_dicts(False):
+            row_index = find_index(row)
+            if row_index is None:
+                merged.append_row(row)
+            else:
+                for column, value in row.items():
+                    merged.set_cell(row_index, column, value)
+
+    return merged
+
+
+def bench_merge(rows: int):
+    library = Tables()
+    # Half of the keys overlap between the two tables
+    left = Table({"id": list(range(rows)), "price": [1.0] * rows})
+    right = Table({"id": list(range(rows // 2, rows + rows // 2)), "stock": [2] * rows})
+
+    with timer(f"merge tables, hash join ({rows} rows)"):
+        merged = library.merge_tables(left, right, index="id")
+
+    # The previous implementation is quadratic, so limit its input
+    if rows <= 2000:
+        with timer(f"merge tables, legacy ({rows} rows)"):
+            expected = legacy_merge_by_index((left, right), "id")
+        assert merged == expected
+
+
+def legacy_filter_by_column(table, column, condition):
+    """Previous implementation of ``Filter Table By Column``,
+    which resolves the column for every cell and removes rows one by one.
+    """
+    removed = [
+        index for index in table.index if not condition(table.get_cell(index, column))
+    ]
+    for index in sorted(removed, reverse=True):
+        del table._data[index]  # pylint: disable=protected-access
+
+
+def bench_filter(rows: int):
+    library = Tables()
+    data = {
+        "id": list(range(rows)),
+        "status": ["new", "open", "closed", "removed"] * (rows // 4),
+        "price": [float(idx % 500) for idx in range(rows)],
+    }
+
+    for table_type in (Table, ColumnTable):
+        name = table_type.__name__
+        table = table_type(data)
+        with timer(f"find rows, one condition, {name} ({rows} rows)"):
+            library.find_table_rows(table, "price", ">", 250.0)
+        with timer(f"find rows, two conditions, {name} ({rows} rows)"):
+            library.find_table_rows(
+                table, "price", ">", 250.0, "status", "in", ["new", "open"]
+            )
+        with timer(f"filter by column, {name} ({rows} rows)"):
+            library.filter_table_by_column(table, "status", "!=", "removed")
+
+    # Removing rows one at a time is quadratic, so limit its input
+    if rows <= 100000:
+        table = Table(data)
+        with timer(f"filter by column, legacy ({rows} rows)"):
+            legacy_filter_by_column(table, "status", to_condition("!=", "removed"))
+
+
+def bench_group(rows: int):
+    library = Tables()
+    customers = max(rows // 100, 1)
+    data = {
+        "customer": [idx % customers for idx in range(rows)],
+        "amount": [float(idx % 500) for idx in range(rows)],
+    }
+
+    for table_type in (Table, ColumnTable):
+        name = table_type.__name__
+        table = table_type(data)
+        with timer(f"group and aggregate, {name} ({rows} rows)"):
+            result = library.group_table_and_aggregate(
+                table, "customer", total="sum:amount", orders="count"
+            )
+
+    table = Table(data)
+    with timer(f"group by column and sum, legacy ({rows} rows)"):
+        expected = [
+            sum(library.get_table_column(group, "amount"))
+            for group in library.group_table_by_column(table, "customer")
+        ]
+    assert sorted(result.get_column("total", as_list=True)) == sorted(expected)
+
+
+def bench_sort(rows: int):
+    data = {
+        "price": [float((idx * 7919) % 1000) for idx in range(rows)],
+        "mixed": [(None, 1, "a", 2.5)[idx % 4] for idx in range(rows)],
+    }
+
+    for table_type in (Table, ColumnTable):
+        name = table_type.__name__
+        with timer(f"sort by numeric column, {name} ({rows} rows)"):
+            table_type(data).sort_by_column("price", ascending=True)
+        with timer(f"sort by mixed column, {name} ({rows} rows)"):
+            table_type(data).sort_by_column("mixed", ascending=True)
+        with timer(f"sort by two columns, {name} ({rows} rows)"):
+            table_type(data).sort_by_column(["mixed", "price"], ascending=[True, False])
+        with timer(f"sort with limit of 10, {name} ({rows} rows)"):
+            table_type(data).sort_by_column("price", ascending=False, limit=10)
+
+
+def bench_pages(rows: int):
+    library = Tables()
+    data = {
+        "id": list(range(rows)),
+        "name": [f"name-{idx}" for idx in range(rows)],
+        "price": [float(idx % 500) for idx in range(rows)],
+    }
+    page = 1000
+
+    for table_type in (Table, ColumnTable):
+        name = table_type.__name__
+        table = table_type(data)
+        with timer(f"page through slices of {page}, {name} ({rows} rows)"):
+            for start in range(0, rows, page):
+                end = start + page if start + page < rows else None
+                library.get_table_slice(table, start, end)
+        with timer(f"slice whole table, {name} ({rows} rows)"):
+            library.get_table_slice(table)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 2000, 100000]
+    for rows in sizes:
+        bench_merge(rows)
+    for rows in [int(arg) for arg in sys.argv[1:]] or [100000, 1000000]:
+        bench_filter(rows)
+        bench_group(rows)
+        bench_sort(rows)
+        bench_pages(rows)
+
+
+if __name__ == "__main__":
+    main()
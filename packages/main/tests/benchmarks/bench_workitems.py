@@ -0,0 +1,299 @@
+"""Benchmarks for the RPA.Robocorp.WorkItems library.
+
+These are not run as part of the test suite, but can be executed
+manually to compare the performance of different implementations:
+
+    python tests/benchmarks/bench_workitems.py [calls]
+"""
+import copy
+import json
+import os
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from RPA.Robocorp.utils import Requests, is_json_equal
+from RPA.Robocorp.WorkItems import (
+    BaseAdapter,
+    EmptyQueue,
+    FileAdapter,
+    WorkItem,
+    WorkItems,
+)
+
+
+@contextmanager
+def timer(name: str, calls: int = 0):
+    start = time.perf_counter()
+    yield
+    duration = time.perf_counter() - start
+    rate = f"{calls / duration:>8.0f}/s" if calls else ""
+    print(f"{name:<48} {duration:>8.3f}s {rate}")
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Stand-in for the Control Room API, which keeps connections alive."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which would otherwise stall
+    # kept-alive connections until the client acknowledges the headers
+    disable_nagle_algorithm = True
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+
+        body = json.dumps({"workItemId": "1", "payload": {}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@contextmanager
+def stand_in_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class LegacyRequests(Requests):
+    """Previous implementation of ``Requests``, which sends every request
+    with the module-level functions of ``requests``, each opening
+    a new connection.
+    """
+
+    def post(self, *args, **kwargs):
+        return self._request(requests.post, *args, **kwargs)
+
+    def get(self, *args, **kwargs):
+        return self._request(requests.get, *args, **kwargs)
+
+
+def bench_requests(calls: int):
+    with stand_in_server() as url:
+        headers = {"Content-Type": "application/json"}
+
+        legacy = LegacyRequests(url, default_headers=headers)
+        with timer(f"API calls, new connections ({calls} calls)", calls):
+            for idx in range(calls // 2):
+                legacy.post("reserve-next-work-item")
+                legacy.get(f"{idx}/data")
+
+        pooled = Requests(url, default_headers=headers)
+        with timer(f"API calls, pooled session ({calls} calls)", calls):
+            for idx in range(calls // 2):
+                pooled.post("reserve-next-work-item")
+                pooled.get(f"{idx}/data")
+
+
+class LatencyAdapter(BaseAdapter):
+    """Adapter with a fixed round-trip time for every call, similar to
+    a remote Control Room queue.
+    """
+
+    LATENCY = 0.01
+    ITEMS = 50
+
+    def __init__(self):
+        self._index = 0
+
+    def _call(self):
+        time.sleep(self.LATENCY)
+
+    def reserve_input(self):
+        self._call()
+        if self._index >= self.ITEMS:
+            raise EmptyQueue("No work items in the input queue")
+        self._index += 1
+        return str(self._index)
+
+    def release_input(self, item_id, state, exception=None):
+        self._call()
+
+    def create_output(self, parent_id, payload=None):
+        self._call()
+        return parent_id
+
+    def load_payload(self, item_id):
+        self._call()
+        return {"id": item_id}
+
+    def save_payload(self, item_id, payload):
+        self._call()
+
+    def list_files(self, item_id):
+        self._call()
+        return []
+
+    def get_file(self, item_id, name):
+        self._call()
+        return b""
+
+    def add_file(self, item_id, name, *, original_name, content):
+        self._call()
+
+    def remove_file(self, item_id, name):
+        self._call()
+
+
+def bench_prefetch(items: int):
+    LatencyAdapter.ITEMS = items
+
+    def process():
+        time.sleep(LatencyAdapter.LATENCY * 2)
+
+    for prefetch in (0, 1, 4):
+        library = WorkItems(default_adapter=LatencyAdapter, prefetch=prefetch)
+        with timer(f"for each input item, prefetch={prefetch} ({items} items)"):
+            library.for_each_input_work_item(process)
+        library._close()  # pylint: disable=protected-access
+
+
+def bench_workers(items: int):
+    LatencyAdapter.ITEMS = items
+
+    def process():
+        time.sleep(LatencyAdapter.LATENCY * 10)  # an I/O bound handler
+
+    for workers in (1, 4, 8):
+        library = WorkItems(default_adapter=LatencyAdapter)
+        with timer(f"for each input item, workers={workers} ({items} items)"):
+            library.for_each_input_work_item(process, workers=workers)
+
+
+def bench_streaming(size_mb: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        root = pathlib.Path(tmp)
+        (root / "items.json").write_text(json.dumps([{"payload": {}}]))
+        os.environ["RPA_INPUT_WORKITEM_PATH"] = str(root / "items.json")
+        os.environ["RPA_OUTPUT_WORKITEM_PATH"] = str(root / "out" / "items.json")
+        source = root / "source.bin"
+        with open(source, "wb") as fd:
+            for _ in range(size_mb):
+                fd.write(os.urandom(1024 * 1024))
+
+        adapter = FileAdapter()
+        item_id = adapter.reserve_input()
+        name = f"file attachment ({size_mb} MB)"
+
+        tracemalloc.start()
+        with timer(f"add and get {name}, in memory"):
+            content = source.read_bytes()
+            adapter.add_file(item_id, "a", original_name="a.bin", content=content)
+            (root / "a.out").write_bytes(adapter.get_file(item_id, "a"))
+            del content
+        _, peak = tracemalloc.get_traced_memory()
+        print(f"{'  peak memory':<48} {peak / 2**20:>8.1f}MB")
+
+        tracemalloc.reset_peak()
+        with timer(f"add and get {name}, streamed"):
+            with open(source, "rb") as infile:
+                adapter.add_file(item_id, "b", original_name="b.bin", content=infile)
+            with open(root / "b.out", "wb") as outfile:
+                adapter.get_file(item_id, "b", fd=outfile)
+        _, peak = tracemalloc.get_traced_memory()
+        print(f"{'  peak memory':<48} {peak / 2**20:>8.1f}MB")
+        tracemalloc.stop()
+
+
+def bench_journal(items: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        root = pathlib.Path(tmp)
+        os.environ["RPA_INPUT_WORKITEM_PATH"] = str(root / "items.json")
+        os.environ["RPA_OUTPUT_WORKITEM_PATH"] = str(root / "items.output.json")
+        payload = {"name": "name", "values": list(range(20))}
+
+        for journal in ("", "1"):
+            os.environ["RPA_WORKITEMS_JOURNAL"] = journal
+            mode = "journal" if journal else "rewrite"
+            adapter = FileAdapter()
+            with timer(f"create output items, {mode} ({items} items)"):
+                for _ in range(items):
+                    adapter.create_output("0", payload)
+                adapter.close()
+
+        del os.environ["RPA_WORKITEMS_JOURNAL"]
+
+
+class PayloadAdapter(LatencyAdapter):
+    """Adapter without latency, holding one large nested payload."""
+
+    LATENCY = 0
+    PAYLOAD = {}
+
+    def load_payload(self, item_id):
+        return self.PAYLOAD
+
+
+class LegacyWorkItem(WorkItem):
+    """Previous implementation of payload handling in ``WorkItem``, which
+    keeps a deep copy of the payload and compares it as JSON.
+    """
+
+    # pylint: disable=attribute-defined-outside-init
+    def load(self):
+        self._remote = self.adapter.load_payload(self.id)
+        self._payload = copy.deepcopy(self._remote)
+        self._files = self.adapter.list_files(self.id)
+
+    @property
+    def is_dirty(self):
+        return not is_json_equal(self._remote, self._payload)
+
+    def save(self):
+        self.adapter.save_payload(self.id, self._payload)
+        self._remote = self._payload
+        self._payload = copy.deepcopy(self._remote)
+
+
+def bench_dirty(rows: int, checks: int = 10):
+    PayloadAdapter.PAYLOAD = {
+        "rows": [
+            {"id": idx, "name": f"name-{idx}", "tags": ["a", "b"], "meta": {"x": idx}}
+            for idx in range(rows)
+        ]
+    }
+    adapter = PayloadAdapter()
+
+    for name, item_class in (("legacy", LegacyWorkItem), ("tracked", WorkItem)):
+        item = item_class(adapter, item_id="1")
+        with timer(f"load, check and save payload, {name} ({rows} rows)"):
+            item.load()
+            for idx in range(checks):
+                item.payload["rows"][idx]["meta"]["x"] = -idx - 1
+                assert item.is_dirty
+            item.save()
+            assert not item.is_dirty
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    bench_requests(calls)
+    bench_prefetch(calls // 20)
+    bench_workers(calls // 20)
+    bench_streaming(calls // 10)
+    bench_journal(calls)
+    bench_dirty(calls * 100)
+
+
+if __name__ == "__main__":
+    main()
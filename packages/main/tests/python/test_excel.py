@@ -1,10 +1,18 @@
 import contextlib
 import datetime
+import re
+import zipfile
 from io import BytesIO
 from pathlib import Path
 
 import pytest
-from RPA.Excel.Files import Files, XlsxWorkbook, XlsWorkbook, ensure_unique
+from RPA.Excel.Files import (
+    Files,
+    XlsxWorkbook,
+    XlsWorkbook,
+    ensure_unique,
+    sniff_format,
+)
 from RPA.Tables import Table
 
 from . import RESOURCES_DIR, RESULTS_DIR
@@ -84,6 +92,319 @@ def test_wrong_extension_fallback_xls():
     assert library.workbook is None
 
 
+@pytest.mark.parametrize(
+    "filename, fmt",
+    [
+        ("example.xlsx", "xlsx"),
+        ("example.xls", "xls"),
+        ("wrong_extension.xlsx", "xls"),
+        ("wrong_extension.xls", "xlsx"),
+    ],
+)
+def test_sniff_format(filename, fmt):
+    assert sniff_format(EXCELS_DIR / filename) == fmt
+
+
+def test_sniff_format_text():
+    assert sniff_format(RESOURCES_DIR / "easy.csv") == "text"
+
+
+def test_open_text_file(tmp_path):
+    path = tmp_path / "data.xlsx"
+    path.write_text("one,two\n1,2\n")
+
+    library = Files()
+    with pytest.raises(ValueError, match=".*text file.*RPA.Tables.*"):
+        library.open_workbook(str(path))
+    assert library.workbook is None
+
+
+@pytest.mark.parametrize("filename", ["example.xlsx", "example.xls"])
+def test_open_fast(filename):
+    library = Files()
+    library.open_workbook(str(EXCELS_DIR / filename), fast=True)
+
+    table = library.read_worksheet_as_table(name="First", header=True)
+    assert len(table) == 9
+    assert table.get_cell(0, "First Name") == "Dulce"
+
+
+def test_open_with_alias():
+    library = Files()
+    library.open_workbook(str(EXCELS_DIR / "example.xlsx"), alias="first")
+    first = library.workbook
+    library.open_workbook(str(EXCELS_DIR / "example.xls"), alias="second")
+    second = library.workbook
+
+    assert library.list_workbooks() == ["first", "second"]
+    assert library.switch_workbook("first") is first
+    assert library.get_cell_value(2, "B", "First") == "Dulce"
+    assert library.switch_workbook("second") is second
+
+    library.close_workbook()
+    assert library.workbook is None
+    assert library.list_workbooks() == ["first"]
+
+    library.close_all_workbooks()
+    assert library.list_workbooks() == []
+
+
+def test_open_without_alias_keeps_aliased():
+    library = Files()
+    library.open_workbook(str(EXCELS_DIR / "example.xlsx"), alias="first")
+    library.open_workbook(str(EXCELS_DIR / "example.xls"))
+    library.create_workbook()
+
+    assert library.list_workbooks() == ["first"]
+    library.switch_workbook("first")
+    assert library.workbook.extension == ".xlsx"
+
+
+def test_switch_unknown_alias():
+    library = Files()
+    with pytest.raises(ValueError, match="Unknown workbook alias"):
+        library.switch_workbook("missing")
+
+
+def test_evict_read_only_workbooks():
+    library = Files(max_workbooks=2)
+    path = str(EXCELS_DIR / "example.xlsx")
+    library.open_workbook(path, alias="one", read_only=True)
+    library.open_workbook(path, alias="two", read_only=True)
+    library.create_workbook(alias="three")
+
+    # Least recently used read-only workbook is closed, but can be re-opened
+    assert list(library._workbooks) == ["two", "three"]
+    assert library.list_workbooks() == ["one", "two", "three"]
+
+    library.switch_workbook("one")
+    assert library.get_cell_value(2, "B", "First") == "Dulce"
+    assert list(library._workbooks) == ["three", "one"]
+
+
+def test_evict_read_only_xls_keeps_cell_values():
+    library = Files(max_workbooks=1)
+    library.open_workbook(str(EXCELS_DIR / "example.xls"), alias="r", read_only=True)
+    with pytest.raises(ValueError, match="read-only"):
+        library.set_cell_value(2, "B", "Changed", "First")
+
+    library.create_workbook(alias="other")
+    assert list(library._workbooks) == ["other"]
+    library.switch_workbook("r")
+    assert library.get_cell_value(2, "B", "First") == "Dulce"
+
+
+def test_evict_keeps_writable_workbooks():
+    library = Files(max_workbooks=1)
+    library.create_workbook(alias="one")
+    library.create_workbook(alias="two")
+    assert list(library._workbooks) == ["one", "two"]
+
+
+@pytest.fixture
+def report_files(tmp_path):
+    library = Files()
+    contents = [
+        ("a.xlsx", "xlsx", [["Id", "Amount"], [1, 10], [2, 20]]),
+        ("b.xls", "xls", [[" id ", "AMOUNT", "Note"], [3, 30, "late"]]),
+        ("c.xlsx", "xlsx", [["Id", "Amount"]]),
+    ]
+    for filename, fmt, rows in contents:
+        library.create_workbook(fmt=fmt)
+        library.append_rows_to_worksheet(rows)
+        library.save_workbook(str(tmp_path / filename))
+    library.close_workbook()
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers, pool", [(1, "process"), (2, "thread")])
+def test_read_worksheets_from_files(report_files, workers, pool):
+    library = Files()
+    table = library.read_worksheets_from_files(
+        str(report_files / "*.xls*"), workers=workers, pool=pool
+    )
+
+    assert table.columns == ["Id", "Amount", "Note", "source"]
+    assert table.get_column("Id", as_list=True) == [1, 2, 3]
+    assert table.get_column("Note", as_list=True) == [None, None, "late"]
+    assert table.get_cell(2, "source") == str(report_files / "b.xls")
+    assert library.workbook is None
+
+
+def test_read_worksheets_from_files_process_pool(report_files):
+    library = Files()
+    paths = [str(report_files / "b.xls"), str(report_files / "a.xlsx")]
+    table = library.read_worksheets_from_files(paths, workers=2, source_column=None)
+
+    assert table.columns == ["id", "AMOUNT", "Note"]
+    assert table.get_column("AMOUNT", as_list=True) == [30, 10, 20]
+
+
+def test_read_worksheets_from_files_case_duplicates(tmp_path):
+    library = Files()
+    for filename, rows in [
+        ("a.xlsx", [["Name", "name"], [1, 2]]),
+        ("b.xlsx", [["NAME"], [3]]),
+    ]:
+        library.create_workbook()
+        library.append_rows_to_worksheet(rows)
+        library.save_workbook(str(tmp_path / filename))
+    library.close_workbook()
+
+    table = library.read_worksheets_from_files(
+        str(tmp_path / "*.xlsx"), workers=1, source_column=None
+    )
+    assert table.columns == ["Name", "name_2"]
+    assert table.data == [[1, 2], [3, None]]
+
+
+def test_read_worksheets_from_files_suffix_clashes(tmp_path):
+    library = Files()
+    library.create_workbook()
+    library.append_rows_to_worksheet([["a", "A", "a_2", "Source"], [1, 2, 3, 4]])
+    library.save_workbook(str(tmp_path / "a.xlsx"))
+    library.close_workbook()
+
+    table = library.read_worksheets_from_files(str(tmp_path / "a.xlsx"), workers=1)
+    assert table.columns == ["a", "A_2", "a_2_2", "Source", "source_2"]
+    assert table.data == [[1, 2, 3, 4, str(tmp_path / "a.xlsx")]]
+
+
+def test_read_worksheets_from_files_errors(report_files):
+    library = Files()
+    paths = [str(report_files / "a.xlsx"), str(report_files / "missing.xlsx")]
+    with pytest.raises(ValueError, match=".*missing.xlsx.*"):
+        library.read_worksheets_from_files(paths)
+
+    table = library.read_worksheets_from_files(str(report_files / "*.csv"))
+    assert len(table) == 0
+
+
+@pytest.fixture
+def formulas_path(tmp_path):
+    library = Files()
+    library.create_workbook(sheet_name="Orders")
+    library.set_range_values(
+        "A1",
+        [
+            ["Item", "Amount", "Price", "Total"],
+            ["apple", 3, "=VLOOKUP(A2, Prices!A:B, 2, FALSE)", "=B2*C2"],
+            ["pear", 2, "=INDEX(Prices!B1:B3, MATCH(A3, Prices!A1:A3, 0))", "=B3*C3"],
+            ["sum", "=SUM(B2:B3)", "=AVERAGE(C2:C3)", "=SUM(D2:D3)"],
+            ["flag", '=IF(D4>5, "big", "small")', "=IFERROR(1/0, -1)", "=1/0"],
+            ["text", '=A2&"-"&ROUND(2.5, 0)', "=-2^2+10%", "=UNKNOWN(1)"],
+        ],
+    )
+    library.create_worksheet("Prices")
+    library.set_range_values("A1", [["apple", 1.5], ["banana", 0.5], ["pear", 3]])
+
+    path = tmp_path / "formulas.xlsx"
+    library.save_workbook(str(path))
+    library.close_workbook()
+    return str(path)
+
+
+def test_evaluate_formulas(formulas_path):
+    library = Files()
+    library.open_workbook(formulas_path, data_only=True, evaluate=True)
+
+    values = [
+        library.get_cell_value(row, column, "Orders")
+        for row, column in [
+            (2, "C"),
+            (3, "C"),
+            (2, "D"),
+            (4, "B"),
+            (4, "C"),
+            (4, "D"),
+            (5, "B"),
+            (5, "C"),
+            (5, "D"),
+            (6, "B"),
+            (6, "C"),
+            (6, "D"),
+        ]
+    ]
+    assert values == [1.5, 3, 4.5, 5, 2.25, 10.5, "big", -1, "#DIV/0!"] + [
+        "apple-3",
+        4.1,
+        None,
+    ]
+
+
+def test_evaluate_formulas_without_option(formulas_path):
+    library = Files()
+    library.open_workbook(formulas_path, data_only=True)
+    assert library.get_cell_value(4, "D", "Orders") is None
+
+
+def test_evaluate_formulas_read_worksheet(formulas_path):
+    library = Files()
+    library.open_workbook(formulas_path, data_only=True, evaluate=True)
+
+    rows = library.read_worksheet("Orders", header=True)
+    assert [row["Total"] for row in rows[:3]] == [4.5, 6, 10.5]
+    assert library.get_range_values("C2:D3", "Orders") == [[1.5, 4.5], [3, 6]]
+
+
+def test_evaluate_formulas_invalidate(formulas_path):
+    library = Files()
+    library.open_workbook(formulas_path, data_only=True, evaluate=True)
+    assert library.get_cell_value(4, "D", "Orders") == 10.5
+
+    # Only formulas which depend on the changed cell are recalculated
+    evaluator = library.workbook._evaluator
+    library.set_cell_value(2, "B", 10, "Orders")
+    assert ("Orders", 3, 4) in evaluator._values
+    assert ("Orders", 2, 4) not in evaluator._values
+    assert library.get_cell_value(4, "D", "Orders") == 21
+
+    library.set_cell_value(2, "B", 5, "Orders")
+    assert library.get_cell_value(2, "D", "Orders") == 7.5
+    assert library.get_cell_value(5, "B", "Orders") == "big"
+
+    library.set_cell_value(1, "B", "=Orders!B2*2", "Prices")
+    assert library.get_cell_value(2, "C", "Orders") == 10
+    library.set_cell_value(2, "B", 1, "Orders")
+    assert library.get_cell_value(2, "C", "Orders") == 2
+
+
+def test_evaluate_formulas_changes(formulas_path):
+    library = Files()
+    library.open_workbook(formulas_path, data_only=True, evaluate=True)
+    library.set_active_worksheet("Orders")
+    assert library.get_cell_value(4, "D") == 10.5
+
+    library.set_cell_formula("D2", "=B2*10")
+    assert library.get_cell_value(2, "D") == 30
+    assert library.get_cell_value(4, "D") == 36
+    assert library.get_range_values("D2:D4") == [[30], [6], [36]]
+
+    # Cleared cells don't get their formulas back from the file
+    library.clear_cell_range("D3")
+    assert library.get_cell_value(3, "D") is None
+    assert library.get_cell_value(4, "D") == 30
+
+    # Formulas of the file don't match the cells anymore after moving them
+    library.insert_rows_before(2)
+    assert library.get_range_values("A2:D2") == [[None, None, None, None]]
+    assert library.get_cell_value(5, "D") is None
+
+
+def test_open_read_only_xls_rejects_changes(tmp_path):
+    library = Files()
+    library.open_workbook(str(EXCELS_DIR / "example.xls"), read_only=True)
+
+    with pytest.raises(ValueError, match="read-only"):
+        library.set_cell_value(2, "B", "Changed", "First")
+    with pytest.raises(ValueError, match="read-only"):
+        library.create_worksheet("Other")
+    with pytest.raises(ValueError, match="read-only"):
+        library.save_workbook(str(tmp_path / "copy.xls"))
+
+    assert library.get_cell_value(2, "B", "First") == "Dulce"
+
+
 def test_extension_property(library):
     assert library.workbook.extension == Path(library.workbook.path).suffix
 
@@ -467,3 +788,245 @@ def test_create_with_sheet_name(fmt):
     name = "CustomName"
     library.create_workbook(path, fmt=fmt, sheet_name=name)
     assert library.get_active_worksheet() == name
+
+
+def test_buffered_xls_writes(tmp_path):
+    library = Files()
+    library.open_workbook(EXCELS_DIR / "example.xls", buffered=True)
+    book = library.workbook._book
+
+    for row in range(1, 101):
+        library.set_cell_value(row, "H", row * 2)
+    library.set_cell_value(2, "I", "value", fmt="0.00")
+
+    # Nothing written yet, but values can be read back
+    assert library.workbook._book is book
+    assert library.get_cell_value(50, "H") == 100
+    assert library.get_cell_value(2, "I") == "value"
+
+    sheet = library.read_worksheet()
+    assert library.workbook._book is not book
+    assert sheet[99]["H"] == 200
+
+    path = tmp_path / "buffered.xls"
+    library.set_cell_value(1, "A", "Changed")
+    library.save_workbook(path)
+    library.close_workbook()
+
+    library.open_workbook(path)
+    assert library.get_cell_value(1, "A") == "Changed"
+    assert library.get_cell_value(100, "H") == 200
+    library.close_workbook()
+
+
+def test_buffered_xls_worksheet_operations():
+    library = Files()
+    library.create_workbook(fmt="xls", buffered=True)
+    library.set_cell_value(1, "A", "First")
+    library.rename_worksheet("Sheet", "Renamed")
+    library.create_worksheet("Other")
+    library.set_cell_value(1, "A", "Second")
+
+    assert library.get_cell_value(1, "A", "Renamed") == "First"
+    assert library.get_cell_value(1, "A", "Other") == "Second"
+    assert library.find_empty_row("Other") == 2
+
+
+def test_iterate_worksheet_rows(library):
+    expected = library.read_worksheet(header=True)
+    rows = library.iterate_worksheet_rows(header=True)
+    assert not isinstance(rows, list)
+    assert list(rows) == expected
+
+
+def test_iterate_worksheet_rows_chunks(library):
+    expected = library.read_worksheet_as_table(header=True)
+    chunks = list(library.iterate_worksheet_rows(header=True, chunk_size=3))
+    assert all(isinstance(chunk, Table) for chunk in chunks)
+    assert all(len(chunk) <= 3 for chunk in chunks)
+    assert sum(len(chunk) for chunk in chunks) == len(expected)
+    assert chunks[0].columns == expected.columns
+    assert chunks[-1].data == expected.data[-len(chunks[-1]) :]
+
+    with pytest.raises(ValueError):
+        library.iterate_worksheet_rows(chunk_size=0)
+
+
+@pytest.mark.parametrize("filename", ["example.xlsx", "example.xls"])
+def test_iterate_worksheet_rows_path(filename):
+    library = Files()
+    rows = list(
+        library.iterate_worksheet_rows(
+            "Second", header=True, start=1, path=EXCELS_DIR / filename
+        )
+    )
+    assert library.workbook is None
+
+    library.open_workbook(EXCELS_DIR / filename)
+    assert rows == library.read_worksheet("Second", header=True)
+    library.close_workbook()
+
+
+def test_iterate_worksheet_rows_path_formulas():
+    library = Files()
+    rows = library.iterate_worksheet_rows(header=True, path=EXCELS_DIR / "missing.xlsx")
+    with pytest.raises(FileNotFoundError):
+        next(rows)
+
+    rows = library.iterate_worksheet_rows(
+        header=True, path=EXCELS_DIR / "formulas.xlsx"
+    )
+    assert next(rows) == {"Value": 1, "Increment": 3, "Result": 4}
+
+
+def test_iterate_worksheet_rows_trim(tmp_path):
+    library = Files()
+    library.create_workbook()
+    for row, value in enumerate(["a", None, "b", None, None], 1):
+        library.set_cell_value(row, "A", value)
+    library.set_cell_value(5, "B", None)
+    path = tmp_path / "trim.xlsx"
+    library.save_workbook(path)
+
+    rows = list(library.iterate_worksheet_rows(path=path))
+    assert [row["A"] for row in rows] == ["a", None, "b"]
+    rows = list(library.iterate_worksheet_rows(path=path, trim=False))
+    assert [row["A"] for row in rows] == ["a", None, "b", None, None]
+
+
+def test_iterate_worksheet_rows_unsized(tmp_path):
+    library = Files()
+    library.create_workbook()
+    library.append_rows_to_worksheet([["a", "b", "c"], [1], [1, 2, 3], [1, 2]])
+    path = tmp_path / "sized.xlsx"
+    library.save_workbook(path)
+    library.close_workbook()
+
+    # Remove the stored dimensions, as some applications don't write them
+    unsized = tmp_path / "unsized.xlsx"
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(unsized, "w") as dst:
+        for item in src.infolist():
+            content = src.read(item.filename)
+            if item.filename.startswith("xl/worksheets/"):
+                content = re.sub(rb"<dimension [^>]*/>", b"", content)
+            dst.writestr(item, content)
+
+    rows = list(library.iterate_worksheet_rows(path=unsized))
+    assert all(list(row) == ["A", "B", "C"] for row in rows)
+    assert rows[1] == {"A": 1, "B": None, "C": None}
+
+    rows = list(library.iterate_worksheet_rows(path=unsized, header=True))
+    assert rows == [
+        {"a": 1, "b": None, "c": None},
+        {"a": 1, "b": 2, "c": 3},
+        {"a": 1, "b": 2, "c": None},
+    ]
+
+
+def test_export_table_to_workbook(tmp_path):
+    library = Files()
+    table = Table({"id": [1, 2, 3], "name": ["a", "b", None]})
+    path = tmp_path / "export.xlsx"
+    library.export_table_to_workbook(table, path, name="Orders")
+    assert library.workbook is None
+
+    library.open_workbook(path)
+    assert library.list_worksheets() == ["Orders"]
+    assert library.read_worksheet(header=True) == [
+        {"id": 1, "name": "a"},
+        {"id": 2, "name": "b"},
+        {"id": 3, "name": None},
+    ]
+    library.close_workbook()
+
+
+def test_export_table_to_workbook_sheets(tmp_path):
+    library = Files()
+    path = tmp_path / "export.xlsx"
+    sheets = {
+        "First": Table([[1, 2], [3, 4]]),
+        "Second": Table([{"key": "value"}]),
+    }
+    library.export_table_to_workbook(sheets, path, header=False)
+
+    library.open_workbook(path)
+    assert library.list_worksheets() == ["First", "Second"]
+    assert library.read_worksheet("First") == [{"A": 1, "B": 2}, {"A": 3, "B": 4}]
+    assert library.read_worksheet("Second") == [{"A": "value"}]
+    library.close_workbook()
+
+    with pytest.raises(ValueError):
+        library.export_table_to_workbook(sheets, tmp_path / "export.xls")
+
+
+def test_append_rows_to_worksheet_header_order():
+    library = Files()
+    library.create_workbook()
+    library.append_rows_to_worksheet([{"a": 1, "b": 2}], header=True)
+    library.append_rows_to_worksheet([{"b": 4, "c": 5, "a": 3}], header=True)
+    assert library.read_worksheet(header=True) == [
+        {"a": 1, "b": 2},
+        {"a": 3, "b": 4},
+    ]
+
+
+@pytest.mark.parametrize("fmt", ["xlsx", "xls"])
+def test_range_values(fmt):
+    library = Files()
+    library.create_workbook(fmt=fmt)
+    library.set_range_values("B2", [[1, 2, 3], ["a", "b", "c"]])
+    library.set_range_values("B4", Table({"x": [7], "y": [8]}), header=True)
+
+    assert library.get_range_values("B2:D3") == [[1, 2, 3], ["a", "b", "c"]]
+    assert library.get_range_values("A3:C6") == [
+        [None, "a", "b"],
+        [None, "x", "y"],
+        [None, 7, 8],
+        [None, None, None],
+    ]
+    assert library.get_range_values("C4:E6") == [
+        ["y", None, None],
+        [8, None, None],
+        [None, None, None],
+    ]
+    assert library.get_cell_value(5, "B") == 7
+
+    table = library.get_range_values("B4:C5", as_table=True, header=True)
+    assert table.columns == ["x", "y"]
+    assert table.data == [[7, 8]]
+    table = library.get_range_values("B2:C3", as_table=True)
+    assert table.columns == ["B", "C"]
+    assert table.data == [[1, 2], ["a", "b"]]
+
+
+def test_range_values_outside_sheet():
+    library = Files()
+    library.create_workbook()
+    library.set_range_values("A1", [[1, 2], [3, 4]])
+
+    rows = library.get_range_values("A1:Z1000")
+    assert len(rows) == 1000 and all(len(row) == 26 for row in rows)
+    assert rows[1][:3] == [3, 4, None] and rows[-1][-1] is None
+
+    # Reading doesn't extend the worksheet
+    assert library.workbook.book.active.max_row == 2
+    assert library.find_empty_row() == 3
+    library.append_rows_to_worksheet([[5, 6]])
+    assert library.get_cell_value(3, "A") == 5
+
+
+def test_range_values_buffered_xls():
+    library = Files()
+    library.create_workbook(fmt="xls", buffered=True)
+    library.set_range_values("A1", [[1, 2], [3, 4]], name="Sheet")
+    assert library.get_cell_value(2, "B") == 4
+    assert library.get_range_values("A1:B2") == [[1, 2], [3, 4]]
+
+
+def test_set_and_copy_cell_values():
+    library = Files()
+    library.create_workbook()
+    library.set_cell_values("A1", [[1, 2], [3, None]])
+    library.set_cell_values("A3", ["x", "y"])
+    library.copy_cell_values("A1:B3", "D1")
+    assert library.get_range_values("D1:E3") == [[1, 2], [3, None], ["x", "y"]]
@@ -260,8 +260,9 @@ def test_adapter_filesecrets_saving(monkeypatch, tmp_path, secrets_file):
     assert secret_dict["credentials"]["sap"]["password"] == "my-different-secret"
 
 
-@mock.patch("RPA.Robocorp.Vault.requests")
-def test_adapter_vault_request(mock_requests, mock_env_default, mock_env_vault):
+@mock.patch("RPA.Robocorp.Vault.get_session")
+def test_adapter_vault_request(mock_get_session, mock_env_default, mock_env_vault):
+    mock_requests = mock_get_session.return_value
     mock_requests.get.return_value.json.return_value = {
         "name": "mock-name",
         "description": "mock-desc",
@@ -293,8 +294,9 @@ def test_adapter_vault_request(mock_requests, mock_env_default, mock_env_vault):
     )
 
 
-@mock.patch("RPA.Robocorp.Vault.requests")
-def test_adapter_vault_error(mock_requests, mock_env_vault):
+@mock.patch("RPA.Robocorp.Vault.get_session")
+def test_adapter_vault_error(mock_get_session, mock_env_vault):
+    mock_requests = mock_get_session.return_value
     mock_requests.get.side_effect = RuntimeError("Some request error")
 
     adapter = RobocorpVault()
@@ -1,8 +1,10 @@
 import copy
+import io
 import json
 import logging
 import os
 import tempfile
+import time
 from contextlib import contextmanager
 from pathlib import Path
 from unittest import mock
@@ -13,17 +15,30 @@ except ImportError:
     from contextlib import suppress as nullcontext
 
 import pytest
+import yaml
 from requests import HTTPError
-
-from RPA.Robocorp.utils import DEBUG_ON, RequestsHTTPError, set_dot_value
+from requests.models import RequestEncodingMixin
+
+from RPA.Robocorp.utils import (
+    DEBUG_ON,
+    ChangeTracker,
+    MultipartStream,
+    RequestsHTTPError,
+    create_session,
+    set_dot_value,
+    track_changes,
+    untrack_changes,
+)
 from RPA.Robocorp.WorkItems import (
     ENCODING,
     BaseAdapter,
     EmptyQueue,
     Error,
     FileAdapter,
+    PrefetchAdapter,
     RobocorpAdapter,
     State,
+    WorkItem,
     WorkItems,
 )
 
@@ -124,10 +139,15 @@ class MockAdapter(BaseAdapter):
     def list_files(self, item_id):
         return self.FILES[item_id]
 
-    def get_file(self, item_id, name):
-        return self.FILES[item_id][name]
+    def get_file(self, item_id, name, fd=None):
+        content = self.FILES[item_id][name]
+        if fd is None:
+            return content
+        fd.write(content)
 
     def add_file(self, item_id, name, *, original_name, content):
+        if not isinstance(content, bytes):
+            content = content.read()
         self.FILES[item_id][name] = content
 
     def remove_file(self, item_id, name):
@@ -240,6 +260,95 @@ class TestLibrary:
         for key, value in modified.items():
             MockAdapter.validate(item, key, value)
 
+    def test_dirty_tracking(self, library):
+        item = library.get_input_work_item()
+        assert not item.is_dirty
+
+        item.payload["nested"] = {"values": [1, 2]}
+        assert item.is_dirty
+        library.save_work_item()
+        assert not item.is_dirty
+
+        # Saved as plain containers, which don't change along with the item.
+        saved = MockAdapter.DATA[item.id]
+        assert type(saved["nested"]["values"]) is list  # noqa: E721
+        item.payload["nested"]["values"].append(3)
+        assert item.is_dirty
+        assert saved["nested"]["values"] == [1, 2]
+
+        library.save_work_item()
+        assert MockAdapter.DATA[item.id]["nested"]["values"] == [1, 2, 3]
+
+        # Unchanged payloads aren't sent again.
+        with mock.patch.object(MockAdapter, "save_payload") as save_payload:
+            library.save_work_item()
+            save_payload.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda data: data["list"].append({}),
+            lambda data: data["list"][0].update(key="value"),
+            lambda data: data["list"][0].setdefault("new", 1),
+            lambda data: data["list"].extend([1]),
+            lambda data: data["list"].pop(),
+            lambda data: data["list"].sort(),
+            lambda data: data.pop("list"),
+            lambda data: data.clear(),
+            lambda data: data["dict"].__setitem__("a", 2),
+            lambda data: data["dict"].__delitem__("a"),
+        ],
+    )
+    def test_tracked_changes(self, change):
+        tracker = ChangeTracker()
+        data = track_changes({"list": [{"a": 1}], "dict": {"a": 1}}, tracker)
+        data["list"][0].setdefault("a", 2)  # existing key, no change
+        assert tracker.version == 0
+
+        change(data)
+        assert tracker.version > 0
+
+        # New values are kept as they are, and their changes are found too.
+        state = tracker.state()
+        added = {"nested": []}
+        data["added"] = added
+        assert data["added"] is added
+        assert tracker.state() != state
+
+        state = tracker.state()
+        added["nested"].append(1)
+        assert tracker.state() != state
+        assert json.loads(json.dumps(data)) == untrack_changes(data)
+
+    def test_set_values_changed_afterwards(self, library):
+        item = library.get_input_work_item()
+
+        data = {}
+        library.set_work_item_variable("data", data)
+        library.save_work_item()
+        data["a"] = [1]
+        assert item.is_dirty
+        library.save_work_item()
+        assert MockAdapter.DATA[item.id]["data"] == {"a": [1]}
+
+        payload = {"values": []}
+        library.set_work_item_payload(payload)
+        library.save_work_item()
+        payload["values"].append(2)
+        library.save_work_item()
+        assert MockAdapter.DATA[item.id] == {"values": [2]}
+
+    def test_payload_to_yaml(self, library):
+        library.get_input_work_item()
+        library.set_work_item_variable("nested", {"list": [1, {"a": 2}]})
+        variables = library.get_work_item_variables()
+        assert yaml.safe_load(yaml.safe_dump(variables))["nested"] == {
+            "list": [1, {"a": 2}]
+        }
+        assert yaml.safe_load(yaml.dump(library.get_work_item_payload())) == (
+            untrack_changes(variables)
+        )
+
     def test_no_active_item(self):
         library = WorkItems(default_adapter=MockAdapter)
         with pytest.raises(RuntimeError) as err:
@@ -371,6 +480,21 @@ class TestLibrary:
             library.save_work_item()
             assert MockAdapter.FILES[item.id]["file4.txt"] == b"some-input-content"
 
+    def test_add_files_parallel(self, library):
+        item = library.get_input_work_item()
+
+        contents = {f"file-{idx}.txt": f"content-{idx}".encode() for idx in range(8)}
+        paths = []
+        for name, content in contents.items():
+            path = Path(RESULTS_DIR) / name
+            path.write_bytes(content)
+            paths.append(path)
+            library.add_work_item_file(path)
+
+        library.save_work_item()
+        for name, content in contents.items():
+            assert MockAdapter.FILES[item.id][name] == content
+
     def test_add_file_duplicate(self, library):
         item = library.get_input_work_item()
 
@@ -670,6 +794,68 @@ class TestLibrary:
         results = library.for_each_input_work_item(func)
         assert len(results) == 0
 
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_iter_work_items_concurrent(self, library, ordered):
+        expected = list(VALID_DATA.values())
+        running = []
+        concurrency = []
+
+        def func():
+            running.append(None)
+            concurrency.append(len(running))
+            payload = library.get_work_item_payload()
+            # The first item finishes last, each worker sees its own item.
+            time.sleep(0.2 if payload == expected[0] else 0.01)
+            assert library.get_work_item_payload() is payload
+            running.pop()
+            return payload
+
+        results = library.for_each_input_work_item(func, workers=2, ordered=ordered)
+        assert max(concurrency) == 2
+        if ordered:
+            assert results == expected
+        else:
+            assert results[-1] == expected[0]
+            assert sorted(map(str, results)) == sorted(map(str, expected))
+        released = sorted(item_id for item_id, _, _ in library.adapter.releases)
+        assert released == sorted(VALID_DATA)
+        assert all(item.state is State.DONE for item in library.inputs)
+
+    def test_iter_work_items_concurrent_outputs(self, library):
+        def func():
+            parent = library.current
+            output = library.create_output_work_item({"parent": parent.id})
+            assert library.current is output
+            return output.payload["parent"]
+
+        results = library.for_each_input_work_item(func, workers=3)
+        assert results == list(VALID_DATA)
+        assert library.current.state is State.DONE
+
+    def test_iter_work_items_concurrent_failure(self, library):
+        def func():
+            payload = library.get_work_item_payload()
+            if payload == VARIABLES_SECOND:
+                raise ValueError("Bad item")
+            return payload
+
+        with pytest.raises(ValueError, match="Bad item"):
+            library.for_each_input_work_item(func, workers=2, items_limit=2)
+
+        releases = dict(
+            (item_id, (state, exception))
+            for item_id, state, exception in library.adapter.releases
+        )
+        assert releases["workitem-id-first"] == (State.DONE, None)
+        assert releases["workitem-id-second"] == (
+            State.FAILED,
+            {"type": "APPLICATION", "code": None, "message": "Bad item"},
+        )
+
+    def test_iter_work_items_concurrent_keyword(self, library):
+        with pytest.raises(ValueError):
+            library.for_each_input_work_item("Log", "message", workers=2)
+
     @staticmethod
     @pytest.fixture(
         params=[
@@ -763,6 +949,55 @@ class TestLibrary:
         assert library.current.state is None  # because the previous one has a state
         assert library.adapter.releases == [("workitem-id-first", State.DONE, None)]
 
+    def test_prefetch(self, adapter):
+        library = WorkItems(default_adapter=adapter, prefetch=2)
+        assert isinstance(library.adapter, PrefetchAdapter)
+
+        payloads = library.for_each_input_work_item(library.get_work_item_payload)
+        assert payloads == list(VALID_DATA.values())
+        assert library.adapter.adapter.releases == [
+            (item_id, State.DONE, None) for item_id in VALID_DATA
+        ]
+
+        with pytest.raises(EmptyQueue):
+            library.get_input_work_item()
+
+    def test_prefetch_only_when_iterating(self, adapter):
+        library = WorkItems(default_adapter=adapter, prefetch=2)
+        library.get_input_work_item()
+        assert library.adapter.adapter.INDEX == 1
+
+        library.for_each_input_work_item(lambda: None, items_limit=2)
+        library._close()
+
+        # Active item counts towards the limit, and nothing is left unprocessed.
+        releases = library.adapter.adapter.releases
+        assert library.adapter.adapter.INDEX == 2
+        assert [release[1] for release in releases] == [State.DONE, State.DONE]
+
+    def test_prefetch_release_unprocessed(self, adapter):
+        library = WorkItems(default_adapter=adapter, prefetch=2)
+
+        def fail():
+            raise ValueError("Stop")
+
+        with pytest.raises(ValueError):
+            library.for_each_input_work_item(fail)
+        library._close()
+
+        # Items reserved after the failed one are released as failed.
+        releases = library.adapter.adapter.releases
+        reserved = list(VALID_DATA)[: library.adapter.adapter.INDEX]
+        assert len(reserved) > 1
+        assert [release[0] for release in releases] == reserved[1:]
+        for _, state, exception in releases:
+            assert state is State.FAILED
+            assert exception["type"] == "APPLICATION"
+            assert exception["code"] == PrefetchAdapter.UNPROCESSED_CODE
+
+        with pytest.raises(RuntimeError):
+            library.get_input_work_item()
+
     def test_parse_work_item_from_raw_email(self, library, raw_email_data):
         raw_email, expected_body = raw_email_data
         library.adapter.DATA["workitem-id-first"]["rawEmail"] = raw_email
@@ -870,6 +1105,45 @@ class TestFileAdapter:
         assert adapter.inputs[0]["files"]["secondfile.txt"] == "secondfile2.txt"
         assert os.path.isfile(Path(adapter.input_path).parent / "secondfile2.txt")
 
+    def test_add_get_file_streamed(self, adapter):
+        item_id = adapter.reserve_input()
+        parent = Path(adapter.input_path).parent
+
+        with open(parent / "file.txt", "rb") as infile:
+            # The file is already in place, thus left untouched.
+            adapter.add_file(
+                item_id, "same-file", original_name="file.txt", content=infile
+            )
+        adapter.add_file(
+            item_id,
+            "streamed",
+            original_name="streamed.bin",
+            content=io.BytesIO(b"streamed data"),
+        )
+
+        outfile = io.BytesIO()
+        assert adapter.get_file(item_id, "same-file", fd=outfile) is None
+        assert outfile.getvalue() == b"some mock content"
+        assert (parent / "streamed.bin").read_bytes() == b"streamed data"
+
+    def test_get_file_same_path(self, adapter):
+        item_id = adapter.reserve_input()
+        parent = Path(adapter.input_path).parent
+        adapter.add_file(
+            item_id, "same.txt", original_name="same.txt", content=b"same data"
+        )
+
+        # Appending would duplicate the content, if copied onto itself.
+        with open(parent / "same.txt", "ab") as outfile:
+            assert adapter.get_file(item_id, "same.txt", fd=outfile) is None
+        assert (parent / "same.txt").read_bytes() == b"same data"
+
+        item = WorkItem(adapter, item_id=item_id)
+        item.load()
+        path = item.get_file("same.txt", parent / "same.txt")
+        assert Path(path).read_bytes() == b"same data"
+        assert not [p for p in os.listdir(parent) if p.startswith(".same.txt")]
+
     def test_save_data_input(self, adapter):
         item_id = adapter.reserve_input()
         adapter.save_payload(item_id, {"key": "value"})
@@ -894,6 +1168,74 @@ class TestFileAdapter:
             data = json.load(fd)
             assert data == [{"payload": {"key": "value"}, "files": {}}]
 
+    @pytest.fixture
+    def journal_adapter(self, monkeypatch):
+        monkeypatch.setenv("RPA_WORKITEMS_JOURNAL", "1")
+        monkeypatch.setattr(FileAdapter, "COMPACT_EVERY", 3)
+        with self._input_work_items() as (items_in, items_out):
+            monkeypatch.setenv("RPA_INPUT_WORKITEM_PATH", items_in)
+            monkeypatch.setenv("RPA_OUTPUT_WORKITEM_PATH", items_out)
+            adapter = FileAdapter()
+            yield adapter
+            adapter.close()
+
+    @staticmethod
+    def _read_json(path):
+        with open(path) as fd:
+            return json.load(fd)
+
+    def test_journal(self, journal_adapter):
+        adapter = journal_adapter
+        output_path = adapter.output_path
+        journal_path = output_path.with_name(output_path.name + ".journal")
+
+        # The first change writes the database, the next ones are journaled.
+        item_ids = [adapter.create_output("0", {"idx": idx}) for idx in range(3)]
+        adapter.save_payload(item_ids[0], {"idx": "changed"})
+        assert self._read_json(output_path) == [{"payload": {"idx": 0}, "files": {}}]
+        assert len(journal_path.read_text().splitlines()) == 3
+
+        # Compacted after every `COMPACT_EVERY` journaled changes.
+        adapter.save_payload(item_ids[1], {"idx": "changed"})
+        assert len(self._read_json(output_path)) == 3
+        assert not journal_path.exists()
+
+        adapter.save_payload(item_ids[2], {"idx": "changed"})
+        adapter.close()
+        assert self._read_json(output_path) == [
+            {"payload": {"idx": "changed"}, "files": {}} for _ in range(3)
+        ]
+        assert not journal_path.exists()
+
+    def test_journal_replay(self, journal_adapter):
+        adapter = journal_adapter
+        item_id = adapter.reserve_input()
+        adapter.save_payload(item_id, {"first": "change"})
+        adapter.save_payload(item_id, {"second": "change"})
+
+        # Not closed, like when interrupted, and loaded again from the journal.
+        reloaded = FileAdapter()
+        assert reloaded.load_payload(reloaded.reserve_input()) == {"second": "change"}
+        assert self._read_json(adapter.input_path)[0]["payload"] == {"first": "change"}
+
+        reloaded.close()
+        assert self._read_json(adapter.input_path)[0]["payload"] == {"second": "change"}
+
+    def test_json_lines_database(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as datadir:
+            items = Path(datadir) / "items.jsonl"
+            items.write_text('{"payload": {"a": 1}}\n\n{"payload": {"b": 2}}\n')
+            monkeypatch.setenv("RPA_INPUT_WORKITEM_PATH", str(items))
+
+            adapter = FileAdapter()
+            assert adapter.inputs == [{"payload": {"a": 1}}, {"payload": {"b": 2}}]
+            adapter.save_payload("1", {"b": 3})
+            lines = items.read_text().splitlines()
+            assert [json.loads(line) for line in lines] == [
+                {"payload": {"a": 1}},
+                {"payload": {"b": 3}},
+            ]
+
     def test_missing_file(self, monkeypatch):
         monkeypatch.setenv("RPA_WORKITEMS_PATH", "not-exist.json")
         adapter = FileAdapter()
@@ -960,12 +1302,14 @@ class TestRobocorpAdapter:
         for name, value in self.ENV.items():
             monkeypatch.setenv(name, value)
 
-        with mock.patch("RPA.Robocorp.utils.requests.get") as mock_get, mock.patch(
-            "RPA.Robocorp.utils.requests.post"
+        with mock.patch(
+            "RPA.Robocorp.utils.requests.Session.get"
+        ) as mock_get, mock.patch(
+            "RPA.Robocorp.utils.requests.Session.post"
         ) as mock_post, mock.patch(
-            "RPA.Robocorp.utils.requests.put"
+            "RPA.Robocorp.utils.requests.Session.put"
         ) as mock_put, mock.patch(
-            "RPA.Robocorp.utils.requests.delete"
+            "RPA.Robocorp.utils.requests.Session.delete"
         ) as mock_delete, mock.patch(
             "time.sleep", return_value=None
         ) as mock_sleep:
@@ -1064,6 +1408,42 @@ class TestRobocorpAdapter:
         files = adapter.list_files("4")
         assert files == expected_files
 
+    def test_file_id_cache(self, adapter):
+        item_id = "4"
+        self.mock_get.return_value.json.return_value = [
+            {"fileName": "a.txt", "fileId": "1"},
+            {"fileName": "b.txt", "fileId": "2"},
+        ]
+        adapter.list_files(item_id)
+
+        # Listed files are looked up without listing them again.
+        assert adapter.file_id(item_id, "a.txt") == "1"
+        adapter.remove_file(item_id, "b.txt")
+        assert self.mock_get.call_count == 1
+
+        # Removed or unknown files are looked up from a new listing.
+        self.mock_get.return_value.json.return_value = [
+            {"fileName": "a.txt", "fileId": "1"},
+            {"fileName": "c.txt", "fileId": "3"},
+        ]
+        with pytest.raises(FileNotFoundError):
+            adapter.file_id(item_id, "b.txt")
+        assert adapter.file_id(item_id, "c.txt") == "3"
+        assert self.mock_get.call_count == 2
+
+        # Metadata of released items is forgotten.
+        adapter.release_input(item_id, State.DONE)
+        assert item_id not in adapter._file_cache
+
+    def test_shared_session(self, adapter):
+        # Both APIs reuse the connections of the same pooled session
+        session = adapter._workitem_requests._session
+        assert session is adapter._process_requests._session
+
+        pool = create_session(pool_size=4).get_adapter("https://api.workitem.com")
+        assert pool._pool_maxsize == 4
+        assert pool.max_retries.total == 1
+
     @staticmethod
     def _failing_response(request):
         resp = mock.MagicMock()
@@ -1231,3 +1611,67 @@ class TestRobocorpAdapter:
             "secret-credentials" in record.message for record in caplog.records
         )
         assert not exposed, "secret got exposed"
+
+    def test_add_get_file_streamed(self, adapter, success_response):
+        item_id = adapter.reserve_input()
+        file_content = b"some-data" * 1000
+
+        success_response.status_code = 200
+        success_response.json.side_effect = [
+            {"url": "https://s3.amazonaws.com/bucket", "fields": {"key": "value"}},
+            [{"fileName": "myfile.txt", "fileId": "file-id"}],
+            {"url": "https://bucket.s3.amazonaws.com/files/file-id"},
+        ]
+        success_response.iter_content.return_value = [
+            file_content[:10],
+            file_content[10:],
+        ]
+        self.mock_post.return_value = self.mock_get.return_value = success_response
+
+        adapter.add_file(
+            item_id,
+            "myfile.txt",
+            original_name="not-used.txt",
+            content=io.BytesIO(file_content),
+        )
+        body = self.mock_post.call_args_list[0][1]["json"]
+        assert body == {"fileName": "myfile.txt", "fileSize": len(file_content)}
+        kwargs = self.mock_post.call_args_list[-1][1]
+        stream = kwargs["data"]
+        assert isinstance(stream, MultipartStream)
+        assert kwargs["headers"] == {"Content-Type": stream.content_type}
+        data = stream.read()
+        assert len(data) == len(stream)
+        assert b'name="key"\r\n\r\nvalue\r\n' in data
+        assert b'filename="myfile.txt"' in data
+        assert b"\r\n\r\n" + file_content + b"\r\n--" in data
+
+        outfile = io.BytesIO()
+        assert adapter.get_file(item_id, "myfile.txt", fd=outfile) is None
+        assert outfile.getvalue() == file_content
+        assert self.mock_get.call_args_list[-1][1]["stream"] is True
+
+    def test_multipart_stream(self):
+        content = io.BytesIO(b"skipped" + b"x" * 100)
+        content.seek(7)
+        stream = MultipartStream({"a": "1"}, "file", "name.txt", content)
+
+        # Same as encoded by `requests`, with the same boundary.
+        boundary = stream.content_type.split("boundary=")[1]
+        with mock.patch("urllib3.filepost.choose_boundary", return_value=boundary):
+            fields, content_type = RequestEncodingMixin._encode_files(
+                {"file": ("name.txt", b"x" * 100)}, {"a": "1"}
+            )
+        assert content_type == stream.content_type
+        chunks = []
+        while True:
+            chunk = stream.read(16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        assert b"".join(chunks) == fields
+        assert len(stream) == len(fields)
+
+        # Rewound when sent again.
+        stream.seek(0)
+        assert stream.read() == fields
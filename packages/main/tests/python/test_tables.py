@@ -2,10 +2,20 @@ import os
 import tempfile
 from collections import namedtuple, OrderedDict
 from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
 from pathlib import Path
 
 import pytest
-from RPA.Tables import Table, Tables, Dialect
+from RPA.Tables import (
+    ColumnTable,
+    Dialect,
+    Table,
+    Tables,
+    infer_type,
+    to_condition,
+    to_converter,
+)
 
 
 RESOURCES = Path(__file__).parent / ".." / "resources"
@@ -73,6 +83,12 @@ def table(request):
     return Table(data, columns)
 
 
+@pytest.fixture(params=DATA_FIXTURE)
+def column_table(request):
+    data, columns = DATA_FIXTURE[request.param]
+    return ColumnTable(data, columns)
+
+
 def test_table_repr(table):
     assert str(table) == "Table(columns=['one', 'two', 'three', 'four'], rows=6)"
 
@@ -211,6 +227,40 @@ def test_table_iterate_tuples_invalid():
         list(table.iter_tuples(with_index=False))
 
 
+def test_column_table_equals_table(table, column_table):
+    assert column_table == table
+    assert column_table.data == table.data
+    assert column_table.columns == table.columns
+    assert column_table.to_dict() == table.to_dict()
+    assert list(column_table.iter_dicts()) == list(table.iter_dicts())
+
+
+def test_column_table_column_operations(column_table):
+    column_table.append_column("five", values=[5, 6, 7, 8, 9, 10])
+    assert column_table.get_column("five", as_list=True) == [5, 6, 7, 8, 9, 10]
+
+    column_table.delete_columns(["one", "three"])
+    assert column_table.columns == ["two", "four", "five"]
+    assert column_table[2] == [2, 4, 7]
+
+    column_table.filter_by_column("five", lambda value: value % 2)
+    assert column_table.get_column("five", as_list=True) == [5, 7, 9]
+    assert column_table.dimensions == (3, 3)
+
+    column_table.append_row({"two": "x", "five": 11})
+    assert column_table[-1] == ["x", None, 11]
+
+
+def test_column_table_slice(column_table):
+    head = column_table.head(2)
+    assert isinstance(head, ColumnTable)
+    assert head.data == column_table.data[:2]
+
+    sliced = column_table.get_table([4, 1], ["four", "one"])
+    assert sliced.columns == ["four", "one"]
+    assert sliced.data == [[4, 1], [None, "a"]]
+
+
 @pytest.mark.parametrize(
     "data, columns", DATA_FIXTURE.values(), ids=DATA_FIXTURE.keys()
 )
@@ -219,6 +269,15 @@ def test_keyword_create_table(data, columns, library):
     assert len(table) == 6
 
 
+@pytest.mark.parametrize(
+    "data, columns", DATA_FIXTURE.values(), ids=DATA_FIXTURE.keys()
+)
+def test_keyword_create_table_columnar(data, columns, library):
+    table = library.create_table(data, columns=columns, columnar=True)
+    assert isinstance(table, ColumnTable)
+    assert table == Table(data, columns)
+
+
 def test_keyword_export_table_as_list(library, table):
     exported = library.export_table(table)
     assert exported == [
@@ -281,6 +340,52 @@ def test_merge_tables(library):
     assert merged.get_row(3) == {"Name": "Spider", "Price": None, "Stock": 1}
 
 
+def test_merge_tables_join_types(library):
+    prices = {"Name": ["Egg", "Cheese", "Ham"], "Price": [10.0, 15.0, 20.0]}
+    stock = {"Name": ["Egg", "Ham", "Spider"], "Stock": [12, 0, 1]}
+
+    merged = library.merge_tables(Table(prices), Table(stock), index="Name")
+    assert merged[None, "Name"] == ["Egg", "Cheese", "Ham", "Spider"]
+
+    merged = library.merge_tables(
+        Table(prices), Table(stock), index="Name", how="inner"
+    )
+    assert merged.data == [["Egg", 10.0, 12], ["Ham", 20.0, 0]]
+
+    merged = library.merge_tables(Table(prices), Table(stock), index="Name", how="left")
+    assert merged.data == [["Egg", 10.0, 12], ["Cheese", 15.0, None], ["Ham", 20.0, 0]]
+
+    with pytest.raises(ValueError):
+        library.merge_tables(Table(prices), Table(stock), index="Name", how="right")
+
+
+def test_merge_tables_multiple_keys(library):
+    prices = {"Name": ["Egg", "Egg", "Ham"], "Store": [1, 2, 1], "Price": [1, 2, 3]}
+    stock = {"Store": [2, 1, 2], "Name": ["Egg", "Ham", "Ham"], "Stock": [4, 5, 6]}
+
+    merged = library.merge_tables(Table(prices), Table(stock), index=["Name", "Store"])
+    assert merged.columns == ["Name", "Store", "Price", "Stock"]
+    assert merged.data == [
+        ["Egg", 1, 1, None],
+        ["Egg", 2, 2, 4],
+        ["Ham", 1, 3, 5],
+        ["Ham", 2, None, 6],
+    ]
+
+
+def test_merge_tables_duplicates(library):
+    prices = {"Name": ["Egg", "Ham", "Egg"], "Price": [1, 2, 3]}
+
+    merged = library.merge_tables(Table(prices), index="Name")
+    assert merged.data == [["Egg", 3], ["Ham", 2]]
+
+    merged = library.merge_tables(Table(prices), index="Name", duplicates="first")
+    assert merged.data == [["Egg", 1], ["Ham", 2]]
+
+    with pytest.raises(ValueError):
+        library.merge_tables(Table(prices), index="Name", duplicates="error")
+
+
 def test_keyword_get_table_dimensions(library, table):
     rows, columns = library.get_table_dimensions(table)
     assert rows == 6
@@ -387,6 +492,88 @@ def test_keyword_find_table_rows(library, table):
     assert len(matches) == 4
 
 
+def test_keyword_find_table_rows_conditions(library, table):
+    matches = library.find_table_rows(table, "one", "==", 1, "four", "==", 4)
+    assert matches.data == [[1, 2, None, 4], [1, 2, 3, 4]]
+
+    matches = library.find_table_rows(
+        table, "one", "==", "a", "four", "==", 4, match="any"
+    )
+    assert matches[None, "one"] == ["a", 1, 1]
+
+    with pytest.raises(ValueError):
+        library.find_table_rows(table, "one", "==", 1, "four", "==")
+
+
+def test_table_find_indexes(table, column_table):
+    conditions = [("two", lambda x: x == 2), ("three", lambda x: x is None)]
+    for obj in (table, column_table):
+        assert obj.find_indexes(conditions) == [2]
+        assert obj.find_indexes(conditions, match="any") == [0, 2, 3, 4, 5]
+        assert obj.find_indexes([]) == obj.index
+
+        with pytest.raises(ValueError):
+            obj.find_indexes(conditions, match="some")
+
+
+def test_table_index(table, column_table):
+    for obj in (table, column_table):
+        expected = obj.find_indexes([("one", to_condition("==", 1))])
+        obj.create_index("one")
+        assert obj.find_indexes([("one", to_condition("==", 1))]) == expected
+        assert obj.find_indexes([("one", to_condition("in", ["a", None]))]) == [
+            1,
+            3,
+            5,
+        ]
+
+        obj.set_cell(1, "one", 1)
+        obj.append_row({"one": 1})
+        assert obj.find_indexes([("one", to_condition("==", 1))]) == [0, 1, 2, 4, 6]
+
+        obj.delete_rows([0, 2])
+        assert obj.find_indexes([("one", to_condition("==", 1))]) == [0, 2, 4]
+
+        obj.set_column("one", [None, None, 1, None, 1])
+        assert obj.find_indexes([("one", to_condition("==", 1))]) == [2, 4]
+
+        obj.delete_columns("one")
+        assert obj.find_indexes([("two", to_condition("==", 2))]) == [2]
+
+
+def test_table_index_ordered():
+    table = Table({"id": [3, 1, None, 2, 5], "name": ["c", "a", "x", "b", "e"]})
+    table.create_index("id", ordered=True)
+    assert table.find_indexes([("id", to_condition(">=", 2))]) == [0, 3, 4]
+    assert table.find_indexes([("id", to_condition("<", 3))]) == [1, 3]
+
+    table.sort_by_column("id", ascending=True)
+    assert table.find_indexes([("id", to_condition(">", 2))]) == [3, 4]
+    assert table.find_indexes([("name", to_condition("==", "c"))]) == [3]
+
+
+def test_table_index_multiple_columns():
+    table = Table({"a": [1, 1, 2, 2], "b": ["x", "y", "x", "y"], "c": [1, 2, 3, 4]})
+    table.create_index(["a", "b"])
+    conditions = [("b", to_condition("==", "x")), ("a", to_condition("==", 2))]
+    assert table.find_indexes(conditions) == [2]
+
+    table.set_row(2, {"a": 2, "b": "y", "c": 5})
+    assert table.find_indexes(conditions) == []
+
+    with pytest.raises(ValueError):
+        Table({"a": [[1], [2]]}).create_index("a")
+
+
+def test_keyword_create_table_index(library, table):
+    expected = library.find_table_rows(table, "two", "==", 2)
+    library.create_table_index(table, "two")
+    assert library.find_table_rows(table, "two", "==", 2) == expected
+
+    library.add_table_row(table, [1, 2, 3, 4])
+    assert len(library.find_table_rows(table, "two", "==", 2)) == len(expected) + 1
+
+
 def test_keyword_set_row_as_column_names(library, table):
     assert table.columns == ["one", "two", "three", "four"]
     assert len(table) == 6
@@ -482,6 +669,17 @@ def test_keyword_filter_table_by_column_not_contains(library):
     assert table.data == [["Test", 2], ["Whatever", 3]]
 
 
+def test_keyword_filter_table_by_column_conditions(library):
+    table = Table({"type": ["a", "b", "c", "d"], "value": [1, 2, 3, 4]})
+    library.filter_table_by_column(
+        table, "type", "==", "a", "value", ">", 2, match="any"
+    )
+    assert table.data == [["a", 1], ["c", 3], ["d", 4]]
+
+    library.filter_table_by_column(table, "type", "!=", "a", "value", "<", 4)
+    assert table.data == [["c", 3]]
+
+
 def test_keyword_filter_empty_rows(library, table):
     library.filter_empty_rows(table)
     assert len(table) == 4
@@ -593,6 +791,140 @@ def test_keyword_read_table_from_csv_manual(library):
     ]
 
 
+def test_keyword_iterate_table_from_csv(library):
+    chunks = list(library.iterate_table_from_csv(RESOURCES / "hard.csv", 30))
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert chunks[0].columns[:2] == ["Region", "Country"]
+
+    table = library.read_table_from_csv(RESOURCES / "hard.csv")
+    assert chunks[0].data + chunks[1].data == table.data[:60]
+    assert chunks[-1][-1] == table[-1]
+
+
+def test_keyword_read_table_from_csv_closes_file(library, monkeypatch):
+    readers = []
+    iter_csv = library._iter_csv
+
+    def spy(*args, **kwargs):
+        readers.append(iter_csv(*args, **kwargs))
+        return readers[-1]
+
+    monkeypatch.setattr(library, "_iter_csv", spy)
+    library.read_table_from_csv(RESOURCES / "easy.csv")
+    # Finished generator has no frame, and no open file
+    assert readers[0].gi_frame is None
+
+
+def test_keyword_iterate_table_from_csv_extra(library):
+    chunks = library.iterate_table_from_csv(
+        RESOURCES / "extra.csv", chunk_size=2, column_unknown="whoknows"
+    )
+    first, second = list(chunks)
+    assert first.columns == ["first", "second", "third", "whoknows"]
+    assert first[1] == ["4", "5", "6", ["10"]]
+    assert second[1] == ["2", "2", None, None]
+
+
+def test_keyword_iterate_table_from_csv_invalid_size(library):
+    with pytest.raises(ValueError):
+        library.iterate_table_from_csv(RESOURCES / "easy.csv", chunk_size=0)
+
+
+def test_keyword_read_table_from_csv_select_columns(library):
+    table = library.read_table_from_csv(
+        RESOURCES / "easy.csv", columns=["third", "first"]
+    )
+    assert table.columns == ["third", "first"]
+    assert table[0] == ["3", "1"]
+
+
+def test_keyword_read_table_from_csv_dtypes(library):
+    table = library.read_table_from_csv(
+        RESOURCES / "hard.csv",
+        dtypes={"Units Sold": "int", "Unit Price": "decimal", "Total Cost": float},
+    )
+    assert table[0, "Units Sold"] == 9925
+    assert table[0, "Unit Price"] == Decimal("255.28")
+    assert table[0, "Total Cost"] == 1582243.5
+    assert table[0, "Order ID"] == "669165933"
+
+    with pytest.raises(ValueError):
+        library.read_table_from_csv(RESOURCES / "hard.csv", dtypes={"Country": "int"})
+
+
+def test_keyword_read_table_from_csv_infer_types(library):
+    table = library.read_table_from_csv(RESOURCES / "hard.csv", infer_types=True)
+    assert table[0] == [
+        "Australia and Oceania",
+        "Tuvalu",
+        "Baby Food",
+        "Offline",
+        "H",
+        "5/28/2010",
+        669165933,
+        "6/27/2010",
+        9925,
+        255.28,
+        159.42,
+        2533654.0,
+        1582243.5,
+        951410.5,
+    ]
+
+    table = library.read_table_from_csv(
+        RESOURCES / "easy.csv", header=False, infer_types=True, dtypes={"0": "str"}
+    )
+    assert table.get_column(0, as_list=True) == ["first", "1", "4", "7"]
+    assert table.get_column(1, as_list=True) == ["second", "2", "5", "8"]
+
+
+def test_keyword_read_table_from_csv_infer_types_named_only(library, tmp_path):
+    path = tmp_path / "extra.csv"
+    path.write_text("a,b\n1,nan\n2,inf,3\n")
+
+    table = library.read_table_from_csv(path, infer_types=True)
+    assert table.get_column("a", as_list=True) == [1, 2]
+    assert table.get_column("b", as_list=True) == ["nan", "inf"]
+    assert table.get_column("Unknown", as_list=True) == [None, ["3"]]
+
+
+def test_infer_type():
+    assert infer_type(["true", "False", ""]) == "bool"
+    assert infer_type(["1", "-2", None]) == "int"
+    assert infer_type(["1", "2.5"]) == "float"
+    assert infer_type(["2023-01-31", "2023-02-01"]) == "date"
+    assert infer_type(["2023-01-31T10:00:00"]) == "datetime"
+    assert infer_type(["1", "a"]) is None
+    assert infer_type([""]) is None
+    assert infer_type(["nan", "1.5", "-inf"]) == "float"
+    assert infer_type(["nan", "inf", "NaN"]) is None
+
+
+def test_to_converter():
+    assert to_converter("int")("5") == 5
+    assert to_converter("bool")("TRUE") is True
+    assert to_converter("date")("2023-01-31") == date(2023, 1, 31)
+    assert to_converter("float")("") is None
+    assert to_converter("int", strict=False)("abc") == "abc"
+
+    with pytest.raises(ValueError):
+        to_converter("int")("abc")
+    with pytest.raises(ValueError):
+        to_converter("complex")
+
+
+def test_keyword_write_table_to_csv_append(library, table):
+    with temppath() as path:
+        library.write_table_to_csv(table, path, append=True)
+        library.write_table_to_csv(table, path, append=True)
+        with open(path) as fd:
+            data = fd.readlines()
+
+    assert len(data) == 13
+    assert data[0] == "one,two,three,four\n"
+    assert data[7] == "1,2,3,\n"
+
+
 def test_keyword_write_table_to_csv(library, table):
     with temppath() as path:
         library.write_table_to_csv(table, path)
@@ -701,3 +1033,291 @@ def test_table_append_row():
     data = {"a": [1], "b": [2], "c": [3]}
     table = Table(data)
     table.append_row()
+
+
+def test_group_and_aggregate():
+    table = Table(
+        {
+            "customer": ["a", "b", "a", "c", "b", "a"],
+            "amount": [10, 5, None, 7, 1, 3],
+        }
+    )
+    result = table.group_and_aggregate(
+        "customer",
+        [
+            ("total", "amount", "sum"),
+            ("rows", None, "count"),
+            ("values", "amount", "count"),
+            ("low", "amount", "min"),
+            ("high", "amount", "max"),
+            ("mean", "amount", "mean"),
+            ("first", "amount", "first"),
+            ("last", "amount", "last"),
+            ("custom", "amount", lambda values: sorted(values)),
+        ],
+    )
+    assert result.columns == [
+        "customer",
+        "total",
+        "rows",
+        "values",
+        "low",
+        "high",
+        "mean",
+        "first",
+        "last",
+        "custom",
+    ]
+    assert result.data == [
+        ["a", 13, 3, 2, 3, 10, 6.5, 10, 3, [3, 10]],
+        ["b", 6, 2, 2, 1, 5, 3, 5, 1, [1, 5]],
+        ["c", 7, 1, 1, 7, 7, 7, 7, 7, [7]],
+    ]
+
+
+def test_group_and_aggregate_columnar(column_table):
+    aggregations = [("values", "two", "count"), ("last", "one", "last")]
+    expected = Table(column_table).group_and_aggregate(["three", "four"], aggregations)
+    result = column_table.group_and_aggregate(["three", "four"], aggregations)
+    assert isinstance(result, ColumnTable)
+    assert result.columns == ["three", "four", "values", "last"]
+    assert result.data == expected.data
+    assert result.data == [
+        [3, None, 1, 1],
+        ["c", None, 1, "a"],
+        [None, 4, 1, 1],
+        [None, None, 0, None],
+        [3, 4, 1, 1],
+    ]
+
+
+def test_group_and_aggregate_by_position():
+    table = Table({"customer": ["a", "b", "a"], "amount": [1, 2, 3]})
+    result = table.group_and_aggregate(0, [("total", 1, "sum")])
+    assert result.columns == ["customer", "total"]
+    assert result.data == [["a", 4], ["b", 2]]
+
+
+def test_group_and_aggregate_errors():
+    table = Table({"key": [[1], [2]], "value": [1, 2]})
+    with pytest.raises(ValueError, match="not hashable"):
+        table.group_and_aggregate("key", [("total", "value", "sum")])
+    with pytest.raises(ValueError, match="Unknown aggregate"):
+        table.group_and_aggregate("value", [("total", "value", "median")])
+
+
+def test_keyword_group_table_and_aggregate(library):
+    orders = library.create_table(
+        {
+            "customer": ["a", "b", "a", "b"],
+            "amount": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    result = library.group_table_and_aggregate(
+        orders, "customer", "sum:amount", "count", biggest="max: amount"
+    )
+    assert result.columns == ["customer", "amount_sum", "count", "biggest"]
+    assert result.data == [["a", 4.0, 2, 3.0], ["b", 6.0, 2, 4.0]]
+
+    result = library.group_table_and_aggregate(
+        orders,
+        ["customer"],
+        spread=(lambda values: max(values) - min(values), "amount"),
+    )
+    assert result.data == [["a", 2.0], ["b", 2.0]]
+
+    with pytest.raises(ValueError):
+        library.group_table_and_aggregate(orders, "customer")
+
+
+def test_sort_by_column_mixed_types():
+    values = ["bbb", 2, None, 1.5, "aaa", None, 3, b"x"]
+    table = Table({"value": values, "order": list(range(len(values)))})
+    table.sort_by_column("value", ascending=True)
+    assert table.get_column("value", as_list=True) == [
+        None,
+        None,
+        1.5,
+        2,
+        3,
+        b"x",
+        "aaa",
+        "bbb",
+    ]
+    assert table.get_column("order", as_list=True)[:2] == [2, 5]
+
+    table.sort_by_column("value", ascending=False)
+    assert table.get_column("value", as_list=True) == [
+        "bbb",
+        "aaa",
+        b"x",
+        3,
+        2,
+        1.5,
+        None,
+        None,
+    ]
+    assert table.get_column("order", as_list=True)[-2:] == [2, 5]
+
+
+def test_sort_by_column_nullable():
+    table = Table({"value": [3, None, 1, 2, None]})
+    table.sort_by_column("value", ascending=True)
+    assert table.get_column("value", as_list=True) == [None, None, 1, 2, 3]
+    table.sort_by_column("value", ascending=False)
+    assert table.get_column("value", as_list=True) == [3, 2, 1, None, None]
+
+
+@pytest.mark.parametrize("table_type", [Table, ColumnTable])
+def test_sort_by_column_multiple_orders(table_type):
+    table = table_type(
+        {
+            "customer": ["b", "a", "b", "a", "c"],
+            "date": [1, 2, 3, 1, 2],
+            "order": [0, 1, 2, 3, 4],
+        }
+    )
+    table.sort_by_column(["customer", "date"], ascending=[True, False])
+    assert table.get_column("order", as_list=True) == [1, 3, 2, 0, 4]
+
+    table.sort_by_column(["customer", "date"], ascending=True)
+    assert table.get_column("order", as_list=True) == [3, 1, 0, 2, 4]
+
+    with pytest.raises(ValueError):
+        table.sort_by_column(["customer", "date"], ascending=[True])
+
+
+@pytest.mark.parametrize("table_type", [Table, ColumnTable])
+def test_sort_by_column_limit(table_type):
+    data = {
+        "amount": [5, 1, None, 5, 3, 9, 1],
+        "customer": ["a", "b", "c", "d", "e", "f", "g"],
+    }
+    for ascending in (True, False):
+        for limit in (0, 1, 3, 7, 10):
+            expected = table_type(data)
+            expected.sort_by_column("amount", ascending=ascending)
+            table = table_type(data)
+            table.sort_by_column("amount", ascending=ascending, limit=limit)
+            assert table.data == expected.data[:limit]
+
+    table = table_type(data)
+    table.sort_by_column(["amount", "customer"], ascending=[False, True], limit=3)
+    assert table.get_column("customer", as_list=True) == ["f", "a", "d"]
+
+
+def test_keyword_sort_table_by_column_limit(library):
+    table = library.create_table({"amount": [4, 8, 1, 6], "id": [1, 2, 3, 4]})
+    library.sort_table_by_column(table, "amount", ascending=False, limit=2)
+    assert library.get_table_column(table, "id") == [2, 4]
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_keyword_map_column_values_callable(library, workers):
+    table = library.create_table({"value": list(range(100))})
+    library.map_column_values(
+        table, "value", lambda value, offset: value + offset, 5, workers=workers
+    )
+    assert library.get_table_column(table, "value") == list(range(5, 105))
+
+
+def test_keyword_map_column_values_chunks(library):
+    table = library.create_table({"value": list(range(10))})
+    library.map_column_values(table, "value", str, workers=3, chunk_size=4)
+    assert library.get_table_column(table, "value") == [str(i) for i in range(10)]
+
+    with pytest.raises(ValueError):
+        library.map_column_values(table, "value", str, workers=3, chunk_size=0)
+
+
+def test_keyword_map_column_values_process(library):
+    table = library.create_table({"value": [-1, 2, -3, 4]})
+    library.map_column_values(table, "value", abs, workers=2, pool="process")
+    assert library.get_table_column(table, "value") == [1, 2, 3, 4]
+
+
+def test_keyword_map_column_values_memoize(library):
+    calls = []
+
+    def lookup(value):
+        calls.append(value)
+        return value.upper()
+
+    table = library.create_table({"user": ["a", "b", "a", "c", "b", "a"]})
+    library.map_column_values(table, "user", lookup, workers=2, memoize=True)
+    assert library.get_table_column(table, "user") == ["A", "B", "A", "C", "B", "A"]
+    assert sorted(calls) == ["a", "b", "c"]
+
+    table = library.create_table({"user": [["a"], ["b"]]})
+    with pytest.raises(ValueError):
+        library.map_column_values(table, "user", len, memoize=True)
+
+
+def test_keyword_map_column_values_keyword_parallel(library, table):
+    with pytest.raises(ValueError):
+        library.map_column_values(table, "one", "Convert to integer", workers=2)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_keyword_map_table_rows(library, workers):
+    table = library.create_table({"price": [1.5, 2.0, 4.0], "amount": [2, 3, 1]})
+    library.map_table_rows(
+        table,
+        "total",
+        lambda row: row["price"] * row["amount"],
+        workers=workers,
+    )
+    assert library.get_table_column(table, "total") == [3.0, 6.0, 4.0]
+
+    library.map_table_rows(table, "total", lambda row, tax: row["total"] * tax, 2)
+    assert library.get_table_column(table, "total") == [6.0, 12.0, 8.0]
+
+
+@pytest.mark.parametrize("table_type", [Table, ColumnTable])
+def test_table_views_copy_on_write(table_type):
+    table = table_type({"a": [1, 2, 3, 4], "b": ["w", "x", "y", "z"]})
+    copied = table.get_table()
+    head = table.head(2)
+    tail = table.tail(2)
+    sliced = table.get_slice(1, 3)
+    projected = table.get_table(columns=["b"])
+
+    table.set_cell(0, "a", 10)
+    table.set_column("b", ["W", "X", "Y", "Z"])
+    assert copied.get_column("a", as_list=True) == [1, 2, 3, 4]
+    assert head.data == [[1, "w"], [2, "x"]]
+    assert projected.data == [["w"], ["x"], ["y"], ["z"]]
+
+    tail.set_cell(0, "a", 30)
+    tail.append_row({"a": 5, "b": "v"})
+    sliced.set_row(0, {"a": 20, "b": "q"})
+    sliced.append_column("c")
+    copied.delete_columns("b")
+    assert table.data == [[10, "W"], [2, "X"], [3, "Y"], [4, "Z"]]
+    assert tail.data == [[30, "y"], [4, "z"], [5, "v"]]
+    assert sliced.data == [[20, "q", None], [3, "y", None]]
+    assert copied.data == [[1], [2], [3], [4]]
+
+
+@pytest.mark.parametrize("table_type", [Table, ColumnTable])
+def test_keyword_copy_table_copies_values(library, table_type):
+    table = table_type({"a": [{"k": 1}, {"k": 2}]})
+    copied = library.copy_table(table)
+    copied[0, "a"]["k"] = 99
+    assert table[0, "a"] == {"k": 1}
+
+
+def test_table_copy_keeps_indexes():
+    table = Table({"a": [1, 2, 3]})
+    table.create_index("a")
+    copied = table.get_table()
+    copied.append_row({"a": 2})
+    assert copied.find_indexes([("a", to_condition("==", 2))]) == [1, 3]
+    assert table.find_indexes([("a", to_condition("==", 2))]) == [1]
+
+
+def test_table_get_table_renamed_columns():
+    table = Table({"a": [1, 2], "b": [3, 4]})
+    result = table.get_table(columns=[1, 0])
+    assert result.columns == [1, 0]
+    assert result.data == [[3, 1], [4, 2]]